@@ -1,7 +1,32 @@
 """PyPaperless."""
 
+from .circuit_breaker import CircuitBreakerPolicy, CircuitState
 from .client import PaperlessClient
+from .hedging import HedgePolicy
+from .http_cache import HttpCachePolicy
+from .page_size import AdaptivePageSize
+from .probe import ProbeMode, ProbePolicy
+from .rate_limit import RateLimit, RateLimitPolicy, RequestKind
+from .replicas import BalanceStrategy, ReplicaPolicy
+from .retry import RetryPolicy
 from .settings import PaperlessSettings
 from .transport import generate_api_token
 
-__all__ = ("PaperlessClient", "PaperlessSettings", "generate_api_token")
+__all__ = (
+    "AdaptivePageSize",
+    "BalanceStrategy",
+    "CircuitBreakerPolicy",
+    "CircuitState",
+    "HedgePolicy",
+    "HttpCachePolicy",
+    "PaperlessClient",
+    "PaperlessSettings",
+    "ProbeMode",
+    "ProbePolicy",
+    "RateLimit",
+    "RateLimitPolicy",
+    "ReplicaPolicy",
+    "RequestKind",
+    "RetryPolicy",
+    "generate_api_token",
+)
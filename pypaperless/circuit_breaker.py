@@ -0,0 +1,162 @@
+"""Provide the circuit breaker used by the HTTP transport."""
+
+import logging
+import time
+from collections import deque
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict, Field, PositiveFloat, PositiveInt
+
+from .exceptions import CircuitOpenError
+
+_LOGGER = logging.getLogger(__package__)
+
+
+class CircuitState(StrEnum):
+    """The state of a :class:`CircuitBreaker`."""
+
+    CLOSED = "closed"
+    """Requests are sent; outcomes are recorded."""
+
+    OPEN = "open"
+    """Requests fail fast with :exc:`~pypaperless.exceptions.CircuitOpenError`."""
+
+    HALF_OPEN = "half_open"
+    """A limited number of trial requests decides whether to close or reopen."""
+
+
+class CircuitBreakerPolicy(BaseModel):
+    """Configure when the circuit breaker of the transport opens and closes.
+
+    The breaker opens after *failure_threshold* consecutive failures, or when
+    at least *error_rate* of the last *window* requests failed.  Connection
+    errors, timeouts and responses with one of *failure_statuses* count as
+    failures.  While open, requests raise
+    :exc:`~pypaperless.exceptions.CircuitOpenError` immediately instead of
+    waiting for a timeout.  After *reset_timeout* seconds, up to
+    *half_open_probes* requests are let through as trials: if all of them
+    succeed the breaker closes, the first failure opens it again.
+
+    Example::
+
+        breaker = CircuitBreakerPolicy(failure_threshold=3, reset_timeout=10.0)
+        async with PaperlessClient("localhost:8000", "token", circuit_breaker=breaker) as paperless:
+            ...
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    failure_threshold: PositiveInt | None = 5
+    error_rate: float | None = Field(default=None, gt=0, le=1)
+    window: PositiveInt = 20
+    reset_timeout: PositiveFloat = 30.0
+    half_open_probes: PositiveInt = 1
+    failure_statuses: frozenset[int] = frozenset({502, 503, 504})
+
+
+class CircuitBreaker:
+    """Track request outcomes and decide whether requests may be sent."""
+
+    def __init__(self, policy: CircuitBreakerPolicy) -> None:
+        """Initialize a closed breaker for *policy*."""
+        self._policy = policy
+        self._state = CircuitState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=policy.window)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+
+    @property
+    def policy(self) -> CircuitBreakerPolicy:
+        """Return the :class:`CircuitBreakerPolicy` of this breaker."""
+        return self._policy
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state; an expired ``OPEN`` state reads as ``HALF_OPEN``."""
+        if self._state is CircuitState.OPEN and not self._retry_in():
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    def _retry_in(self) -> float:
+        """Return the seconds until an open breaker lets trial requests through."""
+        return max(0.0, self._opened_at + self._policy.reset_timeout - time.monotonic())
+
+    def before_request(self) -> bool:
+        """Admit a request, or raise :exc:`CircuitOpenError` if it must fail fast.
+
+        Return ``True`` if the admitted request is a half-open trial request.
+        """
+        if self._state is CircuitState.OPEN:
+            retry_in = self._retry_in()
+            if retry_in:
+                raise CircuitOpenError(retry_in)
+            self._state = CircuitState.HALF_OPEN
+            self._probes = self._probe_successes = 0
+            _LOGGER.info("Circuit breaker half-open, sending trial requests.")
+
+        if self._state is CircuitState.HALF_OPEN:
+            if self._probes >= self._policy.half_open_probes:
+                raise CircuitOpenError(0.0)
+            self._probes += 1
+            return True
+        return False
+
+    def release(self) -> None:
+        """Give back the slot of a trial request that ended without an outcome."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes -= 1
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        if self._state is CircuitState.OPEN:
+            return
+        if self._state is CircuitState.HALF_OPEN:
+            self._probe_successes += 1
+            if self._probe_successes >= self._policy.half_open_probes:
+                self._close()
+            return
+
+        self._consecutive_failures = 0
+        self._outcomes.append(True)
+
+    def record_failure(self) -> bool:
+        """Record a failed request; return ``True`` if this opened the breaker."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._open("a trial request failed")
+            return True
+        if self._state is CircuitState.OPEN:
+            return False
+
+        self._consecutive_failures += 1
+        self._outcomes.append(False)
+
+        threshold = self._policy.failure_threshold
+        if threshold is not None and self._consecutive_failures >= threshold:
+            self._open(f"{self._consecutive_failures} consecutive failures")
+            return True
+
+        rate = self._policy.error_rate
+        if rate is not None and len(self._outcomes) == self._policy.window:
+            failures = self._outcomes.count(False)
+            if failures / self._policy.window >= rate:
+                self._open(f"{failures} of the last {self._policy.window} requests failed")
+                return True
+        return False
+
+    def _open(self, reason: str) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        _LOGGER.warning(
+            "Circuit breaker opened (%s); failing fast for %.1fs.",
+            reason,
+            self._policy.reset_timeout,
+        )
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._consecutive_failures = 0
+        _LOGGER.info("Circuit breaker closed.")
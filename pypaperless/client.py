@@ -1,6 +1,7 @@
 """Provide the PaperlessClient class."""
 
 import logging
+from collections.abc import Sequence
 from functools import cached_property
 from typing import Self
 
@@ -8,9 +9,24 @@ import httpx
 
 from . import services
 from .cache import PaperlessCache
+from .circuit_breaker import CircuitBreakerPolicy, CircuitState
+from .const import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_MAX_URL_LENGTH,
+    DEFAULT_TIMEOUT,
+)
 from .dispatch import ModelDispatcher, dispatchable_cached_property
 from .exceptions import InitializationError
+from .hedging import HedgePolicy
+from .http_cache import HttpCachePolicy
+from .metrics import TransportMetrics
 from .models.base import DraftLike, PaperlessModel
+from .probe import ProbePolicy
+from .rate_limit import RateLimitPolicy
+from .replicas import ReplicaPolicy
+from .retry import RetryPolicy
 from .runtime import PaperlessRuntime
 from .settings import PaperlessSettings
 from .transport import PaperlessTransport
@@ -45,30 +61,123 @@ class PaperlessClient:
 
     def __init__(
         self,
-        url: str,
+        url: str | Sequence[str],
         token: str | None = None,
         *,
         client: httpx.AsyncClient | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        max_concurrency: int | None = None,
+        pool_timeout: float | None = DEFAULT_TIMEOUT,
+        retry: RetryPolicy | None = None,
+        http2: bool = False,
+        coalesce_requests: bool = False,
+        http_cache: HttpCachePolicy | None = None,
+        probe: ProbePolicy | None = None,
+        compression: Sequence[str] | None = None,
+        rate_limit: RateLimitPolicy | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        replicas: ReplicaPolicy | None = None,
+        uds: str | None = None,
+        max_url_length: int | None = DEFAULT_MAX_URL_LENGTH,
     ) -> None:
         """Initialize a :class:`PaperlessClient` instance.
 
         Args:
-            url:    A hostname, IP-address, or full URL string.
+            url:    A hostname, IP-address, or full URL string, or a sequence of
+                    them to balance requests across several replicas.
+                    ``unix:///path/to/socket`` connects to a Unix domain socket.
             token:  An API token from Paperless Django admin or via
                     :func:`~pypaperless.transport.generate_api_token`.
             client: A custom :class:`httpx.AsyncClient` to use for requests.
                     It is never closed by :meth:`close` — its lifecycle
                     belongs to the caller.
+            max_connections:           Connection pool size, ``None`` for no limit.
+                                       Ignored when *client* is given.
+            max_keepalive_connections: Idle keep-alive connections kept in the pool.
+                                       Ignored when *client* is given.
+            keepalive_expiry:          Seconds an idle connection is kept open.
+                                       Ignored when *client* is given.
+            max_concurrency:           Requests in flight at the same time across all
+                                       services, ``None`` (default) for no limit.
+            pool_timeout:              Seconds to wait for a free pool connection.
+                                       Ignored when *client* is given.
+            retry:                     A :class:`~pypaperless.retry.RetryPolicy` for
+                                       transient failures, ``None`` (default) to disable.
+            http2:                     Negotiate HTTP/2 to multiplex concurrent requests
+                                       over one connection.  Requires the ``http2``
+                                       extra, falls back to HTTP/1.1 without it.
+                                       Ignored when *client* is given.
+            coalesce_requests:         Let concurrent identical ``GET`` requests share
+                                       one round trip.  Every caller still gets its own
+                                       model instance.
+            http_cache:                A :class:`~pypaperless.http_cache.HttpCachePolicy`
+                                       to revalidate ``GET`` responses with ETags
+                                       instead of downloading them again, ``None``
+                                       (default) to disable.
+            probe:                     A :class:`~pypaperless.probe.ProbePolicy` choosing
+                                       how :meth:`initialize` probes the host and
+                                       whether the result is cached on disk.
+            compression:               Response encodings to accept, e.g. ``["gzip"]``.
+                                       ``None`` (default) accepts every encoding whose
+                                       decoder is installed (``zstd``, ``br``, ``gzip``,
+                                       ``deflate``), ``[]`` disables compression.
+            rate_limit:                A :class:`~pypaperless.rate_limit.RateLimitPolicy`
+                                       with separate budgets for listings, single items,
+                                       downloads and writes, ``None`` (default) for no
+                                       limit.
+            circuit_breaker:           A :class:`~pypaperless.circuit_breaker.CircuitBreakerPolicy`
+                                       to fail fast with
+                                       :exc:`~pypaperless.exceptions.CircuitOpenError`
+                                       while Paperless is unavailable, ``None`` (default)
+                                       to disable.
+            hedge:                     A :class:`~pypaperless.hedging.HedgePolicy` to send
+                                       a second, identical ``GET`` request when the first
+                                       one is slow, ``None`` (default) to disable.
+            replicas:                  A :class:`~pypaperless.replicas.ReplicaPolicy` choosing
+                                       how requests are spread when *url* lists several
+                                       replicas.
+            uds:                       Path of a Unix domain socket to connect to instead
+                                       of TCP, e.g. a co-located gunicorn.  *url* then
+                                       only supplies the ``Host`` header and path prefix.
+                                       Ignored when *client* is given.
+            max_url_length:            Longest request URL that listings may build
+                                       (default 4000).  Longer ``__in``, ``__all`` and
+                                       ``__none`` filters are split into several
+                                       queries, ``None`` sends them as they are.
 
         Example::
 
-            paperless = PaperlessClient("localhost:8000", "your-token")
+            paperless = PaperlessClient("localhost:8000", "your-token", max_concurrency=16)
             await paperless.initialize()
             doc = await paperless.documents(42)
             await paperless.close()
 
         """
-        transport = PaperlessTransport(url, token, client)
+        transport = PaperlessTransport(
+            url,
+            token,
+            client,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            max_concurrency=max_concurrency,
+            pool_timeout=pool_timeout,
+            retry=retry,
+            http2=http2,
+            coalesce_requests=coalesce_requests,
+            http_cache=http_cache,
+            probe=probe,
+            compression=compression,
+            rate_limit=rate_limit,
+            circuit_breaker=circuit_breaker,
+            hedge=hedge,
+            replicas=replicas,
+            uds=uds,
+            max_url_length=max_url_length,
+        )
         cache = PaperlessCache()
 
         self._runtime = PaperlessRuntime(transport, cache)
@@ -104,6 +213,23 @@ class PaperlessClient:
             config.url,
             config.token.get_secret_value() if config.token else None,
             client=client,
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+            max_concurrency=config.max_concurrency,
+            pool_timeout=config.pool_timeout,
+            retry=config.retry,
+            http2=config.http2,
+            coalesce_requests=config.coalesce_requests,
+            http_cache=config.http_cache,
+            probe=config.probe,
+            compression=config.compression,
+            rate_limit=config.rate_limit,
+            circuit_breaker=config.circuit_breaker,
+            hedge=config.hedge,
+            replicas=config.replicas,
+            uds=config.uds,
+            max_url_length=config.max_url_length,
         )
 
     @classmethod
@@ -114,7 +240,8 @@ class PaperlessClient:
     ) -> "PaperlessClient":
         """Create a :class:`PaperlessClient` from environment variables.
 
-        Reads ``PYPAPERLESS_URL`` and ``PYPAPERLESS_TOKEN`` from the environment.
+        Reads ``PYPAPERLESS_URL``, ``PYPAPERLESS_TOKEN`` and the optional
+        connection settings of :class:`.PaperlessSettings` from the environment.
 
         Args:
             client: A custom :class:`httpx.AsyncClient` to use for requests.
@@ -139,6 +266,12 @@ class PaperlessClient:
         """Return ``True`` if the connection has been initialized."""
         return self._initialized
 
+    @property
+    def circuit_state(self) -> CircuitState | None:
+        """Return the state of the circuit breaker, or ``None`` if it is disabled."""
+        breaker = self._runtime.transport.circuit_breaker
+        return breaker.state if breaker else None
+
     @property
     def host_api_version(self) -> int:
         """Return the API version reported by the Paperless host."""
@@ -149,6 +282,11 @@ class PaperlessClient:
         """Return the application version reported by the Paperless host."""
         return self._version
 
+    @property
+    def metrics(self) -> TransportMetrics:
+        """Return the :class:`~pypaperless.metrics.TransportMetrics` of the transport."""
+        return self._runtime.transport.metrics
+
     @property
     def runtime(self) -> PaperlessRuntime:
         """Return the :class:`~pypaperless.runtime.PaperlessRuntime` shared with services."""
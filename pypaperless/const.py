@@ -9,6 +9,27 @@ ENV_PREFIX = "PYPAPERLESS_"
 ENV_URL = f"{ENV_PREFIX}URL"
 ENV_TOKEN = f"{ENV_PREFIX}TOKEN"
 
+# connection pool defaults, mirroring the httpx defaults
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+DEFAULT_TIMEOUT = 5.0
+
+# request URLs are kept below gunicorn's default limit of 4094 bytes per request line
+DEFAULT_MAX_URL_LENGTH = 4000
+
+# base URLs like unix:///run/paperless.sock address a Unix domain socket
+UNIX_SOCKET_SCHEME = "unix://"
+UNIX_SOCKET_BASE_URL = "http://localhost"
+
+# response content encodings in order of preference, and the modules decoding them
+CONTENT_ENCODINGS: dict[str, tuple[str, ...]] = {
+    "zstd": ("zstandard",),
+    "br": ("brotli", "brotlicffi"),
+    "gzip": (),
+    "deflate": (),
+}
+
 
 class EndpointPath(StrEnum):
     """URL paths for all Paperless-ngx REST API endpoints.
@@ -21,6 +42,7 @@ class EndpointPath(StrEnum):
 
     """
 
+    API_ROOT = "/api/"
     INDEX = "/api/schema/"
     TOKEN = "/api/token/"
 
@@ -29,6 +29,19 @@ class PaperlessTimeoutError(PaperlessConnectionError):
     """
 
 
+class CircuitOpenError(PaperlessConnectionError):
+    """Raised without sending the request while the circuit breaker is open.
+
+    Paperless failed repeatedly in the recent past; ``retry_in`` holds the
+    seconds until the breaker lets trial requests through again.
+    """
+
+    def __init__(self, retry_in: float) -> None:
+        """Initialize a `CircuitOpenError` instance."""
+        self.retry_in = retry_in
+        super().__init__(f"Circuit breaker is open, request not sent. Retry in {retry_in:.1f}s.")
+
+
 class AuthError(InitializationError):
     """Raised when response is 401 code."""
 
@@ -0,0 +1,112 @@
+"""Provide the conditional GET cache used by the HTTP transport."""
+
+from collections import OrderedDict
+from typing import NamedTuple
+
+import httpx
+from pydantic import BaseModel, ConfigDict, PositiveInt
+
+type CacheKey = tuple[str, tuple[tuple[str, str], ...], str | None]
+
+
+class HttpCachePolicy(BaseModel):
+    """Configure the conditional GET cache of the transport.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` header are stored
+    together with their body.  The next ``GET`` of the same URL, query
+    parameters and token is sent with ``If-None-Match`` / ``If-Modified-Since``;
+    when Paperless answers ``304 Not Modified`` the stored body is parsed
+    instead of downloading it again.  Every request still reaches the server,
+    so the cache never serves stale data.
+
+    The cache is bounded by *max_entries* and *max_bytes* (the sum of the
+    stored bodies); the least recently used entries are evicted first.
+    Bodies larger than *max_bytes* are not stored at all.
+
+    Example::
+
+        cache = HttpCachePolicy(max_entries=64, max_bytes=4 * 1024 * 1024)
+        async with PaperlessClient("localhost:8000", "token", http_cache=cache) as paperless:
+            stats = await paperless.statistics()
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_entries: PositiveInt = 256
+    max_bytes: PositiveInt = 16 * 1024 * 1024
+
+
+class CacheEntry(NamedTuple):
+    """A stored response body and its validators."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+
+    @classmethod
+    def from_response(cls, res: httpx.Response) -> "CacheEntry | None":
+        """Return an entry for *res*, or ``None`` if it carries no validators."""
+        etag = res.headers.get("etag")
+        last_modified = res.headers.get("last-modified")
+        if etag is None and last_modified is None:
+            return None
+        return cls(body=res.content, etag=etag, last_modified=last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the request headers that revalidate this entry."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """Least recently used store of :class:`CacheEntry` objects."""
+
+    def __init__(self, policy: HttpCachePolicy) -> None:
+        """Initialize an empty cache bounded by *policy*."""
+        self._policy = policy
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Return the number of stored body bytes."""
+        return self._size
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        """Return the entry stored for *key* and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: CacheKey, entry: CacheEntry) -> None:
+        """Store *entry* for *key*, evicting the least recently used entries if needed."""
+        self.discard(key)
+        if len(entry.body) > self._policy.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self._size += len(entry.body)
+        while len(self._entries) > self._policy.max_entries or self._size > self._policy.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.body)
+
+    def discard(self, key: CacheKey) -> None:
+        """Remove the entry stored for *key*, if any."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.body)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._size = 0
@@ -0,0 +1,98 @@
+"""Provide the TransportMetrics class."""
+
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# decoded body sizes of the responses received in the current context, if tallied
+_RESPONSE_BYTES: ContextVar[list[int] | None] = ContextVar("_RESPONSE_BYTES", default=None)
+
+# durations of the HTTP exchanges completed in the current context, if tallied
+_RESPONSE_SECONDS: ContextVar[list[float] | None] = ContextVar("_RESPONSE_SECONDS", default=None)
+
+
+@contextmanager
+def tally_response_bytes() -> Iterator[list[int]]:
+    """Collect the decoded body size of every response received within the context.
+
+    The tally is context-local: requests of other asyncio tasks are not counted.
+    """
+    tally: list[int] = []
+    token = _RESPONSE_BYTES.set(tally)
+    try:
+        yield tally
+    finally:
+        _RESPONSE_BYTES.reset(token)
+
+
+def record_response_bytes(decoded: int) -> None:
+    """Add *decoded* bytes to the tally of the current context, if there is one."""
+    tally = _RESPONSE_BYTES.get()
+    if tally is not None:
+        tally.append(decoded)
+
+
+@contextmanager
+def tally_response_seconds() -> Iterator[list[float]]:
+    """Collect the duration of every HTTP exchange completed within the context.
+
+    Each duration runs from sending the request to the end of its response
+    body, so waiting for the rate limit, a concurrency slot or a retry is
+    left out.  Like :func:`tally_response_bytes`, the tally is context-local.
+    """
+    tally: list[float] = []
+    token = _RESPONSE_SECONDS.set(tally)
+    try:
+        yield tally
+    finally:
+        _RESPONSE_SECONDS.reset(token)
+
+
+def record_response_seconds(seconds: float) -> None:
+    """Add an exchange of *seconds* to the tally of the current context, if there is one."""
+    tally = _RESPONSE_SECONDS.get()
+    if tally is not None:
+        tally.append(seconds)
+
+
+class TransportMetrics:
+    """Running counters of the HTTP transport.
+
+    Held by :class:`~pypaperless.transport.PaperlessTransport` and accessible
+    via :attr:`~pypaperless.client.PaperlessClient.metrics`.  The counters are
+    plain attributes; call :meth:`reset` to start a new measurement window.
+
+    Example::
+
+        async with PaperlessClient("localhost:8000", "token", retry=RetryPolicy()) as paperless:
+            await paperless.documents.as_list()
+            print(paperless.metrics.requests, paperless.metrics.retries)
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters with zero."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        self.requests = 0
+        self.coalesced = 0
+        self.retries = 0
+        self.retries_exhausted = 0
+        self.retry_reasons: Counter[str] = Counter()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_revalidations = 0
+        self.cache_bytes_saved = 0
+        self.bytes_received = 0
+        self.bytes_decoded = 0
+        self.rate_limit_waits: Counter[str] = Counter()
+        self.rate_limit_wait_seconds: defaultdict[str, float] = defaultdict(float)
+        self.circuit_opened = 0
+        self.circuit_rejected = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.replica_requests: Counter[str] = Counter()
+        self.replica_ejections: Counter[str] = Counter()
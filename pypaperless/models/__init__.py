@@ -1,6 +1,6 @@
 """PyPaperless models."""
 
-from pypaperless.pagination import Page
+from pypaperless.pagination import Page, PageCheckpoint, ScanProgress
 
 from .config import Config
 from .correspondents import Correspondent, CorrespondentDraft
@@ -62,11 +62,13 @@ __all__ = (
     "MailAccount",
     "MailRule",
     "Page",
+    "PageCheckpoint",
     "ProcessedMail",
     "Profile",
     "ProfileSocialAccount",
     "RemoteVersion",
     "SavedView",
+    "ScanProgress",
     "SearchResult",
     "ShareLink",
     "ShareLinkBundle",
@@ -71,6 +71,7 @@ class PaperlessModel(_PaperlessBase):
     _snapshot_source: ClassVar[dict[str, Any] | None] = None
 
     _snapshot_cache: dict[str, Any] | None = PrivateAttr(default=None)
+    _partial: bool = PrivateAttr(default=False)
 
     def model_post_init(self, __context: Any, /) -> None:
         """Bind `_runtime` from validation context and resolve the instance API path."""
@@ -78,6 +79,8 @@ class PaperlessModel(_PaperlessBase):
         pk = getattr(self, self._pk_field, None)
         if pk is not None:
             object.__setattr__(self, "_api_path", self._api_path.format(pk=pk))
+        if isinstance(__context, dict):
+            self._partial = __context.get("partial", False)
         if not (isinstance(__context, dict) and "runtime" in __context):
             # direct construction without an API payload - freeze the state now,
             # since there is no raw source to derive the snapshot from later
@@ -109,15 +112,18 @@ class PaperlessModel(_PaperlessBase):
         cls,
         runtime: "PaperlessRuntime",
         data: dict[str, Any],
+        *,
+        partial: bool = False,
         **_context: Any,
     ) -> Self:
         """Return a new instance of `cls` from `data`.
 
         Primarily used by service-level factory methods. The raw payload is
         kept as the snapshot source for lazy change tracking - it must not be
-        mutated afterwards.
+        mutated afterwards.  Pass *partial* for payloads requested with a field
+        projection or truncated content.
         """
-        instance = cls.model_validate(data, context={"runtime": runtime})
+        instance = cls.model_validate(data, context={"runtime": runtime, "partial": partial})
         object.__setattr__(instance, "_snapshot_source", data)
         return instance
 
@@ -126,6 +132,24 @@ class PaperlessModel(_PaperlessBase):
         """Return the API path for this model instance."""
         return self._api_path
 
+    @property
+    def fetched_fields(self) -> frozenset[str] | None:
+        """Return the API field names of a partial model, ``None`` for complete ones.
+
+        Models requested with ``fields=`` or ``truncate_content=True`` only hold
+        the fields listed here.  All others keep their defaults, and ``update()``
+        only sends them once they are assigned.
+
+        Example::
+
+            document = await paperless.documents(42, fields=["id", "title"])
+            print(document.fetched_fields)  # frozenset({'id', 'title'})
+
+        """
+        if not self._partial:
+            return None
+        return frozenset(self._snapshot_source or ())
+
     @property
     def snapshot(self) -> dict[str, Any]:
         """Return the serialized field state as of the last API sync.
@@ -150,6 +174,7 @@ class PaperlessModel(_PaperlessBase):
             setattr(self, name, getattr(fresh, name))
         object.__setattr__(self, "_snapshot_source", data)
         self._snapshot_cache = None
+        self._partial = False
 
 
 class IdentifiedModel(PaperlessModel):
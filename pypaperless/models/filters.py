@@ -16,14 +16,70 @@ Usage::
 
 All fields are optional (``total=False``).  Pagination parameters (``page``,
 ``page_size``) are intentionally excluded — pass them directly as kwargs.
+
+``ordering`` takes a field name, prefixed with ``-`` to sort descending, or a
+list of them to break ties::
+
+    async with paperless.documents.filter(ordering=["-modified", "title"]) as docs:
+        ...
 """
 
-from typing import TypedDict
+from typing import Literal, TypedDict
 
 from pypaperless.builders import CustomFieldQuery, SearchQuery
 from pypaperless.models.share_links import ShareLinkBundleStatus
 from pypaperless.models.tasks import TaskStatus, TaskTriggerSource, TaskType
 
+# The following orderings are based on the ``ordering_fields`` of the viewsets in:
+# https://github.com/paperless-ngx/paperless-ngx/blob/dev/src/documents/views.py
+
+type DocumentOrdering = Literal[
+    "id",
+    "-id",
+    "title",
+    "-title",
+    "correspondent__name",
+    "-correspondent__name",
+    "document_type__name",
+    "-document_type__name",
+    "storage_path__name",
+    "-storage_path__name",
+    "created",
+    "-created",
+    "modified",
+    "-modified",
+    "added",
+    "-added",
+    "archive_serial_number",
+    "-archive_serial_number",
+    "num_notes",
+    "-num_notes",
+    "owner",
+    "-owner",
+    "page_count",
+    "-page_count",
+]
+
+# the classifier viewsets do not list ``id``; DRF drops such fields and keeps the name order
+type ClassifierOrdering = Literal[
+    "name",
+    "-name",
+    "match",
+    "-match",
+    "matching_algorithm",
+    "-matching_algorithm",
+    "document_count",
+    "-document_count",
+]
+
+type CorrespondentOrdering = (
+    ClassifierOrdering | Literal["last_correspondence", "-last_correspondence"]
+)
+
+type StoragePathOrdering = ClassifierOrdering | Literal["path", "-path"]
+
+type TagOrdering = ClassifierOrdering | Literal["color", "-color"]
+
 
 class _CreatedFilters(TypedDict, total=False):
     """Common created-date filter fields."""
@@ -76,6 +132,8 @@ class _NameFilters(_IdFilters, total=False):
 class CorrespondentFilters(_NameFilters, total=False):
     """Filters for :attr:`Paperless.correspondents`."""
 
+    ordering: CorrespondentOrdering | list[CorrespondentOrdering]
+
 
 class CustomFieldFilters(_NameFilters, total=False):
     """Filters for :attr:`Paperless.custom_fields`."""
@@ -133,6 +191,7 @@ class DocumentFilters(_IdFilters, _CreatedFilters, total=False):
     document_type__name__iendswith: str
     document_type__name__iexact: str
     document_type__name__istartswith: str
+    fields: list[str] | str  # projection, not a filter: only these fields per document
     has_custom_fields: bool
     is_in_inbox: bool  # True → document has an inbox tag
     is_tagged: bool  # True → document has at least one tag
@@ -153,6 +212,7 @@ class DocumentFilters(_IdFilters, _CreatedFilters, total=False):
     original_filename__iendswith: str
     original_filename__iexact: str
     original_filename__istartswith: str
+    ordering: DocumentOrdering | list[DocumentOrdering]
     owner__id: int
     owner__id__in: str
     owner__id__none: str
@@ -183,11 +243,14 @@ class DocumentFilters(_IdFilters, _CreatedFilters, total=False):
     title__istartswith: str
     title_content: str  # searches title AND content simultaneously
     title_search: str
+    truncate_content: bool  # shortened content, not a filter
 
 
 class DocumentTypeFilters(_NameFilters, total=False):
     """Filters for :attr:`Paperless.document_types`."""
 
+    ordering: ClassifierOrdering | list[ClassifierOrdering]
+
 
 class GroupFilters(_NameFilters, total=False):
     """Filters for :attr:`Paperless.groups`."""
@@ -207,6 +270,7 @@ class ShareLinkBundleFilters(_CreatedFilters, _ExpirationFilters, total=False):
 class StoragePathFilters(_NameFilters, total=False):
     """Filters for :attr:`Paperless.storage_paths`."""
 
+    ordering: StoragePathOrdering | list[StoragePathOrdering]
     path__icontains: str
     path__iendswith: str
     path__iexact: str
@@ -217,6 +281,7 @@ class TagFilters(_NameFilters, total=False):
     """Filters for :attr:`Paperless.tags`."""
 
     is_root: bool
+    ordering: TagOrdering | list[TagOrdering]
 
 
 class TaskFilters(TypedDict, total=False):
@@ -0,0 +1,65 @@
+"""Provide adaptive page sizing for paginated listings."""
+
+from pydantic import BaseModel, ConfigDict, PositiveFloat, PositiveInt, model_validator
+
+
+class AdaptivePageSize(BaseModel):
+    """Configure how paginated listings adapt their page size between requests.
+
+    Page sizes are *min_page_size* times a power of two, up to *max_page_size*.
+    The scan starts with the largest of them not above the ``page_size`` hint.
+    A page slower than *target_seconds* or larger than *target_bytes* halves
+    the size of the next request; a page below half of both targets doubles
+    it.  A page that times out is requested again at half its size.
+
+    Because every size is a multiple of the smaller ones, the item offset of
+    the scan always falls on a page boundary of the new size; growing is
+    deferred by one page when it does not.
+
+    Example::
+
+        async for page in paperless.documents.pages(adaptive=AdaptivePageSize()):
+            ...
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    min_page_size: PositiveInt = 25
+    max_page_size: PositiveInt = 1000
+    target_seconds: PositiveFloat = 1.0
+    target_bytes: PositiveInt = 2 * 1024 * 1024
+
+    @model_validator(mode="after")
+    def _check_bounds(self) -> "AdaptivePageSize":
+        if self.max_page_size < self.min_page_size:
+            msg = "max_page_size must not be smaller than min_page_size."
+            raise ValueError(msg)
+        return self
+
+    def start(self, hint: int) -> int:
+        """Return the page size to start with for the *hint*."""
+        size = self.min_page_size
+        while size * 2 <= min(hint, self.max_page_size):
+            size *= 2
+        return size
+
+    def shrink(self, size: int) -> int | None:
+        """Return half of *size*, or ``None`` if that is below the minimum."""
+        half = size // 2
+        return half if half >= self.min_page_size else None
+
+    def next_size(self, size: int, offset: int, seconds: float, nbytes: int) -> int:
+        """Return the size for the page at *offset* after one of *size* took *seconds*."""
+        if seconds > self.target_seconds or nbytes > self.target_bytes:
+            return self.shrink(size) or size
+
+        double = size * 2
+        if (
+            seconds < self.target_seconds / 2
+            and nbytes < self.target_bytes / 2
+            and double <= self.max_page_size
+            and offset % double == 0
+        ):
+            return double
+        return size
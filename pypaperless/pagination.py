@@ -1,18 +1,35 @@
 """Provide pagination primitives: Page and PageGenerator."""
 
 import asyncio
+import logging
 import math
-from collections.abc import AsyncIterator, Iterator
-from typing import TYPE_CHECKING, Any
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, Self, overload
+from urllib.parse import quote
 
-from pydantic import Field, PrivateAttr
+import httpx
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeInt, PrivateAttr, SkipValidation
 
+from pypaperless.exceptions import PaperlessTimeoutError
+from pypaperless.metrics import tally_response_bytes, tally_response_seconds
 from pypaperless.models.base import _PaperlessBase
+from pypaperless.page_size import AdaptivePageSize
+from pypaperless.rate_limit import RequestKind
 
 if TYPE_CHECKING:
     from pypaperless.models.base import PaperlessModel
     from pypaperless.runtime import PaperlessRuntime
 
+_LOGGER = logging.getLogger(__package__)
+
+# filters taking comma-separated values; __in matches any value, __all and __none all of them
+_LIST_FILTER_SUFFIXES = ("__in", "__all", "__none")
+
+# URL budget left for the params added per request, like page, page_size and ordering
+_URL_RESERVE = 64
+
 
 def _mark_exception_retrieved(task: "asyncio.Task[Any]") -> None:
     """Consume a finished task's exception so abandoned prefetches never warn."""
@@ -20,17 +37,126 @@ def _mark_exception_retrieved(task: "asyncio.Task[Any]") -> None:
         task.exception()
 
 
+class PageCheckpoint(BaseModel):
+    """Serializable position of a page scan, to resume it later.
+
+    Returned by :meth:`PageGenerator.checkpoint` and accepted by
+    :meth:`~pypaperless.services.mixins.iterable.IterableService.resume`.
+    Persist it with ``model_dump_json()`` and load it with
+    ``PageCheckpoint.model_validate_json()``.
+
+    Attributes:
+        path:      The API path of the listing.
+        params:    The query params of the scan - filters, ordering and page
+                   size - without the page number.
+        offset:    Items of the listing consumed so far.
+        last_id:   Id of the last item consumed, if any.
+        watermark: Highest id of the pinned snapshot; items added later are
+                   left out on resume.  ``None`` if no snapshot was pinned.
+        count:     Total number of items as of the last page, an estimate.
+        partial:   The params request a field projection or truncated content.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    path: str
+    params: dict[str, Any]
+    offset: NonNegativeInt = 0
+    last_id: int | None = None
+    watermark: int | None = None
+    count: NonNegativeInt | None = None
+    partial: bool = False
+
+    @property
+    def finished(self) -> bool:
+        """Return whether the scan had consumed every item."""
+        return self.count is not None and self.offset >= self.count
+
+
+class ScanProgress(NamedTuple):
+    """Progress of a page scan, see :attr:`PageGenerator.progress`.
+
+    *rate* is the throughput in items per second since the iteration started,
+    and *eta* the seconds left at that rate; both are ``None`` until known.
+    """
+
+    done: int
+    total: int | None
+    rate: float | None
+    eta: float | None
+
+
+class LazyItems[ResourceT: "PaperlessModel"](Sequence[ResourceT]):
+    """Read-only sequence of the items of a :class:`Page`.
+
+    Every item is built from its raw result dict on first access and cached,
+    so items that are never touched are never validated, and touching an
+    item twice validates it once.  Compares equal to a list of the same items.
+    """
+
+    __slots__ = ("_build", "_cache", "_results")
+
+    # mutable like the list it stands in for
+    __hash__: ClassVar[None] = None  # type: ignore[assignment]
+
+    def __init__(
+        self, results: list[dict[str, Any]], build: Callable[[dict[str, Any]], ResourceT]
+    ) -> None:
+        """Initialize a :class:`LazyItems` instance."""
+        self._results = results
+        self._build = build
+        self._cache: list[ResourceT | None] = [None] * len(results)
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._results)
+
+    @overload
+    def __getitem__(self, index: int) -> ResourceT: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ResourceT]: ...
+
+    def __getitem__(self, index: int | slice) -> ResourceT | list[ResourceT]:
+        """Return the item at *index*, or a list of the items in a slice."""
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        item = self._cache[index]
+        if item is None:
+            item = self._cache[index] = self._build(self._results[index])
+        return item
+
+    def __iter__(self) -> Iterator[ResourceT]:
+        """Return an iterator building the items one by one."""
+        return (self[position] for position in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the items like a list."""
+        if isinstance(other, Sequence) and not isinstance(other, str | bytes):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return the items like a list."""
+        return repr(list(self))
+
+
 class Page[ResourceT: "PaperlessModel"](_PaperlessBase):
     """Represent a single paginated response page from the Paperless API."""
 
     _resource_cls: type[ResourceT] | None = PrivateAttr(default=None)
     _current_page: int = PrivateAttr(default=0)
     _page_size: int = PrivateAttr(default=0)
+    _partial: bool = PrivateAttr(default=False)
+    _items: LazyItems[ResourceT] | None = PrivateAttr(default=None)
 
     count: int = 0
     next: str | None = None
     previous: str | None = None
     results: list[dict[str, Any]] = Field(default_factory=list)
+    # ids of every matching item; passed through as is, since it spans the whole listing
+    all_ids: SkipValidation[list[int] | None] = Field(default=None, alias="all")
 
     def model_post_init(self, __context: Any, /) -> None:
         """Bind ``_runtime``, ``_resource_cls``, and pagination state from context."""
@@ -42,6 +168,31 @@ class Page[ResourceT: "PaperlessModel"](_PaperlessBase):
                 self._current_page = __context["current_page"]
             if "page_size" in __context:
                 self._page_size = __context["page_size"]
+            if "partial" in __context:
+                self._partial = __context["partial"]
+
+    @classmethod
+    def from_response(
+        cls,
+        runtime: "PaperlessRuntime",
+        res: dict[str, Any],
+        **context: Any,
+    ) -> Self:
+        """Return a page of the list response *res*, without validating its envelope.
+
+        For responses of the Paperless API, whose envelope has a fixed shape:
+        the ``results`` list is taken over as it is instead of being copied.
+        The *context* is the same as for :meth:`from_data`.
+        """
+        page = cls.model_construct(
+            count=res.get("count", 0),
+            next=res.get("next"),
+            previous=res.get("previous"),
+            results=res.get("results", []),
+            all_ids=res.get("all"),
+        )
+        page.model_post_init({"runtime": runtime, **context})
+        return page
 
     @property
     def current_page(self) -> int:
@@ -69,11 +220,12 @@ class Page[ResourceT: "PaperlessModel"](_PaperlessBase):
         return self.previous_page is not None
 
     @property
-    def items(self) -> list[ResourceT]:
+    def items(self) -> LazyItems[ResourceT]:
         """Return this page's results deserialized as model instances.
 
         Unlike the raw :attr:`results` list (which contains plain dicts), this
         property deserializes each entry into the appropriate model class.
+        Entries are deserialized on first access and cached, see :class:`LazyItems`.
 
         Example::
 
@@ -82,14 +234,16 @@ class Page[ResourceT: "PaperlessModel"](_PaperlessBase):
                     print(doc.title)  # doc is a Document instance
 
         """
-
-        def mapper(data: dict[str, Any]) -> ResourceT:
-            if self._resource_cls is None:
+        if self._items is None:
+            resource_cls = self._resource_cls
+            if resource_cls is None:
                 msg = "Page was created without a resource_cls; pass resource_cls= to from_data()"
                 raise RuntimeError(msg)
-            return self._resource_cls.from_data(self._runtime, data)
-
-        return list(map(mapper, self.results))
+            runtime, partial = self._runtime, self._partial
+            self._items = LazyItems(
+                self.results, lambda data: resource_cls.from_data(runtime, data, partial=partial)
+            )
+        return self._items
 
     @property
     def is_last_page(self) -> bool:
@@ -123,20 +277,121 @@ class Page[ResourceT: "PaperlessModel"](_PaperlessBase):
         return iter(self.items)
 
 
+def _split_list_filter(
+    url: str, params: dict[str, Any], budget: int, *, key: str | None = None
+) -> tuple[str, list[dict[str, Any]]] | None:
+    """Split the longest list filter of *params* into chunks whose URLs fit *budget*.
+
+    Returns the split key and one params dict per chunk, or ``None`` if the
+    URL fits as it is.  Only *key* is considered for splitting, if given.
+    Filters that cannot be split to fit are logged and also return ``None``,
+    so they are sent as they are.
+    """
+    if len(str(httpx.URL(url).copy_merge_params(params))) + _URL_RESERVE <= budget:
+        return None
+
+    candidates = [
+        name
+        for name, value in params.items()
+        if (name == key or (key is None and name.endswith(_LIST_FILTER_SUFFIXES)))
+        and isinstance(value, str)
+        and "," in value
+    ]
+    if not candidates:
+        _LOGGER.warning(
+            "The filters do not fit into a URL of %d characters; sending them as they are.",
+            budget,
+        )
+        return None
+    key = max(candidates, key=lambda name: len(params[name]))
+
+    rest = {name: value for name, value in params.items() if name != key}
+    room = budget - _URL_RESERVE - len(str(httpx.URL(url).copy_merge_params({**rest, key: ""})))
+    separator = len(quote(",", safe=""))
+
+    chunks: list[list[str]] = [[]]
+    used = 0
+    for value in dict.fromkeys(params[key].split(",")):
+        width = len(quote(value, safe=""))
+        if width > room:
+            _LOGGER.warning(
+                "The other filters leave no room for %s in a URL of %d characters; "
+                "sending them as they are.",
+                key,
+                budget,
+            )
+            return None
+        if chunks[-1] and used + separator + width > room:
+            chunks.append([])
+            used = 0
+        used += width + (separator if chunks[-1] else 0)
+        chunks[-1].append(value)
+
+    return key, [{**rest, key: ",".join(chunk)} for chunk in chunks]
+
+
+def _page_url(url: str, number: int, page_size: int) -> str:
+    """Return the pagination link *url* pointing to page *number* of *page_size* items."""
+    return str(httpx.URL(url).copy_merge_params({"page": number, "page_size": page_size}))
+
+
 class PageGenerator[ResourceT: "PaperlessModel"](AsyncIterator[Page[ResourceT]]):
     """Async iterator that yields :class:`Page` objects.
 
     Used internally by :meth:`~pypaperless.services.mixins.iterable.IterableService.pages`
     to fetch and paginate through API results. The first request is built from
     *url* and *params*; every subsequent request follows the server-provided
-    ``next`` URL. While a page is being consumed, the following one is already
-    prefetched concurrently, hiding the request latency.
+    ``next`` URL. While a page is being consumed, the following *prefetch*
+    pages are already requested in the background, hiding the request latency.
+    Each read-ahead request follows the ``next`` link of the one before it, and
+    a further one is only started when the consumer takes a page, so a slow
+    consumer never has more than *prefetch* pages buffered.
+
+    With *concurrency*, the remaining pages are requested by number once the
+    first page told the total count, up to *concurrency* at a time.  They are
+    yielded in page order, or as they arrive if *ordered* is ``False``.  With
+    *snapshot*, the id list of the first page (``all``) pins the result set:
+    every further page is requested as its slice of that list via ``id__in``,
+    so items added during the scan cannot shift the page offsets.
+
+    With *adaptive*, the ``page_size`` parameter is a hint: every request is
+    sized from the duration and body size of the one before it, see
+    :class:`~pypaperless.page_size.AdaptivePageSize`.  Pages are then
+    requested one after another, the next one while the current one is
+    consumed, and each :class:`Page` carries its own page number and size.
+
+    :meth:`checkpoint` returns the position after the pages yielded so far,
+    to continue the scan with *resume* later, e.g. after a crash.  Fanned-out
+    pages yielded out of order only count once the pages before them were
+    yielded too, so a resumed scan may repeat some items but never skips one.
+    A resumed snapshot scan lists the matching ids again and continues with
+    those up to the snapshot's highest id: behind the last id for scans
+    ordered by id on an endpoint honouring that (*id_ordering*), behind the
+    position of the last id otherwise.  Only if
+    that item no longer matches, the scan continues behind the offset and
+    may skip items if others before it were deleted too.  :attr:`progress`
+    tells the items done and an ETA at the throughput observed so far.
 
     Args:
         runtime:      A :class:`~pypaperless.runtime.PaperlessRuntime` instance.
         url:          The API endpoint URL returning paginated results.
         resource_cls: The model class used to map raw result dicts.
         params:       Optional query string parameters.
+        prefetch:     Pages read ahead of the consumer, ``0`` to request every
+                      page on demand.
+        concurrency:  Pages requested at the same time after the first one,
+                      ``None`` (default) to follow the ``next`` links one by one.
+        ordered:      Yield fanned-out pages in page order.
+        snapshot:     Pin the result set of the first page; the endpoint must
+                      support the ``id__in`` filter.
+        id_ordering:  The endpoint honours ``ordering=id``, so a resumed snapshot
+                      scan ordered by id can continue behind the last id.
+        adaptive:     Adapt the page size between requests; cannot be combined
+                      with *concurrency*.
+        partial:      The params request a field projection or truncated
+                      content; the items are built as partial models.
+        resume:       A :class:`PageCheckpoint` to continue from; its params
+                      replace the page number of *params*.
 
     """
 
@@ -146,57 +401,442 @@ class PageGenerator[ResourceT: "PaperlessModel"](AsyncIterator[Page[ResourceT]])
         url: str,
         resource_cls: type[ResourceT],
         params: dict[str, Any] | None = None,
+        *,
+        prefetch: int = 1,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        snapshot: bool = False,
+        id_ordering: bool = False,
+        adaptive: AdaptivePageSize | None = None,
+        partial: bool = False,
+        resume: PageCheckpoint | None = None,
     ) -> None:
         """Initialize a :class:`PageGenerator` instance."""
+        if prefetch < 0:
+            msg = "prefetch must not be negative."
+            raise ValueError(msg)
+        if concurrency is not None and concurrency < 1:
+            msg = "concurrency must be a positive integer or None."
+            raise ValueError(msg)
+        if adaptive is not None and concurrency is not None:
+            msg = "Adaptive page sizes cannot be combined with concurrency."
+            raise ValueError(msg)
+
         self._runtime = runtime
         self._resource_cls = resource_cls
         self._url = url
+        self._partial = partial
 
         self.params = dict(params) if params else {}
         self.params.setdefault("page", 1)
         self.params.setdefault("page_size", 150)
+        if resume is not None:
+            self.params["page"] = resume.offset // int(self.params["page_size"]) + 1
+
+        self._adaptive = adaptive
+        self._adaptive_task: asyncio.Task[tuple[Any, int, float, int]] | None = None
+        self._offset = 0
+        if adaptive is not None:
+            size = adaptive.start(int(self.params["page_size"]))
+            if resume is not None:
+                # continue on a page boundary of the resumed offset
+                while resume.offset % size and (smaller := adaptive.shrink(size)):
+                    size = smaller
+                self.params["page"] = resume.offset // size + 1
+            self.params["page_size"] = size
+            self._offset = (int(self.params["page"]) - 1) * size
 
         self._current_page_number = int(self.params["page"])
-        self._prefetch: asyncio.Task[Any] | None = None
+        self._next_url: str | None = None
+        self._prefetch_depth = prefetch
+        self._prefetch: deque[asyncio.Task[Any]] = deque()
         self._exhausted = False
 
+        self._concurrency = concurrency
+        self._ordered = ordered
+        self._snapshot = snapshot
+        self._id_ordering = id_ordering
+        self._fanning_out = False
+        self._fanout: dict[int, asyncio.Task[Any]] = {}
+        self._fanout_numbers: Iterator[int] = iter(())
+        self._first: dict[str, Any] = {}
+        self._last_page = 0
+        self._snapshot_ids: list[int] | None = None
+        self._snapshot_base = 0
+        self._restore(resume)
+
+    def _restore(self, resume: PageCheckpoint | None) -> None:
+        """Set up the checkpoint and progress state, from *resume* if given."""
+        # items done, up to and including the last page done in page order
+        self._done = (self._current_page_number - 1) * int(self.params["page_size"])
+        self._done_page = self._current_page_number - 1
+        self._yielded: dict[int, tuple[int, Any]] = {}
+        self._last_id: int | None = None
+        self._watermark: int | None = None
+        self._total: int | None = None
+        self._resume_snapshot = False
+        if resume is not None:
+            # unless finished, count from the page boundary the scan resumes on
+            if resume.finished:
+                self._done = resume.offset
+            self._last_id = resume.last_id
+            self._watermark = resume.watermark
+            self._total = resume.count
+            self._resume_snapshot = self._snapshot and resume.watermark is not None
+            self._exhausted = resume.finished
+        self._started_at: float | None = None
+        self._started_done = self._done
+
     def __aiter__(self) -> "PageGenerator[ResourceT]":
         """Return self as iterator."""
         return self
 
     async def __anext__(self) -> Page[ResourceT]:
-        """Return the next page, kicking off the prefetch for the one after it."""
+        """Return the next page, topping up the read-ahead behind it."""
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+        if self._fanning_out:
+            return await self._next_fanned_out()
         if self._exhausted:
             raise StopAsyncIteration
-
-        if self._prefetch is not None:
-            res = await self._prefetch
-            self._prefetch = None
+        if self._resume_snapshot:
+            self._resume_snapshot = False
+            if await self._resume_fanout():
+                return await self._next_fanned_out()
+        if self._adaptive is not None:
+            return await self._next_adaptive(self._adaptive)
+
+        if self._prefetch:
+            res = await self._prefetch.popleft()
+        elif self._next_url is not None:
+            res = await self._runtime.transport.get(self._next_url, kind=RequestKind.LISTING)
         else:
-            res = await self._runtime.transport.get(self._url, params=self.params)
+            res = await self._runtime.transport.get(
+                self._url, params=self.params, kind=RequestKind.LISTING
+            )
 
         next_url = res.get("next") if isinstance(res, dict) else None
-        if next_url:
-            task = asyncio.ensure_future(self._runtime.transport.get(next_url))
-            task.add_done_callback(_mark_exception_retrieved)
-            self._prefetch = task
+        if next_url and self._concurrency is not None:
+            self._start_fanout(res)
+        elif next_url:
+            self._next_url = next_url
+            self._read_ahead(next_url)
         else:
             self._exhausted = True
 
-        page: Page[ResourceT] = Page.from_data(
+        page = self._to_page(res, self._current_page_number)
+        self._record(page, self._current_page_number)
+        self._current_page_number += 1
+
+        return page
+
+    @property
+    def progress(self) -> ScanProgress:
+        """Return the items done, the total, and the throughput and ETA so far.
+
+        Example::
+
+            async for page in pages:
+                await store(page)
+                done, total, rate, eta = pages.progress
+                if eta is not None:
+                    print(f"{done}/{total}, {rate:.0f} items/s, {eta:.0f}s left")
+
+        """
+        done = self._done
+        rate = None
+        if self._started_at is not None and done > self._started_done:
+            elapsed = time.monotonic() - self._started_at
+            rate = (done - self._started_done) / elapsed if elapsed > 0 else None
+        eta = None
+        if rate and self._total is not None:
+            eta = max(self._total - done, 0) / rate
+        return ScanProgress(done, self._total, rate, eta)
+
+    def checkpoint(self) -> PageCheckpoint:
+        """Return the position after the pages yielded so far, to resume the scan later.
+
+        Call it once a page was processed; resuming from it continues with the
+        page after.
+
+        Example::
+
+            async for page in pages:
+                await store(page)
+                state_file.write_text(pages.checkpoint().model_dump_json())
+
+            checkpoint = PageCheckpoint.model_validate_json(state_file.read_text())
+            async for page in paperless.documents.resume(checkpoint):
+                ...
+
+        """
+        return PageCheckpoint(
+            path=self._url,
+            params={key: value for key, value in self.params.items() if key != "page"},
+            offset=self._done,
+            last_id=self._last_id,
+            watermark=self._watermark,
+            count=self._total,
+            partial=self._partial,
+        )
+
+    def _record(self, page: Page[ResourceT], number: int | None = None) -> None:
+        """Count the yielded *page*; fanned-out page *number* counts once all before it did."""
+        self._total = page.count
+        results = page.results
+        last = results[-1].get("id") if results and isinstance(results[-1], dict) else None
+        if number is None:
+            self._advance(len(results), last)
+            return
+
+        self._yielded[number] = (len(results), last)
+        while self._done_page + 1 in self._yielded:
+            self._done_page += 1
+            self._advance(*self._yielded.pop(self._done_page))
+
+    def _advance(self, items: int, last_id: Any) -> None:
+        """Move the checkpoint behind *items* more items, the last of them *last_id*."""
+        self._done += items
+        if isinstance(last_id, int):
+            self._last_id = last_id
+
+    def _read_ahead(self, next_url: str) -> None:
+        """Start read-ahead requests, from *next_url* on, until *prefetch* are pending."""
+        while len(self._prefetch) < self._prefetch_depth:
+            if self._prefetch:
+                task = asyncio.ensure_future(self._follow(self._prefetch[-1]))
+            else:
+                task = asyncio.ensure_future(
+                    self._runtime.transport.get(next_url, kind=RequestKind.LISTING)
+                )
+            task.add_done_callback(_mark_exception_retrieved)
+            self._prefetch.append(task)
+
+    async def _follow(self, previous: "asyncio.Task[Any]") -> Any:
+        """Request the page linked as ``next`` by the response of *previous*."""
+        # wait() instead of await, so cancelling this task leaves *previous* alone
+        await asyncio.wait([previous])
+        res = previous.result()
+        next_url = res.get("next") if isinstance(res, dict) else None
+        if not next_url:
+            return None
+        return await self._runtime.transport.get(next_url, kind=RequestKind.LISTING)
+
+    def _to_page(self, res: Any, number: int, page_size: int | None = None) -> Page[ResourceT]:
+        """Return the response *res* as :class:`Page` number *number*."""
+        build = Page.from_response if isinstance(res, dict) else Page.from_data
+        return build(
             self._runtime,
             res,
             resource_cls=self._resource_cls,
-            current_page=self._current_page_number,
-            page_size=self.params["page_size"],
+            current_page=number,
+            page_size=page_size or self.params["page_size"],
+            partial=self._partial,
         )
-        self._current_page_number += 1
 
+    async def _next_adaptive(self, policy: AdaptivePageSize) -> Page[ResourceT]:
+        """Return the next adaptively sized page and start requesting the one after it."""
+        if self._adaptive_task is None:
+            self._adaptive_task = self._start_sized(policy, self._offset, self.params["page_size"])
+        task, self._adaptive_task = self._adaptive_task, None
+        res, size, seconds, nbytes = await task
+
+        page = self._to_page(res, self._offset // size + 1, size)
+        self._record(page)
+        self._offset += size
+        # checkpoints carry the size in use, which divides their offset
+        self.params["page_size"] = size
+        next_url = res.get("next") if isinstance(res, dict) else None
+        if next_url:
+            next_size = policy.next_size(size, self._offset, seconds, nbytes)
+            self._adaptive_task = self._start_sized(policy, self._offset, next_size)
+        else:
+            self._exhausted = True
+        return page
+
+    def _start_sized(
+        self, policy: AdaptivePageSize, offset: int, size: int
+    ) -> "asyncio.Task[tuple[Any, int, float, int]]":
+        """Start requesting the page of *size* items at *offset* in the background."""
+        task = asyncio.ensure_future(self._fetch_sized(policy, offset, size))
+        task.add_done_callback(_mark_exception_retrieved)
+        return task
+
+    async def _fetch_sized(
+        self, policy: AdaptivePageSize, offset: int, size: int
+    ) -> tuple[Any, int, float, int]:
+        """Request the page at *offset*, halving *size* after every timeout.
+
+        Return the response, the page size it was requested with, its duration
+        and its decoded body size.
+        """
+        while True:
+            params = {**self.params, "page": offset // size + 1, "page_size": size}
+            started = time.monotonic()
+            try:
+                with tally_response_bytes() as tally, tally_response_seconds() as timings:
+                    res = await self._runtime.transport.get(
+                        self._url, params=params, kind=RequestKind.LISTING
+                    )
+            except PaperlessTimeoutError:
+                smaller = policy.shrink(size)
+                if smaller is None:
+                    raise
+                _LOGGER.warning(
+                    "Page of %d items at offset %d timed out, retrying with %d items.",
+                    size,
+                    offset,
+                    smaller,
+                )
+                size = smaller
+                continue
+            # time the exchange that answered, not the waits for rate limits, slots and retries
+            seconds = timings[-1] if timings else time.monotonic() - started
+            return res, size, seconds, sum(tally)
+
+    def _start_fanout(self, first: dict[str, Any]) -> None:
+        """Plan the remaining page numbers after *first* and start requesting them."""
+        page_size = int(self.params["page_size"])
+        ids = first.get("all")
+        if self._snapshot and isinstance(ids, list):
+            self._snapshot_ids = ids
+            self._watermark = max(ids, default=None)
+        total = len(self._snapshot_ids) if self._snapshot_ids is not None else first["count"]
+
+        self._first = first
+        self._last_page = math.ceil(total / page_size)
+        self._fanning_out = True
+        self._fanout_numbers = iter(range(self._current_page_number + 1, self._last_page + 1))
+        self._fill_fanout()
+
+    async def _resume_fanout(self) -> bool:
+        """List the matching ids again and fan out over those left to resume the snapshot.
+
+        Return ``False`` if the endpoint no longer lists the ids; the scan then
+        continues by page number.
+        """
+        head = await self._runtime.transport.get(
+            self._url, params={**self.params, "page": 1, "page_size": 1}, kind=RequestKind.LISTING
+        )
+        ids = head.get("all") if isinstance(head, dict) else None
+        if not isinstance(ids, list):
+            return False
+
+        watermark = self._watermark if self._watermark is not None else max(ids, default=0)
+        ids = [pk for pk in ids if pk <= watermark]
+        if self._id_ordering and self.params.get("ordering") == "id" and self._last_id is not None:
+            last_id = self._last_id
+            ids = [pk for pk in ids if pk > last_id]
+        elif self._last_id in ids:
+            # deletions before the last item yielded must not shift the position
+            ids = ids[ids.index(self._last_id) + 1 :]
+        else:
+            ids = ids[self._done :]
+
+        page_size = int(self.params["page_size"])
+        self._snapshot_ids = ids
+        self._snapshot_base = self._done_page
+        self._first = {"count": self._done + len(ids), "next": head.get("next")}
+        self._last_page = self._snapshot_base + math.ceil(len(ids) / page_size)
+        self._fanning_out = True
+        self._fanout_numbers = iter(range(self._snapshot_base + 1, self._last_page + 1))
+        self._fill_fanout()
+        return True
+
+    def _fill_fanout(self) -> None:
+        """Start page requests until *concurrency* of them are in flight."""
+        while len(self._fanout) < (self._concurrency or 1):
+            number = next(self._fanout_numbers, None)
+            if number is None:
+                return
+            task = asyncio.ensure_future(self._fetch_page(number))
+            task.add_done_callback(_mark_exception_retrieved)
+            self._fanout[number] = task
+
+    async def _fetch_page(self, number: int) -> dict[str, Any]:
+        """Request page *number*, as a slice of the snapshot if one is pinned."""
+        params = {**self.params, "page": number}
+        if self._snapshot_ids is not None:
+            page_size = int(self.params["page_size"])
+            start = (number - 1 - self._snapshot_base) * page_size
+            params["id__in"] = ",".join(map(str, self._snapshot_ids[start : start + page_size]))
+            params["page"] = 1
+            res = await self._fetch_slice(params)
+        else:
+            res = await self._runtime.transport.get(
+                self._url, params=params, kind=RequestKind.LISTING
+            )
+
+        # present every page like a page of the first listing
+        return {
+            **res,
+            "count": self._first["count"],
+            "next": self._link(number + 1),
+            "previous": self._link(number - 1),
+        }
+
+    async def _fetch_slice(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Request the snapshot slice of *params*, split into several requests if too long.
+
+        An ``id__in`` list beyond the transport's ``max_url_length`` is split
+        into chunks that fit, which are requested at the same time; their
+        results are joined in the order of the slice.
+        """
+        transport = self._runtime.transport
+        budget = transport.max_url_length
+        url = f"{transport.base_url}{self._url}"
+        split = None if budget is None else _split_list_filter(url, params, budget, key="id__in")
+        if split is None:
+            res: dict[str, Any] = await transport.get(
+                self._url, params=params, kind=RequestKind.LISTING
+            )
+            return res
+
+        parts = await asyncio.gather(
+            *(
+                transport.get(self._url, params=chunk, kind=RequestKind.LISTING)
+                for chunk in split[1]
+            )
+        )
+        return {**parts[0], "results": [data for part in parts for data in part["results"]]}
+
+    def _link(self, number: int) -> str | None:
+        """Return the pagination link to fanned-out page *number*, ``None`` if out of range."""
+        first_next = self._first.get("next")
+        if not first_next or not 1 <= number <= self._last_page:
+            return None
+        return _page_url(first_next, number, int(self.params["page_size"]))
+
+    async def _next_fanned_out(self) -> Page[ResourceT]:
+        """Return the next fanned-out page and start requesting a further one."""
+        if not self._fanout:
+            self._fanning_out = False
+            self._exhausted = True
+            raise StopAsyncIteration
+
+        if self._ordered:
+            number = next(iter(self._fanout))
+            await asyncio.wait([self._fanout[number]])
+        else:
+            await asyncio.wait(self._fanout.values(), return_when=asyncio.FIRST_COMPLETED)
+            number = next(number for number, task in self._fanout.items() if task.done())
+
+        res = self._fanout.pop(number).result()
+        self._fill_fanout()
+        page = self._to_page(res, number)
+        self._record(page, number)
         return page
 
     async def aclose(self) -> None:
-        """Cancel a pending prefetch; call when abandoning iteration early."""
-        if self._prefetch is not None:
-            self._prefetch.cancel()
-            self._prefetch = None
+        """Cancel pending prefetches; call when abandoning iteration early."""
+        for task in self._prefetch:
+            task.cancel()
+        self._prefetch.clear()
+        if self._adaptive_task is not None:
+            self._adaptive_task.cancel()
+            self._adaptive_task = None
+        for task in self._fanout.values():
+            task.cancel()
+        self._fanout.clear()
+        self._fanning_out = False
         self._exhausted = True
@@ -0,0 +1,98 @@
+"""Provide the probe policy used to initialize the connection."""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel, ConfigDict, PositiveFloat
+
+_LOGGER = logging.getLogger(__package__)
+
+
+class ProbeMode(StrEnum):
+    """How :meth:`~pypaperless.transport.PaperlessTransport.probe` contacts the host."""
+
+    SCHEMA = "schema"
+    """GET the OpenAPI schema and validate that it parses as JSON."""
+
+    HEAD = "head"
+    """Send a HEAD request to the API root and only read the version headers."""
+
+
+class HostInfo(NamedTuple):
+    """Version metadata returned by :meth:`~pypaperless.transport.PaperlessTransport.probe`."""
+
+    api_version: int
+    version: str | None
+
+
+class ProbePolicy(BaseModel):
+    """Configure how the client probes the Paperless host on initialization.
+
+    The default ``SCHEMA`` mode downloads and parses the OpenAPI schema, which
+    fully validates the connection but is large.  ``HEAD`` mode only reads the
+    ``X-Api-Version`` and ``X-Version`` headers of the API root.
+
+    With *cache_file* set, the probed :class:`HostInfo` is stored on disk per
+    base URL, and per socket path for clients connecting through a Unix
+    domain socket, and reused for *cache_ttl* seconds, so short-lived processes skip
+    the probe entirely.  A cached probe does not validate the connection or
+    the token — the first real request does.
+
+    Example::
+
+        probe = ProbePolicy(mode=ProbeMode.HEAD, cache_file=Path("~/.cache/pypaperless.json"))
+        async with PaperlessClient("localhost:8000", "token", probe=probe) as paperless:
+            ...
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    mode: ProbeMode = ProbeMode.SCHEMA
+    cache_file: Path | None = None
+    cache_ttl: PositiveFloat = 3600.0
+
+    def load(self, base_url: str) -> HostInfo | None:
+        """Return the cached :class:`HostInfo` of *base_url*, if present and fresh."""
+        if self.cache_file is None:
+            return None
+        entry = self._read().get(base_url, {})
+        try:
+            if time.time() - float(entry["probed_at"]) > self.cache_ttl:
+                return None
+            return HostInfo(api_version=int(entry["api_version"]), version=entry["version"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def store(self, base_url: str, info: HostInfo) -> None:
+        """Write *info* for *base_url* to the cache file, keeping other hosts' entries."""
+        if self.cache_file is None:
+            return
+        path = self.cache_file.expanduser()
+        entries = self._read()
+        entries[base_url] = {**info._asdict(), "probed_at": time.time()}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # write a sibling file and rename it, so concurrent readers never see half a file
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(entries, file)
+            Path(tmp).replace(path)
+        except OSError as err:
+            _LOGGER.warning("Could not write the probe cache %s: %s", path, err)
+
+    def _read(self) -> dict[str, Any]:
+        """Return all entries of the cache file; an unreadable file counts as empty."""
+        if self.cache_file is None:
+            return {}
+        try:
+            entries = json.loads(self.cache_file.expanduser().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
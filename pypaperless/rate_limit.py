@@ -0,0 +1,101 @@
+"""Provide the client-side rate limiter used by the HTTP transport."""
+
+import asyncio
+import time
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict, PositiveFloat, PositiveInt
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RequestKind(StrEnum):
+    """Classify requests, so every class of traffic gets its own rate budget."""
+
+    LISTING = "listing"
+    """Paginated list requests of :class:`~pypaperless.pagination.PageGenerator`."""
+
+    ITEM = "item"
+    """Single-item fetches and every other read request."""
+
+    DOWNLOAD = "download"
+    """Binary document downloads, previews and thumbnails."""
+
+    WRITE = "write"
+    """Every request that is not a read: bulk edits, ``POST``, ``PATCH``, ``PUT``, ``DELETE``."""
+
+    @classmethod
+    def for_method(cls, method: str) -> "RequestKind":
+        """Return the default kind of a request sent with *method*."""
+        return cls.ITEM if method.upper() in _READ_METHODS else cls.WRITE
+
+
+class RateLimit(BaseModel):
+    """A token bucket budget: *rate* requests per second, with bursts of up to *burst*."""
+
+    model_config = ConfigDict(frozen=True)
+
+    rate: PositiveFloat
+    burst: PositiveInt = 1
+
+
+class RateLimitPolicy(BaseModel):
+    """Configure client-side rate limits per :class:`RequestKind`.
+
+    Every kind of request draws from its own token bucket, so a running
+    export limited by *listing* and *download* never delays interactive
+    single-item lookups.  Kinds without a budget are not limited.  Every
+    attempt of a retried request takes a token.
+
+    Example::
+
+        limits = RateLimitPolicy(
+            listing=RateLimit(rate=5),
+            download=RateLimit(rate=2, burst=4),
+        )
+        async with PaperlessClient("localhost:8000", "token", rate_limit=limits) as paperless:
+            ...
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    listing: RateLimit | None = None
+    item: RateLimit | None = None
+    download: RateLimit | None = None
+    write: RateLimit | None = None
+
+    def budget(self, kind: RequestKind) -> RateLimit | None:
+        """Return the budget of *kind*, or ``None`` if it is not limited."""
+        budget: RateLimit | None = getattr(self, kind.value)
+        return budget
+
+
+class TokenBucket:
+    """An asyncio token bucket; waiters are served in arrival order."""
+
+    def __init__(self, limit: RateLimit) -> None:
+        """Initialize a full bucket for *limit*."""
+        self._rate = limit.rate
+        self._burst = limit.burst
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting for it if necessary; return the seconds waited."""
+        started = time.monotonic()
+        waited = self._lock.locked()
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                waited = True
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+        return time.monotonic() - started if waited else 0.0
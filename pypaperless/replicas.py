@@ -0,0 +1,140 @@
+"""Provide load balancing across several Paperless replicas."""
+
+import logging
+import time
+from collections.abc import Sequence
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict, Field, PositiveFloat, PositiveInt
+
+_LOGGER = logging.getLogger(__package__)
+
+
+class BalanceStrategy(StrEnum):
+    """How the transport picks a replica for the next request."""
+
+    LEAST_OUTSTANDING = "least_outstanding"
+    """The replica with the fewest requests in flight, round-robin among equals."""
+
+    EWMA = "ewma"
+    """The replica with the lowest latency average, weighted by its requests in flight."""
+
+
+class ReplicaPolicy(BaseModel):
+    """Configure load balancing when the client is given several base URLs.
+
+    Every request without an absolute URL goes to the replica chosen by
+    *strategy*.  Absolute URLs, e.g. the ``next`` links of paginated lists,
+    stay pinned to the replica that issued them.  A replica failing
+    *eject_after* times in a row (connection errors, timeouts, HTTP 502, 503
+    or 504) is skipped for *eject_duration* seconds; after that, one more
+    failure ejects it again.  If all replicas are ejected, the one returning
+    first is used anyway.
+
+    Example::
+
+        urls = ["paperless-1.internal:8000", "paperless-2.internal:8000"]
+        policy = ReplicaPolicy(strategy=BalanceStrategy.EWMA)
+        async with PaperlessClient(urls, "token", replicas=policy) as paperless:
+            ...
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    strategy: BalanceStrategy = BalanceStrategy.LEAST_OUTSTANDING
+    ewma_alpha: float = Field(default=0.3, gt=0, le=1)
+    eject_after: PositiveInt = 3
+    eject_duration: PositiveFloat = 30.0
+    failure_statuses: frozenset[int] = frozenset({502, 503, 504})
+
+
+class Replica:
+    """The health and load state of a single replica."""
+
+    def __init__(self, base_url: str) -> None:
+        """Initialize an idle, healthy replica."""
+        self.base_url = base_url
+        self.outstanding = 0
+        self.latency: float | None = None
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return (
+            f"Replica({self.base_url!r}, outstanding={self.outstanding}, "
+            f"latency={self.latency}, ejected={self.ejected})"
+        )
+
+    @property
+    def ejected(self) -> bool:
+        """Return whether the replica is currently skipped by the balancer."""
+        return self.ejected_until > time.monotonic()
+
+    def owns(self, url: str) -> bool:
+        """Return whether the absolute *url* points to this replica."""
+        return url == self.base_url or url.startswith(f"{self.base_url}/")
+
+
+class ReplicaSet:
+    """Pick replicas for requests and track their outcomes."""
+
+    def __init__(self, base_urls: Sequence[str], policy: ReplicaPolicy) -> None:
+        """Initialize the set with one :class:`Replica` per base URL."""
+        self._policy = policy
+        self._replicas = [Replica(url) for url in base_urls]
+        self._next = 0
+
+    @property
+    def policy(self) -> ReplicaPolicy:
+        """Return the :class:`ReplicaPolicy` of this set."""
+        return self._policy
+
+    @property
+    def replicas(self) -> list[Replica]:
+        """Return all replicas, in the order of the base URLs."""
+        return list(self._replicas)
+
+    def owner(self, url: str) -> Replica | None:
+        """Return the replica the absolute *url* is pinned to, if any."""
+        return next((replica for replica in self._replicas if replica.owns(url)), None)
+
+    def select(self) -> Replica:
+        """Return the replica for the next request."""
+        healthy = [replica for replica in self._replicas if not replica.ejected]
+        if not healthy:
+            return min(self._replicas, key=lambda replica: replica.ejected_until)
+
+        # rotate the start, so ties are broken round-robin
+        start = self._next % len(healthy)
+        self._next += 1
+        candidates = healthy[start:] + healthy[:start]
+        if self._policy.strategy is BalanceStrategy.EWMA:
+            return min(candidates, key=lambda r: (r.latency or 0.0) * (r.outstanding + 1))
+        return min(candidates, key=lambda replica: replica.outstanding)
+
+    def record(self, replica: Replica, latency: float, *, failed: bool) -> bool:
+        """Record the outcome of a request; return ``True`` if it ejected the replica."""
+        alpha = self._policy.ewma_alpha
+        if replica.latency is None:
+            replica.latency = latency
+        else:
+            replica.latency = alpha * latency + (1 - alpha) * replica.latency
+
+        if not failed:
+            replica.consecutive_failures = 0
+            return False
+
+        replica.consecutive_failures += 1
+        if replica.consecutive_failures < self._policy.eject_after or replica.ejected:
+            return False
+
+        replica.ejected_until = time.monotonic() + self._policy.eject_duration
+        _LOGGER.warning(
+            "Ejecting replica %s for %.1fs after %d consecutive failures.",
+            replica.base_url,
+            self._policy.eject_duration,
+            replica.consecutive_failures,
+        )
+        return True
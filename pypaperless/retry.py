@@ -0,0 +1,80 @@
+"""Provide the retry policy used by the HTTP transport."""
+
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+from pydantic import BaseModel, ConfigDict, NonNegativeFloat, PositiveFloat, PositiveInt
+
+IDEMPOTENT_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT"})
+
+
+class RetryPolicy(BaseModel):
+    """Configure how the transport retries failed requests.
+
+    A request is retried when it fails with a connection error or timeout, or
+    when Paperless answers with one of *retry_statuses*.  Only idempotent
+    methods (``GET``, ``HEAD``, ``OPTIONS``, ``PUT``, ``DELETE``) are retried.
+    ``POST`` requests are retried only when *retry_idempotent_posts* is enabled
+    **and** the calling service marks the request as idempotent, e.g. the bulk
+    edit operations that set a value instead of toggling or creating one.
+
+    The delay before retry *n* is drawn from ``[0, min(backoff_max,
+    backoff_base * 2 ** (n - 1))]`` ("full jitter").  A ``Retry-After`` header
+    sent with the response replaces the computed delay; a value above
+    *backoff_max* ends the retry loop.  Every request has its own budget of
+    *max_attempts* and *max_elapsed* seconds.
+
+    Example::
+
+        policy = RetryPolicy(max_attempts=5, backoff_base=1.0)
+        async with PaperlessClient("localhost:8000", "token", retry=policy) as paperless:
+            async for doc in paperless.documents:
+                ...
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_attempts: PositiveInt = 3
+    backoff_base: NonNegativeFloat = 0.5
+    backoff_max: NonNegativeFloat = 30.0
+    jitter: bool = True
+    max_elapsed: PositiveFloat | None = None
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    respect_retry_after: bool = True
+    retry_idempotent_posts: bool = False
+
+    def allows(self, method: str, *, idempotent: bool = False) -> bool:
+        """Return whether requests with *method* may be retried at all."""
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return self.retry_idempotent_posts and idempotent and method.upper() == "POST"
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay in seconds before retrying after the failed *attempt*."""
+        delay = min(self.backoff_max, self.backoff_base * 2.0 ** (attempt - 1))
+        if self.jitter:
+            # jitter spreads out retries of concurrent requests, it is no secret
+            return random.uniform(0, delay)  # noqa: S311
+        return delay
+
+    def retry_after(self, res: httpx.Response) -> float | None:
+        """Return the delay requested by a ``Retry-After`` header, if any."""
+        if not self.respect_retry_after:
+            return None
+        value = res.headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        return max(0.0, (when - datetime.now(UTC)).total_seconds())
@@ -1,6 +1,6 @@
 """Provide base classes for services."""
 
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol
 
 from pypaperless.const import EndpointPath, PaperlessResource
 
@@ -24,6 +24,27 @@ class ResourceServiceProtocol[ResourceT](Protocol):
     _resource: PaperlessResource
     _resource_cls: type[ResourceT]
 
+    # whether the endpoint honours the ``fields`` and ``truncate_content`` params
+    _field_projection: ClassVar[bool] = False
+
+    def _projection_params(
+        self, fields: list[str] | None, *, truncate_content: bool
+    ) -> dict[str, Any]:
+        """Return the query params requesting only *fields* and truncated content."""
+        if fields is None and not truncate_content:
+            return {}
+        if not self._field_projection:
+            msg = f"{type(self).__name__} does not support field projection."
+            raise ValueError(msg)
+
+        params: dict[str, Any] = {}
+        if fields is not None:
+            # the id is required by every identified model
+            params["fields"] = ",".join(dict.fromkeys(("id", *fields)))
+        if truncate_content:
+            params["truncate_content"] = "true"
+        return params
+
 
 class ResourceService(PaperlessService):
     """Base class for all resource services in PyPaperless."""
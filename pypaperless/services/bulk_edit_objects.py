@@ -56,7 +56,7 @@ class BulkEditObjectsService(PaperlessService):
             payload["owner"] = owner
         if permissions is not None:
             payload["permissions"] = permissions.model_dump()
-        await self._runtime.transport.post(self._api_path, json=payload)
+        await self._runtime.transport.post(self._api_path, json=payload, idempotent=True)
 
     async def delete(
         self,
@@ -28,6 +28,7 @@ class CorrespondentService(
 
     _draft_cls = CorrespondentDraft
     _resource_cls = Correspondent
+    _id_filters = True
 
     @asynccontextmanager
     async def filter(self, **kwargs: Unpack[CorrespondentFilters]) -> AsyncGenerator[Self]:
@@ -27,6 +27,7 @@ class CustomFieldService(
 
     _draft_cls = CustomFieldDraft
     _resource_cls = CustomField
+    _id_filters = True
 
     @asynccontextmanager
     async def filter(self, **kwargs: Unpack[CustomFieldFilters]) -> AsyncGenerator[Self]:
@@ -28,6 +28,7 @@ class DocumentTypeService(
 
     _draft_cls = DocumentTypeDraft
     _resource_cls = DocumentType
+    _id_filters = True
 
     @asynccontextmanager
     async def filter(self, **kwargs: Unpack[DocumentTypeFilters]) -> AsyncGenerator[Self]:
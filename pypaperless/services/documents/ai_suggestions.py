@@ -31,5 +31,4 @@ class DocumentAISuggestionsService(DocumentScopedServiceBase):
         doc_pk = self._get_document_pk(pk)
         api_path = self._api_path.format(pk=doc_pk)
         data = await self._runtime.transport.get(api_path)
-        data["id"] = doc_pk
-        return self._resource_cls.from_data(self._runtime, data)
+        return self._resource_cls.from_data(self._runtime, {**data, "id": doc_pk})
@@ -12,9 +12,13 @@ class DocumentBulkEditService(PaperlessService):
 
     _api_path = EndpointPath.DOCUMENTS_BULK_EDIT
 
-    async def _post(self, path: str, *, json: dict) -> None:
-        """POST to *path* and raise `BulkEditError` when the result is not ``"OK"``."""
-        data = await self._runtime.transport.post(path, json=json)
+    async def _post(self, path: str, *, json: dict, idempotent: bool = False) -> None:
+        """POST to *path* and raise `BulkEditError` when the result is not ``"OK"``.
+
+        Operations that assign a value, and therefore yield the same state when
+        sent twice, pass ``idempotent=True`` so the transport may retry them.
+        """
+        data = await self._runtime.transport.post(path, json=json, idempotent=idempotent)
         if data.get("result") != "OK":
             raise BulkEditError(str(data.get("result")))
 
@@ -40,7 +44,7 @@ class DocumentBulkEditService(PaperlessService):
             "method": "set_correspondent",
             "parameters": {"correspondent": correspondent},
         }
-        await self._post(self._api_path, json=payload)
+        await self._post(self._api_path, json=payload, idempotent=True)
 
     async def set_document_type(
         self,
@@ -64,7 +68,7 @@ class DocumentBulkEditService(PaperlessService):
             "method": "set_document_type",
             "parameters": {"document_type": document_type},
         }
-        await self._post(self._api_path, json=payload)
+        await self._post(self._api_path, json=payload, idempotent=True)
 
     async def set_storage_path(
         self,
@@ -88,7 +92,7 @@ class DocumentBulkEditService(PaperlessService):
             "method": "set_storage_path",
             "parameters": {"storage_path": storage_path},
         }
-        await self._post(self._api_path, json=payload)
+        await self._post(self._api_path, json=payload, idempotent=True)
 
     async def add_tag(
         self,
@@ -111,7 +115,7 @@ class DocumentBulkEditService(PaperlessService):
             "method": "add_tag",
             "parameters": {"tag": tag},
         }
-        await self._post(self._api_path, json=payload)
+        await self._post(self._api_path, json=payload, idempotent=True)
 
     async def remove_tag(
         self,
@@ -134,7 +138,7 @@ class DocumentBulkEditService(PaperlessService):
             "method": "remove_tag",
             "parameters": {"tag": tag},
         }
-        await self._post(self._api_path, json=payload)
+        await self._post(self._api_path, json=payload, idempotent=True)
 
     async def modify_tags(
         self,
@@ -164,7 +168,7 @@ class DocumentBulkEditService(PaperlessService):
             "method": "modify_tags",
             "parameters": {"add_tags": add_tags, "remove_tags": remove_tags},
         }
-        await self._post(self._api_path, json=payload)
+        await self._post(self._api_path, json=payload, idempotent=True)
 
     async def modify_custom_fields(
         self,
@@ -199,7 +203,7 @@ class DocumentBulkEditService(PaperlessService):
                 "remove_custom_fields": remove_custom_fields,
             },
         }
-        await self._post(self._api_path, json=payload)
+        await self._post(self._api_path, json=payload, idempotent=True)
 
     async def set_permissions(
         self,
@@ -241,7 +245,7 @@ class DocumentBulkEditService(PaperlessService):
             "method": "set_permissions",
             "parameters": parameters,
         }
-        await self._post(self._api_path, json=payload)
+        await self._post(self._api_path, json=payload, idempotent=True)
 
     async def delete(self, documents: list[int]) -> None:
         """Move a list of documents to the trash.
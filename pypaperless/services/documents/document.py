@@ -47,9 +47,8 @@ class DocumentSuggestionsService(ResourceService):
         """Request exactly one resource item."""
         api_path = self._resource_cls.format_api_path(pk=pk)
         data = await self._runtime.transport.get(api_path)
-        data["id"] = pk
 
-        return self._resource_cls.from_data(self._runtime, data)
+        return self._resource_cls.from_data(self._runtime, {**data, "id": pk})
 
 
 class DocumentMetaService(ResourceService, mixins.CallableService[DocumentMeta]):
@@ -77,6 +76,9 @@ class DocumentService(
 
     _draft_cls = DocumentDraft
     _resource_cls = Document
+    _field_projection = True
+    _id_filters = True
+    _id_ordering = True
 
     @asynccontextmanager
     async def filter(self, **kwargs: Unpack[DocumentFilters]) -> AsyncGenerator[Self]:
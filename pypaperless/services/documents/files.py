@@ -4,6 +4,7 @@ from typing import Any, ClassVar
 
 from pypaperless.const import EndpointPath, PaperlessResource
 from pypaperless.models.documents.document import DownloadedDocument, FileRetrieveMode
+from pypaperless.rate_limit import RequestKind
 from pypaperless.services.base import ResourceService
 
 
@@ -23,7 +24,7 @@ class _DocumentFileServiceBase(ResourceService):
         }
 
         res = await self._runtime.transport.request_raw(
-            "get", self._api_path.format(pk=pk), params=params
+            "get", self._api_path.format(pk=pk), params=params, kind=RequestKind.DOWNLOAD
         )
         self._runtime.transport.raise_for_status(res)
 
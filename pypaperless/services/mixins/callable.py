@@ -1,8 +1,7 @@
 """CallableService for PyPaperless services."""
 
-from typing import Any
-
 from pypaperless.models.base import ResourceT
+from pypaperless.rate_limit import RequestKind
 from pypaperless.services.base import ResourceServiceProtocol
 
 
@@ -14,13 +13,18 @@ class CallableService(ResourceServiceProtocol[ResourceT]):
         pk: int,
         *,
         lazy: bool = False,
+        fields: list[str] | None = None,
+        truncate_content: bool = False,
     ) -> ResourceT:
         """Request exactly one resource item by primary key.
 
         Args:
-            pk:   Primary key of the resource item to retrieve.
-            lazy: When ``True``, return a model instance without hitting the
-                  API — only the ``id`` field is populated.
+            pk:               Primary key of the resource item to retrieve.
+            lazy:             When ``True``, return a model instance without hitting
+                              the API — only the ``id`` field is populated.
+            fields:           Request only these API fields; all others keep their
+                              defaults.  Documents only.
+            truncate_content: Request a shortened ``content``.  Documents only.
 
         Example::
 
@@ -30,15 +34,21 @@ class CallableService(ResourceServiceProtocol[ResourceT]):
             # initialise a stub without network access
             document = await paperless.documents(42, lazy=True)
 
+            # fetch only what is needed
+            document = await paperless.documents(42, fields=["title", "tags"])
+
         """
         if lazy:
             return self._resource_cls.from_data(self._runtime, {"id": pk})
 
-        params: dict[str, Any] = {}
+        params = self._projection_params(fields, truncate_content=truncate_content)
         if getattr(self, "request_permissions", False):
             params["full_perms"] = "true"
 
         api_path = self._resource_cls.format_api_path(pk=pk)
-        data = await self._runtime.transport.get(api_path, params=params or None)
+        data = await self._runtime.transport.get(
+            api_path, params=params or None, kind=RequestKind.ITEM
+        )
 
-        return self._resource_cls.from_data(self._runtime, data)
+        partial = fields is not None or truncate_content
+        return self._resource_cls.from_data(self._runtime, data, partial=partial)
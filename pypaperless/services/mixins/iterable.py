@@ -1,14 +1,27 @@
 """IterableService for PyPaperless services."""
 
-from collections.abc import AsyncGenerator, AsyncIterator, Mapping
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Mapping
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
+from itertools import chain, islice
 from types import MappingProxyType
-from typing import Any, Self, TypedDict, Unpack
+from typing import Any, ClassVar, NamedTuple, Self, TypedDict, Unpack
 
 from pypaperless.models.base import IdentifiedT
-from pypaperless.pagination import PageGenerator
+from pypaperless.page_size import AdaptivePageSize
+from pypaperless.pagination import (
+    _LIST_FILTER_SUFFIXES,
+    Page,
+    PageCheckpoint,
+    PageGenerator,
+    _split_list_filter,
+)
 from pypaperless.services.base import ResourceServiceProtocol
+from pypaperless.streaming import ItemStream
+
+_LOGGER = logging.getLogger(__package__)
 
 # Task-local query filters, keyed by service identity.  Values are immutable
 # mappings that are replaced (never mutated) on entry and restored via token
@@ -19,6 +32,32 @@ _SCOPED_FILTERS: ContextVar[Mapping[int, dict[str, Any]]] = ContextVar(
 )
 
 
+class MapResult[ItemT, ResultT](NamedTuple):
+    """Outcome of one item of :meth:`IterableService.map_concurrent`.
+
+    Holds the *result* of the mapped function, or the *error* it raised.
+    """
+
+    item: ItemT
+    result: ResultT | None = None
+    error: Exception | None = None
+
+
+def _map_result[ItemT, ResultT](
+    item: ItemT, task: "asyncio.Task[ResultT]"
+) -> MapResult[ItemT, ResultT]:
+    """Return the outcome of the finished call *task* for *item*."""
+    if task.cancelled():
+        # CancelledError is no Exception; report the call like a failed one
+        return MapResult(item, error=RuntimeError("The call was cancelled."))
+    error = task.exception()
+    if error is None:
+        return MapResult(item, task.result())
+    if not isinstance(error, Exception):
+        raise error
+    return MapResult(item, error=error)
+
+
 class _BaseFilters(TypedDict, total=False):
     """Empty base TypedDict used by IterableService.filter().
 
@@ -32,20 +71,74 @@ class _BaseFilters(TypedDict, total=False):
 class IterableService(ResourceServiceProtocol[IdentifiedT]):
     """Provide methods for iterating over resource items."""
 
-    async def __aiter__(self) -> AsyncIterator[IdentifiedT]:
+    # whether the endpoint filters by ``id__in``, which pins snapshots in pages()
+    _id_filters: ClassVar[bool] = False
+    # whether the endpoint honours ``ordering=id``; DRF silently drops fields it does not list
+    _id_ordering: ClassVar[bool] = False
+
+    async def __aiter__(self) -> AsyncGenerator[IdentifiedT]:
         """Iterate over all resource items, page by page.
 
+        List filters too long for one URL are split into several queries,
+        which run concurrently; their items are merged without duplicates,
+        in the order they arrive.
+
         Example::
 
             async for item in paperless.documents:
                 print(item.title)
 
         """
+        scan = self._scan()
+        try:
+            async for page, indices in scan:
+                for index in indices:
+                    yield page.items[index]
+        finally:
+            await scan.aclose()
+
+    async def iter_raw(self) -> AsyncGenerator[dict[str, Any]]:
+        """Iterate over all resource items as the plain dicts of the API response.
+
+        Like :meth:`__aiter__`, including filters, ``full_perms`` and split
+        list filters, but no model is ever built: the dicts are passed on as
+        they were decoded.  Use it where items are re-serialized right away.
+        The dicts are shared with the page they came from; copy before mutating.
+
+        Example::
+
+            async with paperless.documents.filter(fields=["title", "content"]) as docs:
+                async for data in docs.iter_raw():
+                    await export.send(json.dumps(data))
+
+        """
+        scan = self._scan()
+        try:
+            async for page, indices in scan:
+                for index in indices:
+                    yield page.results[index]
+        finally:
+            await scan.aclose()
+
+    async def _scan(self) -> AsyncGenerator[tuple[Page[IdentifiedT], Iterable[int]]]:
+        """Iterate over the pages of the current listing, with the indices of their new items.
+
+        List filters too long for one URL are split and merged, see :meth:`_merged`.
+        """
+        queries = await self._split_queries()
+        if queries is not None:
+            merged = self._merged(queries)
+            try:
+                async for batch in merged:
+                    yield batch
+            finally:
+                await merged.aclose()
+            return
+
         pages = self.pages()
         try:
             async for page in pages:
-                for item in page:
-                    yield item
+                yield page, range(len(page.results))
         finally:
             await pages.aclose()
 
@@ -118,10 +211,367 @@ class IterableService(ResourceServiceProtocol[IdentifiedT]):
         """
         return [item async for item in self]
 
+    async def limit(self, n: int) -> AsyncGenerator[IdentifiedT]:
+        """Iterate over the first *n* resource items.
+
+        The first request asks for exactly *n* items, and further pages are
+        only requested if the server returned fewer, so nothing is fetched
+        beyond the limit.  Combine it with ``ordering`` in a :meth:`filter`
+        context for top-k queries.  A list filter split into several queries
+        (see :meth:`__aiter__`) has no global order, so it cannot be combined
+        with ``ordering`` and raises :exc:`ValueError`.
+
+        Example::
+
+            async with paperless.documents.filter(
+                ordering="-modified", document_type__id=3
+            ) as invoices:
+                async for doc in invoices.limit(20):
+                    print(doc.title)
+
+        """
+        if n < 1:
+            msg = "n must be a positive integer."
+            raise ValueError(msg)
+
+        queries = await self._split_queries()
+        if queries is not None:
+            if len(queries) > 1 and "ordering" in self._query_params():
+                msg = (
+                    "The ordering cannot be kept across a list filter split into several "
+                    "queries; shorten the filter or raise max_url_length."
+                )
+                raise ValueError(msg)
+            # the merged stream has no global order, so any n items will do
+            merged = self._merged(queries)
+            try:
+                async for page, indices in merged:
+                    for index in indices:
+                        yield page.items[index]
+                        n -= 1
+                        if not n:
+                            return
+            finally:
+                await merged.aclose()
+            return
+
+        pages = self.pages(prefetch=0)
+        pages.params["page_size"] = n
+        remaining = n
+        try:
+            async for page in pages:
+                for item in islice(page, remaining):
+                    yield item
+                    remaining -= 1
+                if not remaining:
+                    return
+        finally:
+            await pages.aclose()
+
+    async def batched(self, n: int) -> AsyncGenerator[list[IdentifiedT]]:
+        """Iterate over all resource items in lists of *n*; the last one may be shorter.
+
+        Items are taken from the listing only as the batches are consumed, so
+        no more than one batch and the read-ahead pages are held at a time.
+
+        Example::
+
+            async with paperless.documents.filter(is_in_inbox=True) as inbox:
+                async for batch in inbox.batched(50):
+                    await store(batch)
+
+        """
+        if n < 1:
+            msg = "n must be a positive integer."
+            raise ValueError(msg)
+
+        items = self.__aiter__()
+        batch: list[IdentifiedT] = []
+        try:
+            async for item in items:
+                batch.append(item)
+                if len(batch) == n:
+                    yield batch
+                    batch = []
+        finally:
+            await items.aclose()
+        if batch:
+            yield batch
+
+    async def map_concurrent[ResultT](
+        self,
+        fn: Callable[[IdentifiedT], Awaitable[ResultT]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = False,
+    ) -> AsyncGenerator[MapResult[IdentifiedT, ResultT]]:
+        """Call *fn* for every resource item, up to *concurrency* calls at a time.
+
+        Yields a :class:`MapResult` per item as soon as its call finished, or
+        in item order with *ordered*.  An exception raised by *fn* is reported
+        as the ``error`` of its item and does not stop the others.  A further
+        item is only taken from the listing when a call finished and its result
+        was consumed, so a slow consumer holds back both the calls and the
+        page requests.  Abandoning the iteration cancels the running calls.
+
+        Args:
+            fn:          Async function called with each item.
+            concurrency: Calls running at the same time.
+            ordered:     Yield the results in item order; otherwise as they finish.
+
+        Example::
+
+            async with paperless.documents.filter(tags__id=7) as tagged:
+                async for outcome in tagged.map_concurrent(fetch_notes, concurrency=8):
+                    if outcome.error is not None:
+                        print(f"{outcome.item.id} failed: {outcome.error}")
+
+        """
+        if concurrency < 1:
+            msg = "concurrency must be a positive integer."
+            raise ValueError(msg)
+
+        items = self.__aiter__()
+        # insertion-ordered, so the first call is the oldest one
+        running: dict[asyncio.Task[ResultT], IdentifiedT] = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(running) < concurrency:
+                    item = await anext(items, None)
+                    if item is None:
+                        exhausted = True
+                    else:
+                        running[asyncio.ensure_future(fn(item))] = item
+                if not running:
+                    return
+
+                wait_for = [next(iter(running))] if ordered else list(running)
+                done, _ = await asyncio.wait(wait_for, return_when=asyncio.FIRST_COMPLETED)
+                for task in [task for task in running if task in done]:
+                    yield _map_result(running.pop(task), task)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            await items.aclose()
+
+    async def count(self) -> int:
+        """Return the number of resource items.
+
+        Requests a single item; within a :meth:`filter` context, only filtered
+        items are counted.
+
+        Example::
+
+            async with paperless.documents.filter(is_in_inbox=True) as inbox:
+                print(await inbox.count())
+
+        """
+        queries = await self._split_queries()
+        if queries is not None:
+            return len(await self._union_ids(queries))
+        return (await self._head()).count
+
+    async def exists(self) -> bool:
+        """Return whether there is at least one resource item.
+
+        Requests a single item; within a :meth:`filter` context, only filtered
+        items are considered.
+
+        Example::
+
+            async with paperless.documents.filter(checksum__iexact=checksum) as docs:
+                if await docs.exists():
+                    ...
+
+        """
+        return await self.count() > 0
+
+    async def first(self) -> IdentifiedT | None:
+        """Return the first resource item, or ``None`` if there is none.
+
+        Requests a single item and honours the ``ordering`` and field projection
+        of the current :meth:`filter` context.  Like :meth:`limit`, it raises
+        :exc:`ValueError` for an ``ordering`` with a list filter too long for
+        one query.
+
+        Example::
+
+            async with paperless.documents.filter(ordering="-added") as docs:
+                newest = await docs.first()
+
+        """
+        items = self.limit(1)
+        try:
+            return await anext(items, None)
+        finally:
+            await items.aclose()
+
+    async def ids(self) -> list[int]:
+        """Return the primary keys of all resource items, without building any models.
+
+        Paperless lists the ids of all matching items with every page, so a
+        single request of one item is enough.  Endpoints without that list are
+        scanned page by page instead.  Within a :meth:`filter` context, only
+        filtered items are included.
+
+        Example::
+
+            async with paperless.documents.filter(tags__id=7) as tagged:
+                await paperless.documents.bulk_edit.remove_tag(await tagged.ids(), 7)
+
+        """
+        queries = await self._split_queries()
+        if queries is not None:
+            return await self._union_ids(queries)
+
+        head = await self._head()
+        if head.all_ids is not None:
+            return head.all_ids
+
+        pages = self.pages(fields=["id"] if self._field_projection else None)
+        try:
+            return [item["id"] async for page in pages for item in page.results]
+        finally:
+            await pages.aclose()
+
+    async def _head(self) -> Page[IdentifiedT]:
+        """Return the first page of the current listing, cut down to one id."""
+        pages = self.pages(prefetch=0, fields=["id"] if self._field_projection else None)
+        pages.params.update(page=1, page_size=1)
+        try:
+            return await anext(pages)
+        finally:
+            await pages.aclose()
+
+    async def _split_queries(self) -> list[dict[str, Any]] | None:
+        """Return the current filters as queries fitting the URL budget, ``None`` if they fit.
+
+        An ``__in`` filter matches any of its values, so its chunks are queried
+        as they are.  ``__all`` and ``__none`` filters must hold for every
+        value: the ids matching each chunk are intersected and queried via
+        ``id__in`` instead.
+        """
+        budget = self._runtime.transport.max_url_length
+        if budget is None:
+            return None
+
+        url = f"{self._runtime.transport.base_url}{self._api_path}"
+        split = _split_list_filter(url, self._query_params(), budget)
+        if split is None:
+            return None
+        key, queries = split
+        if key.endswith("__in"):
+            return queries
+
+        if not self._id_filters:
+            _LOGGER.warning(
+                "%s cannot split %s into several queries; sending it as it is.",
+                type(self).__name__,
+                key,
+            )
+            return None
+        chunk_ids = await asyncio.gather(*(self._ids_matching(query) for query in queries))
+        common = set(chunk_ids[0]).intersection(*chunk_ids[1:])
+        if not common:
+            return []
+
+        rest = {name: value for name, value in queries[0].items() if name != key}
+        rest["id__in"] = ",".join(str(pk) for pk in chunk_ids[0] if pk in common)
+        split = _split_list_filter(url, rest, budget, key="id__in")
+        return [rest] if split is None else split[1]
+
+    async def _ids_matching(self, query: dict[str, Any]) -> list[int]:
+        """Return the ids of all items matching the filters *query*."""
+        async with self._store_filters(**query):
+            return await self.ids()
+
+    async def _union_ids(self, queries: list[dict[str, Any]]) -> list[int]:
+        """Return the ids matching any of *queries*, without duplicates."""
+        chunk_ids = await asyncio.gather(*(self._ids_matching(query) for query in queries))
+        return list(dict.fromkeys(chain.from_iterable(chunk_ids)))
+
+    async def _merged(
+        self, queries: list[dict[str, Any]]
+    ) -> AsyncGenerator[tuple[Page[IdentifiedT], list[int]]]:
+        """Iterate over the pages of all *queries* as they arrive.
+
+        Every page comes with the indices of its items not seen on an earlier
+        page, so duplicates are skipped before they are built.  Up to
+        ``max_concurrency`` queries of the transport run at the same time.
+        """
+        width = min(self._runtime.transport.max_concurrency or len(queries), len(queries))
+        pending = iter(queries)
+        # one slot per worker, so workers pause while the consumer lags behind
+        buffer: asyncio.Queue[Page[IdentifiedT] | Exception | None] = asyncio.Queue(width)
+
+        async def work() -> None:
+            try:
+                for query in pending:
+                    async with self._store_filters(**query):
+                        pages = self.pages()
+                    try:
+                        async for page in pages:
+                            await buffer.put(page)
+                    finally:
+                        await pages.aclose()
+            except Exception as err:  # noqa: BLE001 - raised by the consumer
+                await buffer.put(err)
+            else:
+                await buffer.put(None)
+
+        workers = [asyncio.ensure_future(work()) for _ in range(width)]
+        seen: set[int] = set()
+        try:
+            while width:
+                page = await buffer.get()
+                if page is None:
+                    width -= 1
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+                indices = []
+                for index, data in enumerate(page.results):
+                    if data["id"] not in seen:
+                        seen.add(data["id"])
+                        indices.append(index)
+                yield page, indices
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _query_params(self) -> dict[str, Any]:
+        """Return the query params of the current :meth:`filter` context."""
+        params: dict[str, Any] = dict(_SCOPED_FILTERS.get().get(id(self), {}))
+
+        for param, value in params.items():
+            # Paperless expects comma-separated values; a plain list would be sent as
+            # repeated query params, of which Django only reads the last one.
+            if (param == "ordering" or param.endswith(_LIST_FILTER_SUFFIXES)) and isinstance(
+                value, list
+            ):
+                params[param] = ",".join(map(str, value))
+
+        # set requesting full permissions
+        if getattr(self, "request_permissions", False):
+            params.update({"full_perms": "true"})
+
+        return params
+
     def pages(
         self,
         page: int = 1,
         page_size: int = 150,
+        *,
+        prefetch: int = 1,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        adaptive: AdaptivePageSize | None = None,
+        keyset: bool = False,
+        fields: list[str] | None = None,
+        truncate_content: bool = False,
     ) -> PageGenerator[IdentifiedT]:
         """Iterate over resource pages.
 
@@ -129,9 +579,33 @@ class IterableService(ResourceServiceProtocol[IdentifiedT]):
         *page_size* items.  Use within a :meth:`filter` context to apply
         server-side filters.
 
+        With *concurrency*, all pages after the first one are requested by
+        number, up to *concurrency* at a time.  Where the endpoint supports it,
+        they are pinned to the ids listed by the first page, so items added
+        during the scan do not shift the page offsets.
+
         Args:
-            page:      Page number to start from (1-based).
-            page_size: Maximum number of items per page.
+            page:             Page number to start from (1-based).
+            page_size:        Maximum number of items per page.
+            prefetch:         Pages requested ahead of the one being consumed, ``0`` to
+                              request every page on demand.
+            concurrency:      Pages requested at the same time, ``None`` (default)
+                              to follow the ``next`` links one by one.
+            ordered:          Yield pages in page order; ``False`` yields them as
+                              they arrive.  Only applies with *concurrency*.
+            adaptive:         An :class:`~pypaperless.page_size.AdaptivePageSize` to grow
+                              or shrink the page size between requests; *page_size*
+                              is the starting hint.  Cannot be combined with
+                              *concurrency*.
+            keyset:           Request every page after the first one by its ids instead
+                              of its page number, so late pages are as fast as early
+                              ones.  Documents are ordered by ``id``, other resources
+                              keep their ordering.  Requires an endpoint filtering by
+                              ``id__in``.
+            fields:           Request only these API fields of every item; all others
+                              keep their defaults.  Documents only.
+            truncate_content: Request a shortened ``content`` of every item.
+                              Documents only.
 
         Example::
 
@@ -140,20 +614,150 @@ class IterableService(ResourceServiceProtocol[IdentifiedT]):
                 for doc in page:
                     print(doc.title)
 
+            async for page in paperless.documents.pages(concurrency=8, ordered=False):
+                await store(page.items)
+
+            async for page in paperless.documents.pages(keyset=True):
+                ...
+
+            async for page in paperless.documents.pages(fields=["title", "tags"]):
+                ...
+
         """
-        params: dict[str, Any] = dict(_SCOPED_FILTERS.get().get(id(self), {}))
+        params, partial = self._listing_params(
+            page, page_size, fields, truncate_content=truncate_content
+        )
+
+        if keyset:
+            if not self._id_filters:
+                msg = f"{type(self).__name__} does not support keyset iteration."
+                raise ValueError(msg)
+            if adaptive is not None:
+                msg = "Keyset iteration cannot be combined with adaptive page sizes."
+                raise ValueError(msg)
+            # the id list of the first page pins every further page, see PageGenerator
+            if self._id_ordering:
+                params["ordering"] = "id"
+            concurrency = concurrency or 1
+
+        return PageGenerator(
+            self._runtime,
+            self._api_path,
+            self._resource_cls,
+            params=params,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+            snapshot=self._id_filters,
+            id_ordering=self._id_ordering,
+            adaptive=adaptive,
+            partial=partial,
+        )
+
+    def resume(
+        self,
+        checkpoint: PageCheckpoint,
+        *,
+        prefetch: int = 1,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        adaptive: AdaptivePageSize | None = None,
+    ) -> PageGenerator[IdentifiedT]:
+        """Continue a page scan from a checkpoint taken by :meth:`PageGenerator.checkpoint`.
 
-        for param, value in params.items():
-            # Paperless expects comma-separated values; a plain list would be sent as
-            # repeated query params, of which Django only reads the last one.
-            if param.endswith(("__in", "__all")) and isinstance(value, list):
-                params[param] = ",".join(map(str, value))
+        The filters, ordering, page size and field projection are those of the
+        checkpoint; the current :meth:`filter` context does not apply.  A
+        checkpoint of a scan that pinned a snapshot resumes with the ids listed
+        now, left out those added after the snapshot.
 
-        params.setdefault("page", page)
-        params.setdefault("page_size", page_size)
+        Args:
+            checkpoint:  The :class:`~pypaperless.models.PageCheckpoint` to continue from.
+            prefetch:    Pages requested ahead of the one being consumed.
+            concurrency: Pages requested at the same time, see :meth:`pages`.
+            ordered:     Yield pages in page order; only applies with *concurrency*.
+            adaptive:    Adapt the page size between requests, see :meth:`pages`.
 
-        # set requesting full permissions
-        if getattr(self, "request_permissions", False):
-            params.update({"full_perms": "true"})
+        Example::
+
+            checkpoint = PageCheckpoint.model_validate_json(state_file.read_text())
+            pages = paperless.documents.resume(checkpoint)
+            async for page in pages:
+                await store(page)
+                state_file.write_text(pages.checkpoint().model_dump_json())
+
+        """
+        if checkpoint.path != self._api_path:
+            msg = f"The checkpoint belongs to {checkpoint.path}, not {self._api_path}."
+            raise ValueError(msg)
+
+        return PageGenerator(
+            self._runtime,
+            self._api_path,
+            self._resource_cls,
+            params=checkpoint.params,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+            snapshot=self._id_filters,
+            id_ordering=self._id_ordering,
+            adaptive=adaptive,
+            partial=checkpoint.partial,
+            resume=checkpoint,
+        )
+
+    def stream(
+        self,
+        page_size: int = 150,
+        *,
+        fields: list[str] | None = None,
+        truncate_content: bool = False,
+    ) -> ItemStream[IdentifiedT]:
+        """Iterate over resource items, parsed while their pages arrive.
+
+        Unlike :meth:`pages`, a page is never held in memory as a whole: each
+        item is decoded and validated as soon as its bytes were received, so
+        the first item is available long before a large page is complete.
+        ``count`` and ``next`` of the current page are exposed as they are
+        received.  Filters are sent as they are, like by :meth:`pages`.
 
-        return PageGenerator(self._runtime, self._api_path, self._resource_cls, params=params)
+        Args:
+            page_size:        Maximum number of items per page.
+            fields:           Request only these API fields of every item; all others
+                              keep their defaults.  Documents only.
+            truncate_content: Request a shortened ``content`` of every item.
+                              Documents only.
+
+        Example::
+
+            items = paperless.documents.stream()
+            try:
+                async for doc in items:
+                    print(f"{doc.title} (1 of {items.count})")
+            finally:
+                await items.aclose()
+
+        """
+        params, partial = self._listing_params(
+            1, page_size, fields, truncate_content=truncate_content
+        )
+        return ItemStream(
+            self._runtime, self._api_path, self._resource_cls, params=params, partial=partial
+        )
+
+    def _listing_params(
+        self, page: int, page_size: int, fields: list[str] | None, *, truncate_content: bool
+    ) -> tuple[dict[str, Any], bool]:
+        """Return the params of a listing request, and whether its items are partial."""
+        params = self._query_params()
+
+        # a projection may also come from filter(), given as a list or comma-separated
+        scoped_fields = params.pop("fields", None)
+        if fields is None and scoped_fields is not None:
+            fields = scoped_fields.split(",") if isinstance(scoped_fields, str) else scoped_fields
+        truncate_content = bool(params.pop("truncate_content", False)) or truncate_content
+        projection = self._projection_params(fields, truncate_content=truncate_content)
+
+        params.setdefault("page", page)
+        params.setdefault("page_size", page_size)
+        params.update(projection)
+        return params, bool(projection)
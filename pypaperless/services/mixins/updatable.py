@@ -20,7 +20,9 @@ class UpdatableService(ResourceServiceProtocol[ResourceT]):
             model:        The model instance with modified attributes.
             only_changed: When ``True`` (default), only changed fields are sent
                           via ``PATCH``.  Set to ``False`` to replace the full
-                          resource via ``PUT``.
+                          resource via ``PUT``, which partial models (see
+                          :attr:`~pypaperless.models.base.PaperlessModel.fetched_fields`)
+                          refuse with :class:`ValueError`.
 
         Example::
 
@@ -64,13 +66,23 @@ class UpdatableService(ResourceServiceProtocol[ResourceT]):
         self, model: ResourceT, params: dict[str, Any]
     ) -> dict[str, Any] | None:
         """Use the http `PATCH` method for updating only changed fields."""
+        dump = model.api_dump()
         snapshot = model.snapshot
         changed: dict[str, Any] = {
-            key: value
-            for key, value in model.api_dump().items()
-            if key in snapshot and value != snapshot[key]
+            key: value for key, value in dump.items() if key in snapshot and value != snapshot[key]
         }
 
+        fetched = model.fetched_fields
+        if fetched is not None:
+            # fields left out of a partial payload are sent once assigned, and only then
+            fields = type(model).model_fields
+            assigned = {fields[name].alias or name for name in model.model_fields_set}
+            changed = {
+                key: value
+                for key, value in dump.items()
+                if key in (changed if key in fetched else assigned)
+            }
+
         if not changed:
             return None
 
@@ -87,6 +99,10 @@ class UpdatableService(ResourceServiceProtocol[ResourceT]):
 
     async def _put_fields(self, model: ResourceT, params: dict[str, Any]) -> dict[str, Any]:
         """Use the http `PUT` method to replace all fields."""
+        if model.fetched_fields is not None:
+            msg = "Partial models cannot replace all fields; use only_changed=True."
+            raise ValueError(msg)
+
         data = model.api_dump()
 
         self._check_permissions_field(model, data)
@@ -28,6 +28,7 @@ class StoragePathService(
 
     _draft_cls = StoragePathDraft
     _resource_cls = StoragePath
+    _id_filters = True
 
     @asynccontextmanager
     async def filter(self, **kwargs: Unpack[StoragePathFilters]) -> AsyncGenerator[Self]:
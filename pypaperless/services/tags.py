@@ -28,6 +28,7 @@ class TagService(
 
     _draft_cls = TagDraft
     _resource_cls = Tag
+    _id_filters = True
 
     @asynccontextmanager
     async def filter(self, **kwargs: Unpack[TagFilters]) -> AsyncGenerator[Self]:
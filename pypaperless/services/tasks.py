@@ -60,7 +60,7 @@ class TaskService(
             res = await self._runtime.transport.get(self._api_path, params=params)
             results: list[dict[str, object]] = res.get("results", [])
             try:
-                return self._resource_cls.from_data(self._runtime, results.pop())
+                return self._resource_cls.from_data(self._runtime, results[-1])
             except IndexError as exc:
                 raise TaskNotFoundError(task_id) from exc
         else:
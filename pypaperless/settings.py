@@ -1,9 +1,24 @@
 """PyPaperless client configuration."""
 
-from pydantic import SecretStr, model_validator
+from pydantic import PositiveFloat, PositiveInt, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from .const import ENV_PREFIX, ENV_URL
+from .circuit_breaker import CircuitBreakerPolicy
+from .const import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_MAX_URL_LENGTH,
+    DEFAULT_TIMEOUT,
+    ENV_PREFIX,
+    ENV_URL,
+)
+from .hedging import HedgePolicy
+from .http_cache import HttpCachePolicy
+from .probe import ProbePolicy
+from .rate_limit import RateLimitPolicy
+from .replicas import ReplicaPolicy
+from .retry import RetryPolicy
 
 
 class PaperlessSettings(BaseSettings):
@@ -11,8 +26,38 @@ class PaperlessSettings(BaseSettings):
 
     All fields can be supplied via environment variables with the ``PYPAPERLESS_`` prefix:
 
-    - ``PYPAPERLESS_URL`` — Paperless-ngx base URL
+    - ``PYPAPERLESS_URL`` — Paperless-ngx base URL, or a JSON list of replica URLs;
+      ``unix:///path/to/socket`` connects to a Unix domain socket
     - ``PYPAPERLESS_TOKEN`` — API token
+    - ``PYPAPERLESS_MAX_CONNECTIONS`` — connection pool size
+    - ``PYPAPERLESS_MAX_KEEPALIVE_CONNECTIONS`` — idle connections kept alive
+    - ``PYPAPERLESS_KEEPALIVE_EXPIRY`` — idle connection lifetime in seconds
+    - ``PYPAPERLESS_MAX_CONCURRENCY`` — maximum number of in-flight requests
+    - ``PYPAPERLESS_POOL_TIMEOUT`` — seconds to wait for a free pool connection
+    - ``PYPAPERLESS_RETRY`` — a JSON-encoded :class:`~pypaperless.retry.RetryPolicy`,
+      or its single fields, e.g. ``PYPAPERLESS_RETRY__MAX_ATTEMPTS``
+    - ``PYPAPERLESS_HTTP2`` — negotiate HTTP/2 (requires the ``http2`` extra)
+    - ``PYPAPERLESS_COALESCE_REQUESTS`` — share concurrent identical GET requests
+    - ``PYPAPERLESS_HTTP_CACHE`` — a JSON-encoded
+      :class:`~pypaperless.http_cache.HttpCachePolicy`, or its single fields,
+      e.g. ``PYPAPERLESS_HTTP_CACHE__MAX_ENTRIES``
+    - ``PYPAPERLESS_PROBE`` — a JSON-encoded :class:`~pypaperless.probe.ProbePolicy`,
+      or its single fields, e.g. ``PYPAPERLESS_PROBE__MODE=head``
+    - ``PYPAPERLESS_COMPRESSION`` — accepted response encodings as a JSON list,
+      e.g. ``["gzip"]``; ``[]`` disables compression
+    - ``PYPAPERLESS_RATE_LIMIT`` — a JSON-encoded
+      :class:`~pypaperless.rate_limit.RateLimitPolicy`, or its single fields,
+      e.g. ``PYPAPERLESS_RATE_LIMIT__LISTING__RATE=5``
+    - ``PYPAPERLESS_CIRCUIT_BREAKER`` — a JSON-encoded
+      :class:`~pypaperless.circuit_breaker.CircuitBreakerPolicy`, or its single
+      fields, e.g. ``PYPAPERLESS_CIRCUIT_BREAKER__FAILURE_THRESHOLD=3``
+    - ``PYPAPERLESS_HEDGE`` — a JSON-encoded :class:`~pypaperless.hedging.HedgePolicy`,
+      or its single fields, e.g. ``PYPAPERLESS_HEDGE__DELAY=0.25``
+    - ``PYPAPERLESS_REPLICAS`` — a JSON-encoded :class:`~pypaperless.replicas.ReplicaPolicy`,
+      or its single fields, e.g. ``PYPAPERLESS_REPLICAS__STRATEGY=ewma``
+    - ``PYPAPERLESS_UDS`` — path of a Unix domain socket to connect to instead of TCP
+    - ``PYPAPERLESS_MAX_URL_LENGTH`` — longest request URL listings may build before
+      splitting list filters into several queries
 
     The token is held as a :class:`pydantic.SecretStr`, so it never appears
     in ``repr()``, logs, or tracebacks. Use ``token.get_secret_value()`` to
@@ -32,11 +77,29 @@ class PaperlessSettings(BaseSettings):
             ...
     """
 
-    model_config = SettingsConfigDict(env_prefix=ENV_PREFIX)
+    model_config = SettingsConfigDict(env_prefix=ENV_PREFIX, env_nested_delimiter="__")
 
-    url: str = ""
+    url: str | list[str] = ""
     token: SecretStr | None = None
 
+    max_connections: PositiveInt | None = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: PositiveInt | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: PositiveFloat | None = DEFAULT_KEEPALIVE_EXPIRY
+    max_concurrency: PositiveInt | None = None
+    pool_timeout: PositiveFloat | None = DEFAULT_TIMEOUT
+    retry: RetryPolicy | None = None
+    http2: bool = False
+    coalesce_requests: bool = False
+    http_cache: HttpCachePolicy | None = None
+    probe: ProbePolicy | None = None
+    compression: list[str] | None = None
+    rate_limit: RateLimitPolicy | None = None
+    circuit_breaker: CircuitBreakerPolicy | None = None
+    hedge: HedgePolicy | None = None
+    replicas: ReplicaPolicy | None = None
+    uds: str | None = None
+    max_url_length: PositiveInt | None = DEFAULT_MAX_URL_LENGTH
+
     @model_validator(mode="after")
     def _require_url(self) -> "PaperlessSettings":
         if not self.url:
@@ -0,0 +1,291 @@
+"""Provide incremental parsing of paginated list responses."""
+
+import re
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+from json import loads
+from typing import TYPE_CHECKING, Any
+
+from pypaperless.rate_limit import RequestKind
+
+if TYPE_CHECKING:
+    from pypaperless.models.base import PaperlessModel
+    from pypaperless.runtime import PaperlessRuntime
+
+# bytes that change the nesting of a JSON value; UTF-8 never uses them within a multi-byte sequence
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+_STRING_END = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[,}\]\s]")
+_NON_SPACE = re.compile(rb"\S")
+
+_BACKSLASH = ord("\\")
+_QUOTE = ord('"')
+_OPEN_ARRAY = ord("[")
+
+# punctuation of the envelope: (state, byte) -> next state
+_TRANSITIONS = {
+    ("start", ord("{")): "key",
+    ("key", ord("}")): "end",
+    ("key", ord(",")): "key",
+    ("colon", ord(":")): "value",
+    ("items", ord(",")): "items",
+    ("items", ord("]")): "key",
+}
+
+
+class ListingParser:
+    """Parse a paginated list response incrementally, one result item at a time.
+
+    The body is fed in chunks as it arrives.  Every call to :meth:`feed`
+    returns the entries of ``results`` completed by the chunk, each decoded on
+    its own, and the envelope fields seen so far - ``count``, ``next``,
+    ``previous`` and ``all`` - are collected in :attr:`fields`.  Only the
+    item being received is buffered, never the whole page.
+
+    Example::
+
+        parser = ListingParser()
+        async for chunk in body:
+            for data in parser.feed(chunk):
+                print(parser.fields.get("count"), data["id"])
+        parser.close()
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize a :class:`ListingParser` instance."""
+        self.fields: dict[str, Any] = {}
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = "start"
+        self._key = ""
+
+        # scan state of the value being received, resumed with every chunk
+        self._start = -1
+        self._scan = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        """Add *chunk* of the body; return the result items it completed."""
+        self._buffer += chunk
+        items: list[dict[str, Any]] = []
+        while self._step(items):
+            pass
+
+        # drop what was parsed, so the buffer never holds more than one value
+        consumed = self._start if self._start >= 0 else self._pos
+        if consumed:
+            del self._buffer[:consumed]
+            self._pos -= consumed
+            self._scan -= consumed
+            self._start = min(self._start, 0)
+        return items
+
+    def close(self) -> None:
+        """Raise :exc:`ValueError` if the body ended before the response was complete."""
+        if self._state != "end" or _NON_SPACE.search(self._buffer, self._pos):
+            msg = "The list response is incomplete or not a JSON object."
+            raise ValueError(msg)
+
+    def _step(self, items: list[dict[str, Any]]) -> bool:
+        """Advance the parser by one token; return ``False`` when more bytes are needed."""
+        if self._start < 0:
+            match = _NON_SPACE.search(self._buffer, self._pos)
+            if match is None:
+                return False
+            self._pos = match.start()
+            token = self._buffer[self._pos]
+
+            state = _TRANSITIONS.get((self._state, token))
+            if self._state == "value" and self._key == "results" and token == _OPEN_ARRAY:
+                state = "items"
+            if state is not None:
+                self._pos += 1
+                self._state = state
+                return True
+            if self._state not in {"key", "value", "items"}:
+                msg = f"Unexpected byte {bytes([token])!r} in the list response."
+                raise ValueError(msg)
+
+        value = self._scan_value()
+        if value is None:
+            return False
+        if self._state == "key":
+            self._key = loads(value)
+            self._state = "colon"
+        elif self._state == "value":
+            self.fields[self._key] = loads(value)
+            self._state = "key"
+        else:
+            items.append(loads(value))
+        return True
+
+    def _scan_value(self) -> bytes | None:
+        """Return the JSON value starting at the current position, ``None`` if incomplete."""
+        if self._start < 0:
+            self._start = self._scan = self._pos
+            self._in_string = False
+            # a negative depth marks a number or literal, which ends at a delimiter
+            self._depth = 0 if self._buffer[self._pos] in b'{["' else -1
+
+        end = self._scan_scalar() if self._depth < 0 else self._scan_nested()
+        if end is None:
+            return None
+        value = bytes(self._buffer[self._start : end])
+        self._pos = end
+        self._start = -1
+        return value
+
+    def _scan_scalar(self) -> int | None:
+        """Return the end of the number or literal being scanned, ``None`` if incomplete."""
+        match = _SCALAR_END.search(self._buffer, self._scan)
+        if match is None:
+            self._scan = len(self._buffer)
+            return None
+        return match.start()
+
+    def _scan_nested(self) -> int | None:
+        """Return the end of the string, object or array being scanned, ``None`` if incomplete."""
+        buffer = self._buffer
+        pos = self._scan
+        while True:
+            match = (_STRING_END if self._in_string else _STRUCTURE).search(buffer, pos)
+            if match is None:
+                self._scan = len(buffer)
+                return None
+            byte = buffer[match.start()]
+            pos = match.end()
+            if byte == _BACKSLASH:
+                if pos >= len(buffer):
+                    # resume at the backslash, the byte it escapes is still missing
+                    self._scan = match.start()
+                    return None
+                pos += 1
+            elif byte == _QUOTE:
+                self._in_string = not self._in_string
+            elif byte in b"{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+            if not self._depth and not self._in_string:
+                return pos
+
+
+class ItemStream[ResourceT: "PaperlessModel"](AsyncIterator[ResourceT]):
+    """Async iterator over the items of a listing, parsed while the pages arrive.
+
+    Used internally by :meth:`~pypaperless.services.mixins.iterable.IterableService.stream`.
+    Every page is requested as a stream and decoded with a
+    :class:`ListingParser`, so the first item is yielded while the rest of
+    its page is still on the wire, and a page is never held in memory as a
+    whole.  The pages are requested one after another, following ``next``.
+
+    The envelope fields of the current page are available as soon as they
+    were received, which Paperless sends ahead of the results: read
+    :attr:`count` after the first item to learn the total.
+
+    Args:
+        runtime:      A :class:`~pypaperless.runtime.PaperlessRuntime` instance.
+        url:          The API endpoint URL returning paginated results.
+        resource_cls: The model class used to map raw result dicts.
+        params:       Optional query string parameters.
+        partial:      The params request a field projection or truncated
+                      content; the items are built as partial models.
+
+    """
+
+    def __init__(
+        self,
+        runtime: "PaperlessRuntime",
+        url: str,
+        resource_cls: type[ResourceT],
+        params: dict[str, Any] | None = None,
+        *,
+        partial: bool = False,
+    ) -> None:
+        """Initialize an :class:`ItemStream` instance."""
+        self._runtime = runtime
+        self._resource_cls = resource_cls
+        self._url = url
+        self._partial = partial
+
+        self.params = dict(params) if params else {}
+        self.params.setdefault("page", 1)
+        self.params.setdefault("page_size", 150)
+
+        self.count: int | None = None
+        self.next: str | None = None
+        self.previous: str | None = None
+        self.all_ids: list[int] | None = None
+
+        self._started = False
+        self._items: deque[ResourceT] = deque()
+        self._response = AsyncExitStack()
+        self._body: AsyncIterator[bytes] | None = None
+        self._parser = ListingParser()
+
+    def __aiter__(self) -> "ItemStream[ResourceT]":
+        """Return self as iterator."""
+        return self
+
+    async def __anext__(self) -> ResourceT:
+        """Return the next item, reading the body until one is complete."""
+        while not self._items:
+            body = self._body or await self._open_next()
+            if body is None:
+                raise StopAsyncIteration
+            chunk = await anext(body, None)
+            if chunk is None:
+                self._parser.close()
+                await self._close_page()
+                continue
+
+            for data in self._parser.feed(chunk):
+                self._items.append(
+                    self._resource_cls.from_data(self._runtime, data, partial=self._partial)
+                )
+            self._update_fields()
+        return self._items.popleft()
+
+    async def _open_next(self) -> AsyncIterator[bytes] | None:
+        """Request the next page as a stream; return ``None`` after the last page."""
+        if not self._started:
+            self._started = True
+            stream = self._runtime.transport.stream(
+                self._url, params=self.params, kind=RequestKind.LISTING
+            )
+        elif self.next:
+            stream = self._runtime.transport.stream(self.next, kind=RequestKind.LISTING)
+        else:
+            return None
+        self._parser = ListingParser()
+        self._body = await self._response.enter_async_context(stream)
+        return self._body
+
+    async def _close_page(self) -> None:
+        """Release the response of the page read to its end."""
+        self._update_fields()
+        self.next = self._parser.fields.get("next")
+        self._body = None
+        await self._response.aclose()
+
+    def _update_fields(self) -> None:
+        """Expose the envelope fields of the current page received so far."""
+        fields = self._parser.fields
+        if "count" in fields:
+            self.count = fields["count"]
+        if "all" in fields:
+            self.all_ids = fields["all"]
+        if "next" in fields:
+            self.next = fields["next"]
+            self.previous = fields.get("previous")
+
+    async def aclose(self) -> None:
+        """Close the response being read; call when abandoning iteration early."""
+        self._items.clear()
+        self._body = None
+        self.next = None
+        self._started = True
+        await self._response.aclose()
@@ -1,13 +1,30 @@
 """Provide the HTTP transport layer for PyPaperless."""
 
-from json import JSONDecodeError
-from typing import Any, NamedTuple
+import asyncio
+import importlib.util
+import logging
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from json import JSONDecodeError, loads
+from typing import Any, cast
 
 import httpx
 
-from .const import API_VERSION, EndpointPath
+from .circuit_breaker import CircuitBreaker, CircuitBreakerPolicy
+from .const import (
+    API_VERSION,
+    CONTENT_ENCODINGS,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_MAX_URL_LENGTH,
+    DEFAULT_TIMEOUT,
+    EndpointPath,
+)
 from .exceptions import (
     BadJsonResponseError,
+    CircuitOpenError,
     DeletionError,
     ForbiddenError,
     InactiveOrDeletedError,
@@ -18,14 +35,86 @@ from .exceptions import (
     PaperlessTimeoutError,
     UnexpectedStatusError,
 )
-from .utils import normalize_base_url, process_form_data
+from .hedging import HedgePolicy
+from .http_cache import CacheEntry, CacheKey, HttpCache, HttpCachePolicy
+from .metrics import TransportMetrics, record_response_bytes, record_response_seconds
+from .probe import HostInfo, ProbeMode, ProbePolicy
+from .rate_limit import RateLimitPolicy, RequestKind, TokenBucket
+from .replicas import Replica, ReplicaPolicy, ReplicaSet
+from .retry import RetryPolicy
+from .utils import normalize_base_url, process_form_data, split_unix_socket_url
+
+_LOGGER = logging.getLogger(__package__)
+
+
+def _mark_exception_retrieved(task: "asyncio.Task[Any]") -> None:
+    """Consume a finished task's exception so abandoned requests never warn."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _accept_encoding(compression: Sequence[str] | None) -> str:
+    """Return the ``Accept-Encoding`` header value for the requested encodings."""
+    available = [
+        encoding
+        for encoding, modules in CONTENT_ENCODINGS.items()
+        if not modules or any(importlib.util.find_spec(module) for module in modules)
+    ]
+    if compression is None:
+        return ", ".join(available)
+
+    accepted = []
+    for encoding in compression:
+        if encoding in available:
+            accepted.append(encoding)
+        else:
+            _LOGGER.warning(
+                "Content encoding %r is unknown or its decoder is not installed; ignoring it.",
+                encoding,
+            )
+    return ", ".join(accepted) or "identity"
+
+
+class _InFlightRequest:
+    """A shared GET request and the number of callers awaiting it."""
+
+    def __init__(self, task: "asyncio.Task[Any]") -> None:
+        self.task = task
+        self.waiters = 0
 
 
-class _HostInfo(NamedTuple):
-    """Version metadata returned by :meth:`PaperlessTransport.probe`."""
+class _SlotStream(httpx.AsyncByteStream):
+    """A streamed response body that holds a concurrency slot.
 
-    api_version: int
-    version: str | None
+    Closing the body releases the slot, unless :meth:`hold` handed it over to
+    the caller, which then releases it with :meth:`release`.
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+        self._held = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._held:
+                self.release()
+
+    def hold(self) -> None:
+        """Keep the slot when the body closes, e.g. once it was read to its end."""
+        self._held = True
+
+    def release(self) -> None:
+        """Release the slot; later calls do nothing."""
+        if self._release is not None:
+            self._release()
+            self._release = None
 
 
 class PaperlessTransport:
@@ -35,35 +124,224 @@ class PaperlessTransport:
     :class:`~pypaperless.runtime.PaperlessRuntime`.  Not intended for direct
     instantiation by library consumers.
 
+    The pool settings only shape the internally created :class:`httpx.AsyncClient`;
+    a caller-supplied client keeps its own limits.  *max_concurrency* is enforced
+    by the transport itself, so it applies to every request of every service,
+    regardless of which client is used.
+
     Args:
-        base_url: Hostname, IP-address, or full URL string.
-        token:    API token, or ``None`` for anonymous access.
-        client:   Optional :class:`httpx.AsyncClient` to reuse.
+        base_url:                  Hostname, IP-address, or full URL string, or a sequence
+                                   of them to balance requests across several replicas.
+                                   ``unix:///path/to/socket`` connects to a Unix domain
+                                   socket, see *uds*.
+        token:                     API token, or ``None`` for anonymous access.
+        client:                    Optional :class:`httpx.AsyncClient` to reuse.
+        max_connections:           Maximum number of pooled connections, ``None`` for no limit.
+        max_keepalive_connections: Maximum number of idle keep-alive connections.
+        keepalive_expiry:          Seconds an idle keep-alive connection is kept open.
+        max_concurrency:           Maximum number of requests in flight at the same time,
+                                   ``None`` for no limit.
+        pool_timeout:              Seconds to wait for a free pool connection.
+        retry:                     Optional :class:`~pypaperless.retry.RetryPolicy`;
+                                   ``None`` disables retries.
+        http2:                     Negotiate HTTP/2 for the internally created client.
+                                   Falls back to HTTP/1.1 when ``h2`` is not installed.
+        coalesce_requests:         Let concurrent identical GET requests share one
+                                   round trip and its parsed payload.
+        http_cache:                Optional :class:`~pypaperless.http_cache.HttpCachePolicy`
+                                   enabling conditional GET requests; ``None`` disables it.
+        probe:                     Optional :class:`~pypaperless.probe.ProbePolicy` used by
+                                   :meth:`probe`; ``None`` downloads the schema uncached.
+        compression:               Response content encodings to accept, in order of
+                                   preference.  ``None`` accepts every encoding whose
+                                   decoder is installed, an empty sequence disables
+                                   compression.
+        rate_limit:                Optional :class:`~pypaperless.rate_limit.RateLimitPolicy`
+                                   with token bucket budgets per request kind.
+        circuit_breaker:           Optional
+                                   :class:`~pypaperless.circuit_breaker.CircuitBreakerPolicy`
+                                   to fail fast while Paperless is unavailable.
+        hedge:                     Optional :class:`~pypaperless.hedging.HedgePolicy` to send
+                                   a second GET request when the first one is slow.
+        replicas:                  Optional :class:`~pypaperless.replicas.ReplicaPolicy` used
+                                   when *base_url* lists several replicas.
+        uds:                       Path of a Unix domain socket the internally created client
+                                   connects to instead of TCP.  Scheme-less base URLs then
+                                   default to ``http://``.
+        max_url_length:            Longest request URL that listings may build; longer
+                                   list filters are split into several queries.  ``None``
+                                   disables splitting.
 
     Example::
 
-        transport = PaperlessTransport("localhost:8000", "mytoken")
+        transport = PaperlessTransport("localhost:8000", "mytoken", max_concurrency=16)
         data = await transport.get("/api/documents/")
 
     """
 
     def __init__(
         self,
-        base_url: str,
+        base_url: str | Sequence[str],
         token: str | None,
         client: httpx.AsyncClient | None = None,
+        *,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        max_concurrency: int | None = None,
+        pool_timeout: float | None = DEFAULT_TIMEOUT,
+        retry: RetryPolicy | None = None,
+        http2: bool = False,
+        coalesce_requests: bool = False,
+        http_cache: HttpCachePolicy | None = None,
+        probe: ProbePolicy | None = None,
+        compression: Sequence[str] | None = None,
+        rate_limit: RateLimitPolicy | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        replicas: ReplicaPolicy | None = None,
+        uds: str | None = None,
+        max_url_length: int | None = DEFAULT_MAX_URL_LENGTH,
     ) -> None:
         """Initialize a :class:`PaperlessTransport` instance."""
-        self._base_url = normalize_base_url(base_url)
+        if max_concurrency is not None and max_concurrency < 1:
+            msg = "max_concurrency must be a positive integer or None."
+            raise ValueError(msg)
+        if max_url_length is not None and max_url_length < 1:
+            msg = "max_url_length must be a positive integer or None."
+            raise ValueError(msg)
+
+        if http2 and importlib.util.find_spec("h2") is None:
+            _LOGGER.warning(
+                "HTTP/2 requested, but the optional 'h2' package is not installed; "
+                "falling back to HTTP/1.1. Install 'pypaperless[http2]' to enable it."
+            )
+            http2 = False
+
+        base_urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        if not base_urls:
+            msg = "At least one base URL is required."
+            raise ValueError(msg)
+        if len(base_urls) == 1 and uds is None:
+            base_urls[0], uds = split_unix_socket_url(base_urls[0])
+        if uds is not None and len(base_urls) > 1:
+            msg = "A Unix domain socket cannot be combined with several base URLs."
+            raise ValueError(msg)
+        scheme = "https" if uds is None else "http"
+        self._base_urls = [normalize_base_url(url, default_scheme=scheme) for url in base_urls]
+        self._uds = uds
+        self._base_url = self._base_urls[0]
+        self._replicas = (
+            ReplicaSet(self._base_urls, replicas or ReplicaPolicy())
+            if len(self._base_urls) > 1
+            else None
+        )
         self._token = token
         self._httpx_client = client
         self._owns_client = client is None
 
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = httpx.Timeout(DEFAULT_TIMEOUT, pool=pool_timeout)
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._retry = retry
+        self._http2 = http2
+        self._coalesce_requests = coalesce_requests
+        self._in_flight: dict[tuple[Any, ...], _InFlightRequest] = {}
+        self._http_cache = HttpCache(http_cache) if http_cache else None
+        self._probe = probe or ProbePolicy()
+        self._accept_encoding = _accept_encoding(compression)
+        self._buckets: dict[RequestKind, TokenBucket] = {}
+        if rate_limit is not None:
+            for kind in RequestKind:
+                budget = rate_limit.budget(kind)
+                if budget is not None:
+                    self._buckets[kind] = TokenBucket(budget)
+        self._breaker = CircuitBreaker(circuit_breaker) if circuit_breaker else None
+        self._hedge = hedge
+        self._max_url_length = max_url_length
+
+        self.metrics = TransportMetrics()
+
     @property
     def base_url(self) -> str:
         """Return the base URL of the Paperless API endpoint."""
         return self._base_url
 
+    @property
+    def base_urls(self) -> list[str]:
+        """Return the base URLs of all replicas; the first one is :attr:`base_url`."""
+        return list(self._base_urls)
+
+    @property
+    def replicas(self) -> list[Replica]:
+        """Return the load and health state of every replica, if there are several."""
+        return self._replicas.replicas if self._replicas else []
+
+    @property
+    def max_concurrency(self) -> int | None:
+        """Return the maximum number of in-flight requests, or ``None`` if unbounded."""
+        return self._max_concurrency
+
+    @property
+    def max_url_length(self) -> int | None:
+        """Return the longest request URL listings may build, or ``None`` if unbounded."""
+        return self._max_url_length
+
+    @property
+    def accept_encoding(self) -> str:
+        """Return the ``Accept-Encoding`` header value sent with every request."""
+        return self._accept_encoding
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """Return the :class:`~pypaperless.circuit_breaker.CircuitBreaker`, if enabled."""
+        return self._breaker
+
+    @property
+    def http2(self) -> bool:
+        """Return whether the internally created client negotiates HTTP/2."""
+        return self._http2
+
+    @property
+    def uds(self) -> str | None:
+        """Return the Unix domain socket path of the internally created client, if any."""
+        return self._uds
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the internally owned :class:`httpx.AsyncClient` from the pool settings."""
+        if self._uds is not None:
+            # proxies from the environment would bypass the socket
+            uds_transport = httpx.AsyncHTTPTransport(
+                uds=self._uds, limits=self._limits, http2=self._http2
+            )
+            return httpx.AsyncClient(
+                transport=uds_transport, timeout=self._timeout, trust_env=False
+            )
+        return httpx.AsyncClient(limits=self._limits, timeout=self._timeout, http2=self._http2)
+
+    def _absolute_url(self, path: str) -> str:
+        """Return *path* joined to the base URL, or *path* itself if it is absolute."""
+        return f"{self._base_url}{path}" if not path.startswith("http") else path
+
+    def _request_key(self, path: str, params: dict[str, Any] | None) -> tuple[Any, ...]:
+        """Return the URL without query and the sorted query parameters of a request."""
+        # mirror httpx: given params replace the query string of the URL
+        url = httpx.URL(self._absolute_url(path))
+        if params is not None:
+            url = url.copy_with(params=params)
+        return (str(url.copy_with(query=None)), tuple(sorted(url.params.multi_items())))
+
+    def _request_slot(self) -> AbstractAsyncContextManager[Any]:
+        """Return a context manager that holds one slot of the concurrency budget."""
+        if self._semaphore is None:
+            return nullcontext()
+        return self._semaphore
+
     async def close(self) -> None:
         """Close the :class:`httpx.AsyncClient` if this transport created it.
 
@@ -73,26 +351,322 @@ class PaperlessTransport:
         if self._owns_client and self._httpx_client:
             await self._httpx_client.aclose()
 
-    async def probe(self) -> "_HostInfo":
+    async def probe(self) -> HostInfo:
         """Request the API index and return parsed host version info.
 
         Validates that the response is reachable, returns HTTP 2xx, and
         contains a JSON-parseable body.  Raises on any failure — the caller
         is responsible for wrapping exceptions.
 
+        In :attr:`~pypaperless.probe.ProbeMode.HEAD` mode, a HEAD request to
+        the API root replaces the schema download and no body is parsed.  With
+        a probe cache file configured, a fresh cached result is returned
+        without any request.
+
         Example::
 
             info = await transport.probe()
             print(info.api_version, info.version)
 
         """
-        res = await self.request_raw("get", EndpointPath.INDEX)
-        res.raise_for_status()
-        res.json()
-        return _HostInfo(
+        policy = self._probe
+        # every socket serves http://localhost, so the path tells the hosts apart
+        cache_key = self._base_url if self._uds is None else f"{self._base_url} unix:{self._uds}"
+        if policy.cache_file is not None:
+            cached = await asyncio.to_thread(policy.load, cache_key)
+            if cached is not None:
+                return cached
+
+        if policy.mode is ProbeMode.HEAD:
+            res = await self.request_raw("head", EndpointPath.API_ROOT)
+            res.raise_for_status()
+        else:
+            res = await self.request_raw("get", EndpointPath.INDEX)
+            res.raise_for_status()
+            res.json()
+
+        info = HostInfo(
             api_version=int(res.headers.get("x-api-version", API_VERSION)),
             version=res.headers.get("x-version"),
         )
+        if policy.cache_file is not None:
+            await asyncio.to_thread(policy.store, cache_key, info)
+        return info
+
+    async def _wait_for_rate_limit(self, kind: RequestKind) -> None:
+        """Take a token from the bucket of *kind*, if it is rate limited."""
+        bucket = self._buckets.get(kind)
+        if bucket is None:
+            return
+        waited = await bucket.acquire()
+        if waited:
+            self.metrics.rate_limit_waits[kind] += 1
+            self.metrics.rate_limit_wait_seconds[kind] += waited
+            _LOGGER.debug("Rate limit delayed a %s request by %.3fs.", kind, waited)
+
+    async def _request_once(
+        self, method: str, path: str, kind: RequestKind, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a single request attempt within the breaker, rate and concurrency budgets."""
+        breaker = self._breaker
+        if breaker is None:
+            return await self._request_unguarded(method, path, kind, **kwargs)
+
+        try:
+            trial = breaker.before_request()
+        except CircuitOpenError:
+            self.metrics.circuit_rejected += 1
+            raise
+
+        try:
+            res = await self._request_unguarded(method, path, kind, **kwargs)
+        except PaperlessConnectionError as err:
+            # waiting for a local connection tells nothing about the server's health
+            if not isinstance(err.__cause__, httpx.PoolTimeout):
+                self._record_failure(breaker)
+            elif trial:
+                breaker.release()
+            raise
+        except BaseException:
+            if trial:
+                breaker.release()
+            raise
+
+        if res.status_code in breaker.policy.failure_statuses:
+            self._record_failure(breaker)
+        else:
+            breaker.record_success()
+        return res
+
+    async def _request_hedged(
+        self, policy: HedgePolicy, method: str, path: str, kind: RequestKind, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request attempt, hedged by identical requests while it is slow.
+
+        The first successful response wins and the other requests are cancelled.
+        Failed requests are ignored as long as others are pending; when all of
+        them fail, the first error is raised.
+        """
+        tasks = [asyncio.ensure_future(self._request_once(method, path, kind, **kwargs))]
+        errors: list[BaseException] = []
+        try:
+            while True:
+                pending = [task for task in tasks if not task.done()]
+                if not pending:
+                    raise errors[0]
+                can_hedge = len(tasks) <= policy.max_hedges
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=policy.delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in sorted(done, key=tasks.index):
+                    error = task.exception()
+                    if error is None:
+                        if task is not tasks[0]:
+                            self.metrics.hedge_wins += 1
+                        return task.result()
+                    errors.append(error)
+
+                if not done:
+                    self.metrics.hedges += 1
+                    _LOGGER.debug(
+                        "No answer after %.3fs, hedging %s %s.", policy.delay, method, path
+                    )
+                    tasks.append(
+                        asyncio.ensure_future(self._request_once(method, path, kind, **kwargs))
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+                task.add_done_callback(_mark_exception_retrieved)
+
+    def _record_failure(self, breaker: CircuitBreaker) -> None:
+        """Record a failed request with the circuit breaker; count the breaker opening."""
+        if breaker.record_failure():
+            self.metrics.circuit_opened += 1
+
+    async def _request_unguarded(
+        self, method: str, path: str, kind: RequestKind, *, stream: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a single request attempt within the rate and concurrency budgets.
+
+        With *stream*, the response is returned before its body is read, and
+        it holds its concurrency slot until the response is closed.
+        """
+        if self._httpx_client is None:
+            self._httpx_client = self._create_client()
+        client = self._httpx_client
+
+        # wait for the rate limit first, so waiting never holds a concurrency slot
+        await self._wait_for_rate_limit(kind)
+
+        replica, url = self._route(path)
+        self.metrics.requests += 1
+        try:
+            if stream:
+                res = await self._request_streamed(client, replica, method, url, **kwargs)
+            else:
+                async with self._request_slot():
+                    res = await self._request_replica(client, replica, method, url, **kwargs)
+        except httpx.PoolTimeout as err:
+            message = "Timed out waiting for a free connection from the pool."
+            raise PaperlessTimeoutError(message) from err
+        except httpx.TimeoutException as err:
+            raise PaperlessTimeoutError from err
+        except httpx.TransportError as err:
+            raise PaperlessConnectionError from err
+
+        if not stream:
+            self._count_bytes(res)
+        return res
+
+    async def _request_streamed(
+        self,
+        client: httpx.AsyncClient,
+        replica: Replica | None,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a streamed request; hold its concurrency slot until the response is closed."""
+        semaphore = self._semaphore
+        if semaphore is None:
+            return await self._request_replica(client, replica, method, url, stream=True, **kwargs)
+
+        await semaphore.acquire()
+        try:
+            res = await self._request_replica(client, replica, method, url, stream=True, **kwargs)
+        except BaseException:
+            semaphore.release()
+            raise
+        # an async client always returns an async byte stream
+        res.stream = _SlotStream(cast("httpx.AsyncByteStream", res.stream), semaphore.release)
+        return res
+
+    def _route(self, path: str) -> tuple[Replica | None, str]:
+        """Return the replica to send a request for *path* to, and its absolute URL."""
+        if self._replicas is None:
+            return None, self._absolute_url(path)
+        if path.startswith("http"):
+            # absolute URLs, e.g. pagination links, stay with the replica that issued them
+            return self._replicas.owner(path), path
+        replica = self._replicas.select()
+        return replica, f"{replica.base_url}{path}"
+
+    async def _request_replica(
+        self,
+        client: httpx.AsyncClient,
+        replica: Replica | None,
+        method: str,
+        url: str,
+        *,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request with *client*; track its outcome for *replica*."""
+        replicas = self._replicas
+        if replica is None or replicas is None:
+            return await self._dispatch(client, method, url, stream=stream, **kwargs)
+
+        self.metrics.replica_requests[replica.base_url] += 1
+        replica.outstanding += 1
+        started = time.monotonic()
+        try:
+            res = await self._dispatch(client, method, url, stream=stream, **kwargs)
+        except httpx.PoolTimeout:
+            raise
+        except httpx.TransportError:
+            self._record_replica(replicas, replica, started, failed=True)
+            raise
+        finally:
+            replica.outstanding -= 1
+
+        failed = res.status_code in replicas.policy.failure_statuses
+        self._record_replica(replicas, replica, started, failed=failed)
+        return res
+
+    @staticmethod
+    async def _dispatch(
+        client: httpx.AsyncClient, method: str, url: str, *, stream: bool, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request with *client*; leave the body unread with *stream*."""
+        if not stream:
+            return await client.request(method=method.upper(), url=url, **kwargs)
+        request = client.build_request(method=method.upper(), url=url, **kwargs)
+        return await client.send(request, stream=True)
+
+    def _record_replica(
+        self, replicas: ReplicaSet, replica: Replica, started: float, *, failed: bool
+    ) -> None:
+        """Record a request outcome for *replica*; count ejections."""
+        if replicas.record(replica, time.monotonic() - started, failed=failed):
+            self.metrics.replica_ejections[replica.base_url] += 1
+
+    def _count_bytes(self, res: httpx.Response, decoded: int | None = None) -> None:
+        """Record the wire and decoded body size and the duration of a fully read response.
+
+        Streamed responses pass the *decoded* size of the chunks they yielded.
+        """
+        wire = res.num_bytes_downloaded
+        if decoded is None:
+            decoded = len(res.content)
+        self.metrics.bytes_received += wire
+        self.metrics.bytes_decoded += decoded
+        record_response_bytes(decoded)
+        record_response_seconds(res.elapsed.total_seconds())
+        _LOGGER.debug(
+            "%s %s: HTTP %d, %d bytes on the wire, %d bytes decoded (%s).",
+            res.request.method,
+            res.request.url,
+            res.status_code,
+            wire,
+            decoded,
+            res.headers.get("content-encoding", "identity"),
+        )
+
+    async def _attempt(
+        self, method: str, path: str, kind: RequestKind, **kwargs: Any
+    ) -> httpx.Response:
+        """Send one attempt of a request, hedged if the hedge policy applies to it."""
+        # a streamed response of a losing hedge could not be released reliably
+        hedge = None if kwargs.get("stream") else self._hedge
+        if hedge is not None and hedge.applies(method, kind):
+            return await self._request_hedged(hedge, method, path, kind, **kwargs)
+        return await self._request_once(method, path, kind, **kwargs)
+
+    def _retry_delay(
+        self,
+        policy: RetryPolicy | None,
+        attempt: int,
+        started: float,
+        reason: str,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """Return the delay before the next attempt, or ``None`` when the retry budget is spent."""
+        if policy is None:
+            return None
+
+        delay = policy.backoff(attempt) if retry_after is None else retry_after
+        exhausted = attempt >= policy.max_attempts or delay > policy.backoff_max
+        if policy.max_elapsed is not None:
+            exhausted = exhausted or time.monotonic() - started + delay > policy.max_elapsed
+
+        if exhausted:
+            self.metrics.retries_exhausted += 1
+            _LOGGER.warning("Giving up after %d attempt(s), last failure: %s.", attempt, reason)
+            return None
+
+        self.metrics.retries += 1
+        self.metrics.retry_reasons[reason] += 1
+        _LOGGER.info(
+            "Retrying in %.2fs (attempt %d/%d failed: %s).",
+            delay,
+            attempt,
+            policy.max_attempts,
+            reason,
+        )
+        return delay
 
     async def _send(
         self,
@@ -102,14 +676,15 @@ class PaperlessTransport:
         data: dict[str, Any] | None = None,
         form: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        *,
+        idempotent: bool = False,
+        kind: RequestKind | None = None,
         **kwargs: Any,
     ) -> httpx.Response:
-        """Send an authenticated HTTP request; handle auth, transport errors, and 401/403."""
-        if self._httpx_client is None:
-            self._httpx_client = httpx.AsyncClient()
-
+        """Send an authenticated HTTP request; handle retries, transport errors, and 401/403."""
         headers: dict[str, str] = {
             "Accept": f"application/json; version={API_VERSION}",
+            "Accept-Encoding": self._accept_encoding,
         }
         if self._token:
             headers["Authorization"] = f"Token {self._token}"
@@ -117,27 +692,52 @@ class PaperlessTransport:
         # caller-supplied headers win over the defaults; never mutate the caller's dict
         kwargs["headers"] = {**headers, **kwargs.get("headers", {})}
 
-        files = None
-        if isinstance(form, dict):
-            data, files = process_form_data(form)
+        kind = kind or RequestKind.for_method(method)
 
-        url = f"{self._base_url}{path}" if not path.startswith("http") else path
+        policy = self._retry
+        if policy is not None and not policy.allows(method, idempotent=idempotent):
+            policy = None
 
-        try:
-            res = await self._httpx_client.request(
-                method=method.upper(),
-                url=url,
-                json=json,
-                data=data,
-                files=files,
-                params=params,
-                **kwargs,
-            )
-        except httpx.TimeoutException as err:
-            raise PaperlessTimeoutError from err
-        except httpx.TransportError as err:
-            raise PaperlessConnectionError from err
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            # rebuild the multipart payload per attempt, as sending consumes its file streams
+            files = None
+            if isinstance(form, dict):
+                data, files = process_form_data(form)
 
+            try:
+                res = await self._attempt(
+                    method, path, kind, json=json, data=data, files=files, params=params, **kwargs
+                )
+            except CircuitOpenError:
+                raise
+            except PaperlessConnectionError as err:
+                reason = type(err.__cause__).__name__
+                delay = self._retry_delay(policy, attempt, started, reason)
+                if delay is None:
+                    raise
+            else:
+                if policy is None or res.status_code not in policy.retry_statuses:
+                    break
+                delay = self._retry_delay(
+                    policy, attempt, started, str(res.status_code), policy.retry_after(res)
+                )
+                if delay is None:
+                    break
+                await res.aclose()
+
+            await asyncio.sleep(delay)
+
+        if kwargs.get("stream") and res.status_code in {401, 403}:
+            await res.aread()
+        self._raise_for_auth(res)
+        return res
+
+    @staticmethod
+    def _raise_for_auth(res: httpx.Response) -> None:
+        """Raise a typed auth exception for HTTP 401 and 403 responses."""
         if res.status_code == 401:
             try:
                 error_data = res.json()
@@ -153,8 +753,6 @@ class PaperlessTransport:
         if res.status_code == 403:
             raise ForbiddenError(res)
 
-        return res
-
     @staticmethod
     def raise_for_status(res: httpx.Response) -> None:
         """Raise a typed pypaperless exception for any non-2xx response.
@@ -201,6 +799,7 @@ class PaperlessTransport:
         path: str,
         *,
         params: dict[str, Any] | None = None,
+        kind: RequestKind | None = None,
         **kwargs: Any,
     ) -> Any:
         """Send a GET request and return the parsed JSON response.
@@ -208,14 +807,150 @@ class PaperlessTransport:
         Args:
             path:   API path relative to the base URL, or an absolute URL.
             params: Optional query string parameters.
+            kind:   The :class:`~pypaperless.rate_limit.RequestKind` whose rate
+                    budget the request draws from; defaults to ``ITEM``.
             **kwargs: Forwarded to :meth:`_send`.
 
         Example::
 
             data = await transport.get("/api/documents/", params={"page": 1})
 
+        When request coalescing is enabled, concurrent calls with the same URL
+        and query parameters (and no further *kwargs*) share a single request
+        and receive the **same** parsed payload object, which callers must
+        therefore treat as read-only.
+
         """
-        return self._parse_json(await self._send("get", path, params=params, **kwargs))
+        if kwargs:
+            return self._parse_json(
+                await self._send("get", path, params=params, kind=kind, **kwargs)
+            )
+        if self._coalesce_requests:
+            return await self._get_coalesced(path, params, kind)
+        return await self._get_parsed(path, params, kind)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        kind: RequestKind | None = None,
+    ) -> AsyncGenerator[AsyncIterator[bytes]]:
+        """Send a GET request and yield its JSON body as it arrives, chunk by chunk.
+
+        Retries, rate limits, the circuit breaker and replicas apply like for
+        :meth:`get`, but the request is neither hedged, coalesced nor cached.
+        Error and non-JSON responses are read and raised like by :meth:`get`
+        before the context is entered.  The connection is released when the
+        context exits, whether the body was read to its end or not.
+
+        Args:
+            path:   API path relative to the base URL, or an absolute URL.
+            params: Optional query string parameters.
+            kind:   The :class:`~pypaperless.rate_limit.RequestKind` whose rate
+                    budget the request draws from; defaults to ``ITEM``.
+
+        Example::
+
+            async with transport.stream("/api/documents/", params={"page": 1}) as body:
+                async for chunk in body:
+                    parser.feed(chunk)
+
+        """
+        res = await self._send("get", path, params=params, kind=kind, stream=True)
+        slot = res.stream if isinstance(res.stream, _SlotStream) else None
+        if slot is not None:
+            # httpx closes the body once it was read; keep the slot until the context exits
+            slot.hold()
+        decoded = 0
+
+        async def body() -> AsyncIterator[bytes]:
+            nonlocal decoded
+            async for chunk in res.aiter_bytes():
+                decoded += len(chunk)
+                yield chunk
+
+        try:
+            if not res.is_success or "application/json" not in res.headers.get("content-type", ""):
+                await res.aread()
+                decoded = len(res.content)
+                self._parse_json(res)
+            yield body()
+        finally:
+            await res.aclose()
+            if slot is not None:
+                slot.release()
+            self._count_bytes(res, decoded)
+
+    async def _get_coalesced(
+        self, path: str, params: dict[str, Any] | None, kind: RequestKind | None
+    ) -> Any:
+        """Join an identical in-flight GET request, or start a new one that others may join."""
+        key = self._request_key(path, params)
+
+        flight = self._in_flight.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(self._get_parsed(path, params, kind))
+            flight = self._in_flight[key] = _InFlightRequest(task)
+            task.add_done_callback(lambda _: self._drop_flight(key, flight))
+            task.add_done_callback(_mark_exception_retrieved)
+        else:
+            self.metrics.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            # shield the shared request, so one cancelled caller does not fail the others
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters:
+                # unlist the request right away, so no later caller joins it while it is cancelled
+                self._drop_flight(key, flight)
+                flight.task.cancel()
+
+    def _drop_flight(self, key: tuple[Any, ...], flight: _InFlightRequest) -> None:
+        """Remove *flight* from the in-flight requests, unless a newer one replaced it."""
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
+    async def _get_parsed(
+        self, path: str, params: dict[str, Any] | None, kind: RequestKind | None
+    ) -> Any:
+        """Send a plain GET request and return the parsed JSON response."""
+        if self._http_cache is None:
+            return self._parse_json(await self._send("get", path, params=params, kind=kind))
+        return await self._get_cached(self._http_cache, path, params, kind)
+
+    async def _get_cached(
+        self,
+        cache: HttpCache,
+        path: str,
+        params: dict[str, Any] | None,
+        kind: RequestKind | None,
+    ) -> Any:
+        """Send a conditional GET request; parse the cached body on HTTP 304."""
+        key: CacheKey = (*self._request_key(path, params), self._token)
+        entry = cache.get(key)
+        headers = entry.conditional_headers() if entry else {}
+        if entry:
+            self.metrics.cache_revalidations += 1
+
+        res = await self._send("get", path, params=params, headers=headers, kind=kind)
+        if entry and res.status_code == 304:
+            self.metrics.cache_hits += 1
+            self.metrics.cache_bytes_saved += len(entry.body)
+            # parse the stored bytes per call, so callers never share a payload
+            return loads(entry.body)
+
+        self.metrics.cache_misses += 1
+        payload = self._parse_json(res)
+        fresh = CacheEntry.from_response(res)
+        if fresh is None:
+            cache.discard(key)
+        else:
+            cache.put(key, fresh)
+        return payload
 
     async def post(
         self,
@@ -225,17 +960,20 @@ class PaperlessTransport:
         data: dict[str, Any] | None = None,
         form: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        idempotent: bool = False,
         **kwargs: Any,
     ) -> Any:
         """Send a POST request and return the parsed JSON response.
 
         Args:
-            path:   API path relative to the base URL, or an absolute URL.
-            json:   Dict to send as JSON request body.
-            data:   Dict to send as form-encoded body.
-            form:   Dict converted to multipart form data.
-            params: Optional query string parameters.
-            **kwargs: Forwarded to :meth:`_send`.
+            path:       API path relative to the base URL, or an absolute URL.
+            json:       Dict to send as JSON request body.
+            data:       Dict to send as form-encoded body.
+            form:       Dict converted to multipart form data.
+            params:     Optional query string parameters.
+            idempotent: Mark the request as safe to repeat, so it may be retried
+                        when :attr:`RetryPolicy.retry_idempotent_posts` is enabled.
+            **kwargs:   Forwarded to :meth:`_send`.
 
         Example::
 
@@ -243,7 +981,16 @@ class PaperlessTransport:
 
         """
         return self._parse_json(
-            await self._send("post", path, json=json, data=data, form=form, params=params, **kwargs)
+            await self._send(
+                "post",
+                path,
+                json=json,
+                data=data,
+                form=form,
+                params=params,
+                idempotent=idempotent,
+                **kwargs,
+            )
         )
 
     async def patch(
@@ -331,7 +1078,7 @@ class PaperlessTransport:
         Args:
             method: HTTP method string.
             path:   API path relative to the base URL, or an absolute URL.
-            **kwargs: Forwarded to :meth:`_send`.
+            **kwargs: Forwarded to :meth:`_send`, e.g. ``kind=RequestKind.DOWNLOAD``.
 
         Example::
 
@@ -357,7 +1104,8 @@ async def generate_api_token(
 
     Args:
         url:      Hostname, IP-address, or full URL of the Paperless instance.
-                  Scheme-less values default to ``https://``.
+                  Scheme-less values default to ``https://``;
+                  ``unix:///path/to/socket`` connects to a Unix domain socket.
         username: Paperless user name.
         password: Paperless user password.
         client:   Optional :class:`httpx.AsyncClient` to reuse.  A new client
@@ -370,8 +1118,11 @@ async def generate_api_token(
             ...
 
     """
+    url, uds = split_unix_socket_url(url)
     external_client = client is not None
-    client = client or httpx.AsyncClient()
+    if client is None:
+        transport = httpx.AsyncHTTPTransport(uds=uds) if uds else None
+        client = httpx.AsyncClient(transport=transport, trust_env=uds is None)
     try:
         url = normalize_base_url(url)
         json_data = {
@@ -3,15 +3,27 @@
 from io import BytesIO
 from typing import Any
 
+from .const import UNIX_SOCKET_BASE_URL, UNIX_SOCKET_SCHEME
 
-def normalize_base_url(url: str) -> str:
+
+def normalize_base_url(url: str, *, default_scheme: str = "https") -> str:
     """Normalize a URL string for use as a Paperless API base URL."""
     url = url.rstrip("/")
     if not url.startswith(("https://", "http://")):
-        url = f"https://{url}"
+        url = f"{default_scheme}://{url}"
     return url
 
 
+def split_unix_socket_url(url: str) -> tuple[str, str | None]:
+    """Split a ``unix://`` URL into a base URL and the path of its socket.
+
+    Any other URL is returned unchanged, with ``None`` as socket path.
+    """
+    if not url.startswith(UNIX_SOCKET_SCHEME):
+        return url, None
+    return UNIX_SOCKET_BASE_URL, url.removeprefix(UNIX_SOCKET_SCHEME)
+
+
 class _FormDataBuilder:
     """Build httpx-compatible (data, files) tuples from a raw form dict."""
 
@@ -0,0 +1,166 @@
+"""Benchmark response compression for a full document scan with ``PageGenerator``.
+
+Starts a local stand-in server (hypercorn, in a child process) serving
+``/api/documents/`` pages with OCR-sized ``content`` fields.  The server
+compresses every page up front and delays each answer by its wire size at the
+given bandwidth, which approximates a WAN link.  The scan then runs once per
+accepted encoding and prints wall time, client CPU time (decoding, JSON
+parsing and model validation) and the wire/decoded byte counters from
+``paperless.metrics``.
+
+Requires ``hypercorn``; ``br`` and ``zstd`` are measured when ``brotli`` and
+``zstandard`` are installed::
+
+    uv pip install hypercorn brotli zstandard
+    uv run python script/bench_compression.py --documents 3000 --bandwidth-mbit 50
+"""
+
+# ruff: noqa
+# mypy: ignore-errors
+
+import argparse
+import asyncio
+import gzip
+import importlib.util
+import json
+import multiprocessing
+import random
+import time
+import zlib
+
+from pypaperless import PaperlessClient, ProbeMode, ProbePolicy
+
+WORDS = "invoice amount total payment due date customer account reference tax net gross".split()
+
+
+def _compressors() -> dict[str, object]:
+    compressors = {"identity": lambda body: body, "gzip": gzip.compress, "deflate": zlib.compress}
+    if importlib.util.find_spec("brotli"):
+        import brotli
+
+        compressors["br"] = brotli.compress
+    if importlib.util.find_spec("zstandard"):
+        import zstandard
+
+        compressors["zstd"] = zstandard.ZstdCompressor().compress
+    return compressors
+
+
+def _document(pk: int, rng: random.Random) -> dict:
+    return {
+        "id": pk,
+        "title": f"Document {pk}",
+        "content": " ".join(rng.choice(WORDS) for _ in range(800)),
+        "tags": [1, 2],
+        "created": "2024-01-01",
+        "modified": "2024-01-01T00:00:00+00:00",
+        "added": "2024-01-01T00:00:00+00:00",
+        "notes": [],
+        "custom_fields": [],
+    }
+
+
+def _serve(port: int, documents: int, page_size: int, bandwidth: float) -> None:
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    rng = random.Random(0)
+    compressors = _compressors()
+    pages = {}
+    for number in range(1, documents // page_size + 1):
+        start = (number - 1) * page_size
+        has_next = start + page_size < documents
+        body = json.dumps(
+            {
+                "count": documents,
+                "next": (
+                    f"http://localhost:{port}/api/documents/?page={number + 1}&page_size={page_size}"
+                    if has_next
+                    else None
+                ),
+                "previous": None,
+                "all": list(range(1, documents + 1)),
+                "results": [_document(pk, rng) for pk in range(start + 1, start + page_size + 1)],
+            }
+        ).encode()
+        pages[number] = {name: compress(body) for name, compress in compressors.items()}
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        headers = [(b"x-api-version", b"10"), (b"content-type", b"application/json")]
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        query = dict(pair.split("=") for pair in scope["query_string"].decode().split("&"))
+        accepted = dict(scope["headers"]).get(b"accept-encoding", b"").decode()
+        encoding = next(
+            (enc.strip() for enc in accepted.split(",") if enc.strip() in compressors),
+            "identity",
+        )
+        body = pages[int(query.get("page", 1))][encoding]
+        if encoding != "identity":
+            headers.append((b"content-encoding", encoding.encode()))
+        await asyncio.sleep(len(body) * 8 / bandwidth)
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    config = Config()
+    config.bind = [f"localhost:{port}"]
+    config.loglevel = "WARNING"
+    asyncio.run(serve(app, config))
+
+
+async def _scan(url: str, encoding: str) -> dict[str, float]:
+    compression = [] if encoding == "identity" else [encoding]
+    probe = ProbePolicy(mode=ProbeMode.HEAD)
+    async with PaperlessClient(
+        url, "bench-token", compression=compression, probe=probe
+    ) as paperless:
+        paperless.metrics.reset()
+        wall, cpu = time.perf_counter(), time.process_time()
+        count = 0
+        async for page in paperless.documents.pages(page_size=100):
+            count += len(page.items)
+        return {
+            "documents": count,
+            "wall_s": time.perf_counter() - wall,
+            "cpu_s": time.process_time() - cpu,
+            "wire_mb": paperless.metrics.bytes_received / 1e6,
+            "decoded_mb": paperless.metrics.bytes_decoded / 1e6,
+        }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=3000)
+    parser.add_argument("--bandwidth-mbit", type=float, default=50.0)
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+
+    server = multiprocessing.Process(
+        target=_serve,
+        args=(args.port, args.documents, 100, args.bandwidth_mbit * 1e6),
+        daemon=True,
+    )
+    server.start()
+    await asyncio.sleep(3)
+
+    url = f"http://localhost:{args.port}"
+    try:
+        print(f"{args.documents} documents, {args.bandwidth_mbit:.0f} Mbit/s simulated link")
+        print(f"{'encoding':<10}{'wall s':>10}{'cpu s':>10}{'wire MB':>10}{'decoded MB':>12}")
+        for encoding in _compressors():
+            result = await _scan(url, encoding)
+            print(
+                f"{encoding:<10}{result['wall_s']:>10.2f}{result['cpu_s']:>10.2f}"
+                f"{result['wire_mb']:>10.2f}{result['decoded_mb']:>12.2f}"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
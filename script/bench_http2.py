@@ -0,0 +1,148 @@
+"""Benchmark HTTP/1.1 against HTTP/2 for many concurrent small GET requests.
+
+Starts a local TLS stand-in server (hypercorn, ALPN h2 + http/1.1) with a
+self-signed certificate, then fires N concurrent GETs through the
+pypaperless transport once with ``http2=False`` and once with ``http2=True``
+and prints p50/p99 latency and wall time for both.
+
+Requires the ``http2`` extra, ``hypercorn`` and the ``openssl`` CLI::
+
+    uv pip install "pypaperless[http2]" hypercorn
+    uv run python script/bench_http2.py --requests 500
+"""
+
+# ruff: noqa
+# mypy: ignore-errors
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from pypaperless import PaperlessClient
+
+PAYLOAD = json.dumps({"id": 1, "name": "Inbox", "document_count": 42}).encode()
+
+
+def _make_app(delay: float):
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        await asyncio.sleep(delay)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": PAYLOAD})
+
+    return app
+
+
+def _self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-addext",
+            "subjectAltName=DNS:localhost",
+            "-keyout",
+            str(key),
+            "-out",
+            str(cert),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _run(url: str, http2: bool, requests: int) -> dict[str, float]:
+    paperless = PaperlessClient(url, "bench-token", http2=http2)
+    transport = paperless.runtime.transport
+    await transport.get("/api/tags/1/")  # warm-up: open the first connection
+
+    latencies: list[float] = []
+
+    async def one() -> None:
+        started = time.perf_counter()
+        await transport.get("/api/tags/1/")
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    wall = time.perf_counter() - started
+    await paperless.close()
+
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "wall_s": wall,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--server-delay", type=float, default=0.005, help="seconds per response")
+    parser.add_argument("--port", type=int, default=8443)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = _self_signed_cert(Path(tmp))
+        # httpx trusts SSL_CERT_FILE, so the transport verifies our stand-in server
+        os.environ["SSL_CERT_FILE"] = str(cert)
+
+        config = Config()
+        config.bind = [f"localhost:{args.port}"]
+        config.certfile, config.keyfile = str(cert), str(key)
+        config.alpn_protocols = ["h2", "http/1.1"]
+        config.loglevel = "WARNING"
+
+        shutdown = asyncio.Event()
+        server = asyncio.create_task(
+            serve(_make_app(args.server_delay), config, shutdown_trigger=shutdown.wait)
+        )
+        await asyncio.sleep(0.5)
+
+        url = f"https://localhost:{args.port}"
+        try:
+            print(f"{args.requests} concurrent GETs, {args.server_delay * 1000:.1f} ms server time")
+            print(f"{'protocol':<10}{'p50 ms':>10}{'p99 ms':>10}{'wall s':>10}")
+            for label, http2 in (("HTTP/1.1", False), ("HTTP/2", True)):
+                result = await _run(url, http2, args.requests)
+                print(
+                    f"{label:<10}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+                    f"{result['wall_s']:>10.3f}"
+                )
+        finally:
+            shutdown.set()
+            await server
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,149 @@
+"""Benchmark page-number against keyset iteration for a full document scan.
+
+Starts a local stand-in server (hypercorn, in a child process) that models
+the cost of Django page-number pagination: every request waits for a base
+latency plus a per-row cost for the rows the database skips (``OFFSET``),
+while ``id__in`` requests only pay for the rows they return.  Like
+Paperless-ngx, every page lists the ids of all matching items in ``all``.
+
+The scan runs once with ``pages()`` and once with ``pages(keyset=True)`` and
+prints the latency of pages at 10 %, 50 %, 90 % and 100 % of the scan, plus
+the total wall time.
+
+Requires ``hypercorn``::
+
+    uv pip install hypercorn
+    uv run python script/bench_keyset.py --documents 30000 --row-cost-us 2
+"""
+
+# ruff: noqa
+# mypy: ignore-errors
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+
+from pypaperless import PaperlessClient, ProbeMode, ProbePolicy
+from pypaperless.metrics import tally_response_bytes
+
+
+def _serve(port: int, documents: int, base_latency: float, row_cost: float) -> None:
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    ids = list(range(1, documents + 1))
+
+    def _document(pk: int) -> dict:
+        return {"id": pk, "title": f"Document {pk}", "tags": [1, 2], "notes": []}
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        headers = [(b"x-api-version", b"10"), (b"content-type", b"application/json")]
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        query = dict(pair.split("=", 1) for pair in scope["query_string"].decode().split("&"))
+        number, size = int(query.get("page", 1)), int(query.get("page_size", 150))
+        matching = ids
+        if "id__in" in query:
+            wanted = {int(pk) for pk in query["id__in"].replace("%2C", ",").split(",")}
+            matching = [pk for pk in ids if pk in wanted]
+
+        start = (number - 1) * size
+        await asyncio.sleep(base_latency + (start + size) * row_cost)
+        has_next = start + size < len(matching)
+        body = json.dumps(
+            {
+                "count": len(matching),
+                "next": (
+                    f"http://localhost:{port}/api/documents/?page={number + 1}&page_size={size}"
+                    if has_next
+                    else None
+                ),
+                "previous": None,
+                "all": matching,
+                "results": [_document(pk) for pk in matching[start : start + size]],
+            }
+        ).encode()
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    config = Config()
+    config.bind = [f"localhost:{port}"]
+    config.loglevel = "WARNING"
+    asyncio.run(serve(app, config))
+
+
+async def _scan(url: str, *, keyset: bool, page_size: int) -> dict:
+    probe = ProbePolicy(mode=ProbeMode.HEAD)
+    async with PaperlessClient(url, "bench-token", probe=probe) as paperless:
+        latencies = []
+        wall = time.perf_counter()
+        count = 0
+        with tally_response_bytes() as tally:
+            pages = paperless.documents.pages(page_size=page_size, prefetch=0, keyset=keyset)
+            while True:
+                started = time.perf_counter()
+                try:
+                    page = await anext(pages)
+                except StopAsyncIteration:
+                    break
+                latencies.append(time.perf_counter() - started)
+                count += len(page.results)
+        return {
+            "documents": count,
+            "latencies": latencies,
+            "wall_s": time.perf_counter() - wall,
+            "mb": sum(tally) / 1e6,
+        }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=30000)
+    parser.add_argument("--page-size", type=int, default=150)
+    parser.add_argument("--base-latency-ms", type=float, default=5.0)
+    parser.add_argument("--row-cost-us", type=float, default=2.0)
+    parser.add_argument("--port", type=int, default=8083)
+    args = parser.parse_args()
+
+    server = multiprocessing.Process(
+        target=_serve,
+        args=(args.port, args.documents, args.base_latency_ms / 1e3, args.row_cost_us / 1e6),
+        daemon=True,
+    )
+    server.start()
+    await asyncio.sleep(3)
+
+    url = f"http://localhost:{args.port}"
+    try:
+        print(
+            f"{args.documents} documents, page_size={args.page_size}, "
+            f"{args.row_cost_us:.1f} us per skipped row"
+        )
+        print(
+            f"{'mode':<8}{'p@10% ms':>10}{'p@50% ms':>10}{'p@90% ms':>10}{'last ms':>10}"
+            f"{'wall s':>10}{'MB':>8}"
+        )
+        for name, keyset in (("page", False), ("keyset", True)):
+            result = await _scan(url, keyset=keyset, page_size=args.page_size)
+            latencies = result["latencies"]
+            at = [
+                latencies[int(len(latencies) * share) - 1] * 1000 for share in (0.1, 0.5, 0.9, 1.0)
+            ]
+            print(
+                f"{name:<8}"
+                + "".join(f"{value:>10.1f}" for value in at)
+                + f"{result['wall_s']:>10.2f}{result['mb']:>8.1f}"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
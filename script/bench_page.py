@@ -0,0 +1,97 @@
+"""Benchmark building a page of 150 documents, before and after lazy page items.
+
+Builds a documents page from an in-memory list response, without a server,
+and times three ways of using it:
+
+* ``envelope``: only build the :class:`~pypaperless.models.Page`, e.g. to
+  read ``count``; validated with ``Page.from_data`` before, taken over with
+  ``Page.from_response`` now.
+* ``iterate``: build the page and iterate over its documents once.
+* ``twice``: build the page and read ``page.items`` twice, e.g. once to
+  log and once to store.  Before, every access validated the whole page.
+
+The "before" column rebuilds the former behaviour: a validated envelope and
+an ``items`` that maps every result through ``Document.from_data`` on every
+access.
+
+    uv run python script/bench_page.py --documents 150 --rounds 200
+"""
+
+# ruff: noqa
+# mypy: ignore-errors
+
+import argparse
+import time
+
+from pypaperless import PaperlessClient
+from pypaperless.models import Document, Page
+
+
+def _document(pk: int, content_kb: int) -> dict:
+    return {
+        "id": pk,
+        "title": f"Document {pk}",
+        "content": "Lorem ipsum dolor sit amet. " * (content_kb * 36),
+        "tags": [1, 2, 3],
+        "correspondent": 4,
+        "document_type": 5,
+        "storage_path": None,
+        "created": "2024-01-01",
+        "added": "2024-01-02T10:00:00+01:00",
+        "modified": "2024-01-03T10:00:00+01:00",
+        "archive_serial_number": pk,
+        "original_file_name": f"scan-{pk}.pdf",
+        "owner": 1,
+        "notes": [],
+        "custom_fields": [],
+    }
+
+
+def _before(runtime, res, accesses: int) -> None:
+    page = Page.from_data(runtime, res, resource_cls=Document, current_page=1, page_size=150)
+    for _ in range(accesses):
+        for _ in [Document.from_data(runtime, data) for data in page.results]:
+            pass
+
+
+def _after(runtime, res, accesses: int) -> None:
+    page = Page.from_response(runtime, res, resource_cls=Document, current_page=1, page_size=150)
+    for _ in range(accesses):
+        for _ in page.items:
+            pass
+
+
+def _time(fn, runtime, res, accesses: int, rounds: int) -> float:
+    fn(runtime, res, accesses)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn(runtime, res, accesses)
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=150)
+    parser.add_argument("--content-kb", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    runtime = PaperlessClient("http://localhost:8000", "bench-token").runtime
+    res = {
+        "count": args.documents,
+        "next": None,
+        "previous": None,
+        "all": list(range(1, args.documents + 1)),
+        "results": [_document(pk, args.content_kb) for pk in range(1, args.documents + 1)],
+    }
+
+    print(f"{args.documents} documents of {args.content_kb} KiB, {args.rounds} rounds")
+    print(f"{'use':<10}{'before ms':>11}{'after ms':>10}{'speedup':>9}")
+    for name, accesses in (("envelope", 0), ("iterate", 1), ("twice", 2)):
+        before = _time(_before, runtime, res, accesses, args.rounds)
+        after = _time(_after, runtime, res, accesses, args.rounds)
+        print(f"{name:<10}{before:>11.3f}{after:>10.3f}{before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
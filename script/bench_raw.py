@@ -0,0 +1,154 @@
+"""Benchmark a full-corpus JSON export through models against raw dicts.
+
+Starts a local stand-in server (hypercorn, in a child process) that serves
+``--documents`` documents with realistic metadata in pages of 150.  The
+bodies are rendered up front, so the server costs little per request.
+
+The export runs once with ``async for doc in paperless.documents``, dumping
+every ``doc.api_dump()`` to JSON, and once with ``paperless.documents.iter_raw()``,
+dumping the result dicts as they come.  Per mode, it prints the wall time,
+the CPU time of the client and the documents exported per second.
+
+Requires ``hypercorn``::
+
+    uv pip install hypercorn
+    uv run python script/bench_raw.py --documents 6000
+"""
+
+# ruff: noqa
+# mypy: ignore-errors
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+
+from pypaperless import PaperlessClient, ProbeMode, ProbePolicy
+
+
+def _document(pk: int, content_kb: int) -> dict:
+    return {
+        "id": pk,
+        "correspondent": pk % 7 or None,
+        "document_type": pk % 5 or None,
+        "storage_path": None,
+        "title": f"Invoice {pk}",
+        "content": "Lorem ipsum dolor sit amet. " * (content_kb * 36),
+        "tags": [1, 2, pk % 11],
+        "created": "2024-01-01",
+        "created_date": "2024-01-01",
+        "modified": "2024-01-03T10:00:00.123456+01:00",
+        "added": "2024-01-02T10:00:00.123456+01:00",
+        "deleted_at": None,
+        "archive_serial_number": pk,
+        "original_file_name": f"scan-{pk}.pdf",
+        "archived_file_name": f"{pk:07d}.pdf",
+        "owner": 1,
+        "user_can_change": True,
+        "is_shared_by_requester": False,
+        "notes": [{"id": pk, "note": "Paid.", "created": "2024-01-04T09:00:00+01:00", "user": 1}],
+        "custom_fields": [],
+        "page_count": 2,
+        "mime_type": "application/pdf",
+    }
+
+
+def _serve(port: int, documents: int, page_size: int, content_kb: int) -> None:
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    ids = list(range(1, documents + 1))
+    bodies = {}
+    for number in range(1, -(-documents // page_size) + 1):
+        start = (number - 1) * page_size
+        has_next = start + page_size < documents
+        bodies[number] = json.dumps(
+            {
+                "count": documents,
+                "next": (
+                    f"http://localhost:{port}/api/documents/?page={number + 1}&page_size={page_size}"
+                    if has_next
+                    else None
+                ),
+                "previous": None,
+                "all": ids,
+                "results": [_document(pk, content_kb) for pk in ids[start : start + page_size]],
+            }
+        ).encode()
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        headers = [(b"x-api-version", b"10"), (b"content-type", b"application/json")]
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        query = dict(pair.split("=", 1) for pair in scope["query_string"].decode().split("&"))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": bodies[int(query.get("page", 1))]})
+
+    config = Config()
+    config.bind = [f"localhost:{port}"]
+    config.loglevel = "WARNING"
+    asyncio.run(serve(app, config))
+
+
+async def _export(url: str, *, raw: bool, page_size: int) -> dict:
+    probe = ProbePolicy(mode=ProbeMode.HEAD)
+    async with PaperlessClient(url, "bench-token", probe=probe) as paperless:
+        wall, cpu = time.perf_counter(), time.process_time()
+        count = 0
+        size = 0
+        async with paperless.documents.filter(page_size=page_size) as docs:
+            if raw:
+                async for data in docs.iter_raw():
+                    size += len(json.dumps(data))
+                    count += 1
+            else:
+                async for doc in docs:
+                    size += len(json.dumps(doc.api_dump()))
+                    count += 1
+        return {
+            "documents": count,
+            "wall_s": time.perf_counter() - wall,
+            "cpu_s": time.process_time() - cpu,
+            "mb": size / 1e6,
+        }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=6000)
+    parser.add_argument("--page-size", type=int, default=150)
+    parser.add_argument("--content-kb", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8085)
+    args = parser.parse_args()
+
+    server = multiprocessing.Process(
+        target=_serve,
+        args=(args.port, args.documents, args.page_size, args.content_kb),
+        daemon=True,
+    )
+    server.start()
+    await asyncio.sleep(3)
+
+    url = f"http://localhost:{args.port}"
+    try:
+        print(f"{args.documents} documents of {args.content_kb} KiB, page_size={args.page_size}")
+        print(f"{'mode':<8}{'wall s':>10}{'cpu s':>10}{'docs/s':>10}{'MB out':>10}")
+        for name, raw in (("models", False), ("raw", True)):
+            result = await _export(url, raw=raw, page_size=args.page_size)
+            assert result["documents"] == args.documents
+            print(
+                f"{name:<8}{result['wall_s']:>10.2f}{result['cpu_s']:>10.2f}"
+                f"{result['documents'] / result['wall_s']:>10.0f}{result['mb']:>10.1f}"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,178 @@
+"""Benchmark time to first item and peak memory of buffered against streamed listings.
+
+Starts a local stand-in server (hypercorn, in a child process) that answers
+document listings with large pages: every document carries ``--content-kb``
+of OCR text, and the body is sent in 64 KiB chunks paced to ``--mbps``, like
+a page arriving over a real network link.
+
+The listing is read once with ``async for doc in paperless.documents``, which
+buffers and decodes every page as a whole, and once with
+``paperless.documents.stream()``, which decodes each document as soon as its
+bytes arrived.  Each mode runs in a fresh process, so the peak RSS it prints
+is its own.  Per mode, it prints the time to the first document, the wall
+time of the scan, and the peak RSS before and after the scan.
+
+Requires ``hypercorn``::
+
+    uv pip install hypercorn
+    uv run python script/bench_stream.py --documents 600 --content-kb 32 --mbps 100
+"""
+
+# ruff: noqa
+# mypy: ignore-errors
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import time
+
+_CHUNK = 64 * 1024
+
+
+def _serve(port: int, documents: int, content_kb: int, mbps: float) -> None:
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    text = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20)[:1024]
+
+    def _document(pk: int) -> dict:
+        return {
+            "id": pk,
+            "title": f"Document {pk}",
+            "content": text * content_kb,
+            "tags": [1, 2, 3],
+            "correspondent": 4,
+            "document_type": 5,
+            "created": "2024-01-01",
+            "added": "2024-01-02T10:00:00+01:00",
+            "modified": "2024-01-03T10:00:00+01:00",
+            "notes": [],
+            "custom_fields": [],
+        }
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        headers = [(b"x-api-version", b"10"), (b"content-type", b"application/json")]
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        query = dict(pair.split("=", 1) for pair in scope["query_string"].decode().split("&"))
+        number, size = int(query.get("page", 1)), int(query.get("page_size", 150))
+        start = (number - 1) * size
+        has_next = start + size < documents
+        body = json.dumps(
+            {
+                "count": documents,
+                "next": (
+                    f"http://localhost:{port}/api/documents/?page={number + 1}&page_size={size}"
+                    if has_next
+                    else None
+                ),
+                "previous": None,
+                "all": list(range(1, documents + 1)),
+                "results": [
+                    _document(pk) for pk in range(start + 1, min(start + size, documents) + 1)
+                ],
+            }
+        ).encode()
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        pace = _CHUNK / (mbps * 1e6 / 8)
+        for offset in range(0, len(body), _CHUNK):
+            await asyncio.sleep(pace)
+            more = offset + _CHUNK < len(body)
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": body[offset : offset + _CHUNK],
+                    "more_body": more,
+                }
+            )
+
+    config = Config()
+    config.bind = [f"localhost:{port}"]
+    config.loglevel = "WARNING"
+    asyncio.run(serve(app, config))
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _scan(url: str, mode: str, page_size: int) -> dict:
+    from pypaperless import PaperlessClient, ProbeMode, ProbePolicy
+
+    probe = ProbePolicy(mode=ProbeMode.HEAD)
+    async with PaperlessClient(url, "bench-token", probe=probe) as paperless:
+        before = _peak_rss_mb()
+        started = time.perf_counter()
+        first = None
+        count = 0
+        if mode == "buffered":
+            async with paperless.documents.filter(page_size=page_size) as docs:
+                async for _ in docs:
+                    first = first or time.perf_counter() - started
+                    count += 1
+        else:
+            items = paperless.documents.stream(page_size=page_size)
+            async for _ in items:
+                first = first or time.perf_counter() - started
+                count += 1
+        return {
+            "documents": count,
+            "first_ms": first * 1000,
+            "wall_s": time.perf_counter() - started,
+            "rss_before": before,
+            "rss_peak": _peak_rss_mb(),
+        }
+
+
+def _run(url: str, mode: str, page_size: int, results) -> None:
+    results.put(asyncio.run(_scan(url, mode, page_size)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=600)
+    parser.add_argument("--page-size", type=int, default=150)
+    parser.add_argument("--content-kb", type=int, default=32)
+    parser.add_argument("--mbps", type=float, default=100.0)
+    parser.add_argument("--port", type=int, default=8084)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    server = context.Process(
+        target=_serve, args=(args.port, args.documents, args.content_kb, args.mbps), daemon=True
+    )
+    server.start()
+    time.sleep(3)
+
+    url = f"http://localhost:{args.port}"
+    try:
+        print(
+            f"{args.documents} documents of {args.content_kb} KiB, "
+            f"page_size={args.page_size}, {args.mbps:.0f} Mbit/s"
+        )
+        print(f"{'mode':<10}{'first ms':>10}{'wall s':>10}{'RSS before MB':>15}{'RSS peak MB':>13}")
+        for mode in ("buffered", "stream"):
+            results = context.Queue()
+            child = context.Process(target=_run, args=(url, mode, args.page_size, results))
+            child.start()
+            result = results.get()
+            child.join()
+            assert result["documents"] == args.documents
+            print(
+                f"{mode:<10}{result['first_ms']:>10.1f}{result['wall_s']:>10.2f}"
+                f"{result['rss_before']:>15.1f}{result['rss_peak']:>13.1f}"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
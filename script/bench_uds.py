@@ -0,0 +1,134 @@
+"""Benchmark a Unix domain socket against loopback TCP.
+
+Starts a local stand-in server (hypercorn, in a child process) bound to both
+a Unix socket and a loopback TCP port.  It answers ``/api/tags/<pk>/`` with a
+small JSON object and ``/api/documents/<pk>/download/`` with a binary body of
+the given size.  Both workloads then run through the pypaperless transport,
+once per connection type, and print p50/p99 latency, wall time and
+throughput.
+
+Requires ``hypercorn``::
+
+    uv pip install hypercorn
+    uv run python script/bench_uds.py --requests 2000 --download-mb 20
+"""
+
+# ruff: noqa
+# mypy: ignore-errors
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from pypaperless import PaperlessClient, ProbeMode, ProbePolicy
+
+PAYLOAD = json.dumps({"id": 1, "name": "Inbox", "document_count": 42}).encode()
+
+
+def _serve(socket_path: str, port: int, download_bytes: int) -> None:
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    download = os.urandom(download_bytes)
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        headers = [(b"x-api-version", b"10")]
+        if scope["path"].endswith("/download/"):
+            headers.append((b"content-type", b"application/pdf"))
+            body = download
+        else:
+            headers.append((b"content-type", b"application/json"))
+            body = PAYLOAD if scope["method"] != "HEAD" else b""
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    config = Config()
+    config.bind = [f"unix:{socket_path}", f"127.0.0.1:{port}"]
+    config.loglevel = "WARNING"
+    asyncio.run(serve(app, config))
+
+
+async def _run(url: str, requests: int, downloads: int, concurrency: int) -> dict[str, float]:
+    probe = ProbePolicy(mode=ProbeMode.HEAD)
+    async with PaperlessClient(url, "bench-token", probe=probe) as paperless:
+        transport = paperless._runtime.transport
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def fetch(pk: int) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                await transport.get(f"/api/tags/{pk}/")
+                latencies.append(time.perf_counter() - started)
+
+        # warm up the connection pool
+        await asyncio.gather(*(fetch(pk) for pk in range(concurrency)))
+        latencies.clear()
+
+        wall = time.perf_counter()
+        await asyncio.gather(*(fetch(pk) for pk in range(requests)))
+        json_wall = time.perf_counter() - wall
+
+        wall = time.perf_counter()
+        received = 0
+        for pk in range(downloads):
+            document = await paperless.documents.download(pk)
+            received += len(document.content)
+        download_wall = time.perf_counter() - wall
+
+        latencies.sort()
+        return {
+            "p50_ms": statistics.median(latencies) * 1000,
+            "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+            "json_rps": requests / json_wall,
+            "download_mb_s": received / 1e6 / download_wall,
+        }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--downloads", type=int, default=20)
+    parser.add_argument("--download-mb", type=float, default=20.0)
+    parser.add_argument("--port", type=int, default=8082)
+    args = parser.parse_args()
+
+    socket_path = str(Path(tempfile.mkdtemp()) / "paperless.sock")
+    server = multiprocessing.Process(
+        target=_serve,
+        args=(socket_path, args.port, int(args.download_mb * 1e6)),
+        daemon=True,
+    )
+    server.start()
+    await asyncio.sleep(3)
+
+    try:
+        print(
+            f"{args.requests} small GETs at concurrency {args.concurrency}, "
+            f"{args.downloads} downloads of {args.download_mb:.0f} MB"
+        )
+        print(f"{'transport':<10}{'p50 ms':>10}{'p99 ms':>10}{'GET/s':>10}{'MB/s':>10}")
+        for name, url in (
+            ("tcp", f"http://127.0.0.1:{args.port}"),
+            ("uds", f"unix://{socket_path}"),
+        ):
+            result = await _run(url, args.requests, args.downloads, args.concurrency)
+            print(
+                f"{name:<10}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+                f"{result['json_rps']:>10.0f}{result['download_mb_s']:>10.0f}"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,7 +1,11 @@
 """Tests for the PaperlessClient client: init, context, requests, URL, token, Page model."""
 
+import asyncio
 import datetime
+import json
+import re
 from io import BytesIO
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -9,7 +13,17 @@ import pytest
 from pydantic import BaseModel, Field, ValidationError
 from pytest_httpx import HTTPXMock
 
-from pypaperless import PaperlessClient, PaperlessSettings, generate_api_token
+from pypaperless import (
+    AdaptivePageSize,
+    PaperlessClient,
+    PaperlessSettings,
+    ProbeMode,
+    ProbePolicy,
+    RateLimit,
+    RateLimitPolicy,
+    RequestKind,
+    generate_api_token,
+)
 from pypaperless.const import EndpointPath
 from pypaperless.exceptions import (
     BadJsonResponseError,
@@ -25,11 +39,13 @@ from pypaperless.exceptions import (
     PaperlessTimeoutError,
     UnexpectedStatusError,
 )
-from pypaperless.models import Page
+from pypaperless.models import Page, PageCheckpoint
 from pypaperless.models.base import PaperlessModel
 from pypaperless.pagination import PageGenerator
+from pypaperless.probe import HostInfo
 from pypaperless.services import mixins as service_mixins
 from pypaperless.services.base import ResourceService
+from pypaperless.streaming import ListingParser
 from pypaperless.transport import PaperlessTransport
 from pypaperless.utils import normalize_base_url, process_form_data
 from tests.const import (
@@ -39,7 +55,7 @@ from tests.const import (
     PAPERLESS_TEST_USER,
 )
 
-from .data import DATA_PATHS, DATA_TOKEN
+from .data import DATA_PATHS, DATA_TAGS, DATA_TOKEN
 
 
 async def test_init(httpx_mock: HTTPXMock, api: PaperlessClient) -> None:
@@ -125,6 +141,61 @@ async def test_init_error(httpx_mock: HTTPXMock, api: PaperlessClient) -> None:
         await api.initialize()
 
 
+async def test_init_head_probe(httpx_mock: HTTPXMock) -> None:
+    """HEAD mode reads the version headers of the API root without a body."""
+    httpx_mock.add_response(
+        url=f"{PAPERLESS_TEST_URL}{EndpointPath.API_ROOT}",
+        method="HEAD",
+        headers={"X-Api-Version": "9", "X-Version": "2.20.0"},
+    )
+    api = PaperlessClient(
+        PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, probe=ProbePolicy(mode=ProbeMode.HEAD)
+    )
+    await api.initialize()
+    assert (api.host_api_version, api.host_version) == (9, "2.20.0")
+
+    httpx_mock.add_response(method="HEAD", status_code=500)
+    with pytest.raises(InitializationError):
+        await api.initialize()
+    await api.close()
+
+
+async def test_init_probe_cache(httpx_mock: HTTPXMock, tmp_path: Path) -> None:
+    """A fresh on-disk probe result skips the probe request per base URL."""
+    cache_file = tmp_path / "cache" / "probe.json"
+    probe = ProbePolicy(mode=ProbeMode.HEAD, cache_file=cache_file, cache_ttl=60)
+    httpx_mock.add_response(method="HEAD", headers={"X-Api-Version": "9", "X-Version": "2.20.0"})
+
+    for _ in range(2):
+        api = PaperlessClient(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, probe=probe)
+        await api.initialize()
+        assert (api.host_api_version, api.host_version) == (9, "2.20.0")
+        await api.close()
+    assert len(httpx_mock.get_requests()) == 1
+
+    entries = json.loads(cache_file.read_text())
+    assert entries[normalize_base_url(PAPERLESS_TEST_URL)]["api_version"] == 9
+
+    # expired, foreign and corrupt entries are ignored
+    entries[normalize_base_url(PAPERLESS_TEST_URL)]["probed_at"] = 0
+    cache_file.write_text(json.dumps(entries))
+    assert probe.load(normalize_base_url(PAPERLESS_TEST_URL)) is None
+    assert probe.load("https://other.example.com") is None
+    cache_file.write_text("[not json")
+    assert probe.load(normalize_base_url(PAPERLESS_TEST_URL)) is None
+
+
+def test_probe_cache_write_error(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """An unwritable probe cache only logs a warning."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    probe = ProbePolicy(cache_file=blocker / "probe.json")
+    probe.store("https://example.com", HostInfo(api_version=9, version=None))
+    assert "Could not write the probe cache" in caplog.text
+    assert ProbePolicy().load("https://example.com") is None
+    ProbePolicy().store("https://example.com", HostInfo(api_version=9, version=None))
+
+
 async def test_request(httpx_mock: HTTPXMock) -> None:
     """Test request_raw, including form data encoding."""
     # use uninitialised client to bypass session setup
@@ -203,6 +274,12 @@ def test_create_url(input_url: str, expected: str) -> None:
     assert normalize_base_url(input_url) == expected
 
 
+def test_create_url_default_scheme() -> None:
+    """Scheme-less URLs take the given default scheme, explicit schemes are kept."""
+    assert normalize_base_url("hostname/", default_scheme="http") == "http://hostname"
+    assert normalize_base_url("https://hostname", default_scheme="http") == "https://hostname"
+
+
 async def test_generate_api_token(httpx_mock: HTTPXMock) -> None:
     """Test token generation success and failure modes."""
     httpx_mock.add_response(
@@ -645,6 +722,31 @@ def test_page_items_raises_without_resource_cls(api: PaperlessClient) -> None:
         _ = page.items
 
 
+def test_page_items_lazy(api: PaperlessClient) -> None:
+    """Page.items validates every item on first access only, and caches it."""
+    res = {"count": 3, "next": None, "results": [{"id": 1}, {"id": 2}, {"id": "broken"}]}
+    page = Page.from_response(api.runtime, res, resource_cls=_PagedResource, page_size=3)
+    assert page.results is res["results"]
+    assert page.all_ids is None
+    assert page.last_page == 1
+
+    items = page.items
+    assert items is page.items
+    assert len(items) == 3
+    assert items[0] is items[0]
+    assert items[-2].id == 2
+    assert [item.id for item in items[:2]] == [1, 2]
+    assert items[:2] == items[:2]
+    assert items != "12"
+    # the broken item only fails once it is touched
+    with pytest.raises(ValidationError):
+        list(page)
+
+    page = Page.from_response(api.runtime, {"results": [{"id": 1}]}, resource_cls=_PagedResource)
+    assert page.items == [page.items[0]]
+    assert repr(page.items) == repr([page.items[0]])
+
+
 async def test_page_generator_follows_next_and_prefetches(
     httpx_mock: HTTPXMock, api: PaperlessClient
 ) -> None:
@@ -705,6 +807,993 @@ async def test_page_generator_aclose_cancels_prefetch(
         await anext(gen)
 
 
+class _ListingServer:
+    """Stand-in for a paginated list endpoint, honouring pagination, ``id__in`` and tag filters."""
+
+    def __init__(
+        self,
+        ids: list[int],
+        delays: dict[int, float] | None = None,
+        max_page_size: int | None = None,
+        tags: dict[int, set[int]] | None = None,
+    ) -> None:
+        self.ids = ids
+        self.delays = delays or {}
+        self.max_page_size = max_page_size
+        self.tags = tags or {}
+        self.in_flight = self.peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        number, size = int(params["page"]), int(params["page_size"])
+        size = min(size, self.max_page_size or size)
+        ids = self.ids
+        if "id__in" in params:
+            wanted = {int(pk) for pk in params["id__in"].split(",")}
+            ids = [pk for pk in ids if pk in wanted]
+        for suffix, match in (("in", set.intersection), ("all", set.issuperset)):
+            if f"tags__id__{suffix}" in params:
+                tags = {int(pk) for pk in params[f"tags__id__{suffix}"].split(",")}
+                ids = [pk for pk in ids if match(self.tags.get(pk, set()), tags)]
+
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(number, 0.0) if "id__in" not in params else 0.0)
+        finally:
+            self.in_flight -= 1
+
+        has_next = number * size < len(ids)
+        next_url = request.url.copy_merge_params({"page": number + 1})
+        return httpx.Response(
+            200,
+            json={
+                "count": len(ids),
+                "next": str(next_url) if has_next else None,
+                "previous": None,
+                "all": ids,
+                "results": [{"id": pk} for pk in ids[(number - 1) * size : number * size]],
+            },
+        )
+
+
+class _PagedResource(PaperlessModel):
+    id: int | None = None
+
+
+async def test_page_generator_fans_out_in_order(
+    httpx_mock: HTTPXMock, api: PaperlessClient
+) -> None:
+    """With concurrency, pages are requested by number and yielded in page order."""
+    server = _ListingServer(list(range(1, 11)), delays={2: 0.03, 3: 0.01})
+    httpx_mock.add_callback(server, is_reusable=True)
+
+    gen = PageGenerator(
+        api.runtime, "/api/things/", _PagedResource, {"page_size": 3}, concurrency=2
+    )
+    pages = [page async for page in gen]
+    assert [page.current_page for page in pages] == [1, 2, 3, 4]
+    assert [item.id for page in pages for item in page] == list(range(1, 11))
+    assert [page.has_next_page for page in pages] == [True, True, True, False]
+    assert [page.previous_page for page in pages] == [None, 1, 2, 3]
+    assert all(page.count == 10 for page in pages)
+    assert server.peak == 2
+
+    # without a snapshot, pages are requested by their number
+    requests = httpx_mock.get_requests()
+    assert sorted(int(request.url.params["page"]) for request in requests) == [1, 2, 3, 4]
+    assert not any("id__in" in request.url.params for request in requests)
+
+
+async def test_page_generator_fanout_snapshot(httpx_mock: HTTPXMock, api: PaperlessClient) -> None:
+    """A snapshot pins the ids of the first page; later inserts cannot shift offsets."""
+    server = _ListingServer(list(range(10, 0, -1)))
+    httpx_mock.add_callback(server, is_reusable=True)
+
+    gen = PageGenerator(
+        api.runtime, "/api/things/", _PagedResource, {"page_size": 4}, concurrency=4, snapshot=True
+    )
+    first = await anext(gen)
+    server.ids.insert(0, 11)  # a new item sorts first
+    pages = [first, *[page async for page in gen]]
+
+    assert [item.id for page in pages for item in page] == list(range(10, 0, -1))
+    assert [page.current_page for page in pages] == [1, 2, 3]
+    snapshot_params = [request.url.params for request in httpx_mock.get_requests()[1:]]
+    assert {params["id__in"] for params in snapshot_params} == {"6,5,4,3", "2,1"}
+    assert {params["page"] for params in snapshot_params} == {"1"}
+
+
+async def test_page_generator_fans_out_unordered(
+    httpx_mock: HTTPXMock, api: PaperlessClient
+) -> None:
+    """With ordered=False, pages are yielded as soon as they arrive."""
+    server = _ListingServer(list(range(1, 10)), delays={2: 0.05})
+    httpx_mock.add_callback(server, is_reusable=True)
+
+    gen = PageGenerator(
+        api.runtime,
+        "/api/things/",
+        _PagedResource,
+        {"page_size": 3},
+        concurrency=2,
+        ordered=False,
+    )
+    numbers = [page.current_page async for page in gen]
+    assert numbers == [1, 3, 2]
+
+
+async def test_page_generator_fanout_aclose_and_errors(
+    httpx_mock: HTTPXMock, api: PaperlessClient
+) -> None:
+    """aclose() cancels fanned-out requests; failed pages raise in order."""
+    with pytest.raises(ValueError, match="concurrency"):
+        PageGenerator(api.runtime, "/api/things/", _PagedResource, concurrency=0)
+
+    server = _ListingServer(list(range(1, 10)), delays={2: 1.0, 3: 1.0})
+    httpx_mock.add_callback(server, is_reusable=True)
+    gen = PageGenerator(
+        api.runtime, "/api/things/", _PagedResource, {"page_size": 3}, concurrency=2
+    )
+    await anext(gen)
+    await asyncio.sleep(0.01)
+    assert server.in_flight == 2
+    await gen.aclose()
+    await asyncio.sleep(0.01)
+    assert server.in_flight == 0
+    with pytest.raises(StopAsyncIteration):
+        await anext(gen)
+
+    httpx_mock.reset()
+    first = {
+        "count": 4,
+        "next": f"{PAPERLESS_TEST_URL}/api/things/?page=2&page_size=2",
+        "previous": None,
+        "results": [{"id": 1}, {"id": 2}],
+    }
+    httpx_mock.add_response(url=f"{PAPERLESS_TEST_URL}/api/things/?page=1&page_size=2", json=first)
+    httpx_mock.add_response(
+        url=f"{PAPERLESS_TEST_URL}/api/things/?page=2&page_size=2", status_code=500
+    )
+    gen = PageGenerator(
+        api.runtime, "/api/things/", _PagedResource, {"page_size": 2}, concurrency=2
+    )
+    await anext(gen)
+    with pytest.raises(UnexpectedStatusError):
+        await anext(gen)
+
+
+async def test_page_generator_read_ahead_depth(httpx_mock: HTTPXMock, api: PaperlessClient) -> None:
+    """The generator reads up to `prefetch` pages ahead via next links, never more."""
+    with pytest.raises(ValueError, match="prefetch"):
+        PageGenerator(api.runtime, "/api/things/", _PagedResource, prefetch=-1)
+
+    httpx_mock.add_callback(_ListingServer(list(range(1, 13))), is_reusable=True)
+    gen = PageGenerator(api.runtime, "/api/things/", _PagedResource, {"page_size": 2}, prefetch=3)
+    await anext(gen)
+    await asyncio.sleep(0.05)
+    assert len(httpx_mock.get_requests()) == 4
+
+    # taking a page makes room for exactly one more
+    await anext(gen)
+    await asyncio.sleep(0.05)
+    assert len(httpx_mock.get_requests()) == 5
+
+    pages = [page async for page in gen]
+    assert [page.current_page for page in pages] == [3, 4, 5, 6]
+    assert [item.id for item in pages[-1]] == [11, 12]
+    assert len(httpx_mock.get_requests()) == 6
+
+
+async def test_page_generator_on_demand(httpx_mock: HTTPXMock, api: PaperlessClient) -> None:
+    """With prefetch=0, every page is requested only when the consumer asks for it."""
+    httpx_mock.add_callback(_ListingServer(list(range(1, 5))), is_reusable=True)
+    gen = PageGenerator(api.runtime, "/api/things/", _PagedResource, {"page_size": 2}, prefetch=0)
+    await anext(gen)
+    await asyncio.sleep(0.02)
+    assert len(httpx_mock.get_requests()) == 1
+    assert [item.id for item in await anext(gen)] == [3, 4]
+    with pytest.raises(StopAsyncIteration):
+        await anext(gen)
+
+
+async def test_page_generator_read_ahead_aclose_and_errors(
+    httpx_mock: HTTPXMock, api: PaperlessClient
+) -> None:
+    """aclose() cancels the whole read-ahead chain; a failed page raises when taken."""
+    server = _ListingServer(list(range(1, 13)), delays={2: 1.0})
+    httpx_mock.add_callback(server, is_reusable=True)
+    gen = PageGenerator(api.runtime, "/api/things/", _PagedResource, {"page_size": 2}, prefetch=3)
+    await anext(gen)
+    await asyncio.sleep(0.01)
+    assert server.in_flight == 1
+    await gen.aclose()
+    await asyncio.sleep(0.01)
+    assert server.in_flight == 0
+    assert len(httpx_mock.get_requests()) == 2
+
+    httpx_mock.reset()
+    first = {
+        "count": 6,
+        "next": f"{PAPERLESS_TEST_URL}/api/things/?page=2&page_size=2",
+        "previous": None,
+        "results": [{"id": 1}, {"id": 2}],
+    }
+    httpx_mock.add_response(url=f"{PAPERLESS_TEST_URL}/api/things/?page=1&page_size=2", json=first)
+    httpx_mock.add_response(
+        url=f"{PAPERLESS_TEST_URL}/api/things/?page=2&page_size=2", status_code=500
+    )
+    gen = PageGenerator(api.runtime, "/api/things/", _PagedResource, {"page_size": 2}, prefetch=2)
+    await anext(gen)
+    with pytest.raises(UnexpectedStatusError):
+        await anext(gen)
+    await gen.aclose()
+
+
+def test_adaptive_page_size_policy() -> None:
+    """Page sizes stay on a power-of-two grid, so offsets fall on page boundaries."""
+    policy = AdaptivePageSize(min_page_size=25, max_page_size=1000)
+    assert [policy.start(hint) for hint in (10, 150, 200, 5000)] == [25, 100, 200, 800]
+    assert (policy.shrink(100), policy.shrink(25)) == (50, None)
+
+    # fast and small pages double the size, if the offset is aligned to it
+    assert policy.next_size(100, 200, 0.1, 1000) == 200
+    assert policy.next_size(100, 300, 0.1, 1000) == 100
+    assert policy.next_size(800, 1600, 0.1, 1000) == 800
+    # slow or large pages halve it, moderate ones keep it
+    assert policy.next_size(100, 300, 2.0, 1000) == 50
+    assert policy.next_size(100, 300, 0.1, 3 * 1024 * 1024) == 50
+    assert policy.next_size(25, 300, 2.0, 1000) == 25
+    assert policy.next_size(100, 200, 0.7, 1000) == 100
+
+    with pytest.raises(ValidationError):
+        AdaptivePageSize(min_page_size=100, max_page_size=50)
+
+
+async def test_page_generator_adaptive_grows(httpx_mock: HTTPXMock, api: PaperlessClient) -> None:
+    """Fast pages grow the page size; every item is yielded exactly once, in order."""
+    httpx_mock.add_callback(_ListingServer(list(range(1, 301))), is_reusable=True)
+    policy = AdaptivePageSize(min_page_size=10, max_page_size=80)
+    with pytest.raises(ValueError, match="concurrency"):
+        PageGenerator(api.runtime, "/api/things/", _PagedResource, adaptive=policy, concurrency=2)
+
+    gen = PageGenerator(
+        api.runtime, "/api/things/", _PagedResource, {"page_size": 15}, adaptive=policy
+    )
+    pages = [page async for page in gen]
+    # growing from 10 to 20 waits for an offset divisible by 20
+    assert [page.page_size for page in pages] == [10, 10, 20, 40, 80, 80, 80]
+    assert [page.current_page for page in pages] == [1, 2, 2, 2, 2, 3, 4]
+    assert [item.id for page in pages for item in page] == list(range(1, 301))
+    assert gen.checkpoint().params["page_size"] == 80
+
+
+async def test_page_generator_adaptive_shrinks(httpx_mock: HTTPXMock, api: PaperlessClient) -> None:
+    """Large pages shrink the page size, starting at the given page."""
+    httpx_mock.add_callback(_ListingServer(list(range(1, 201))), is_reusable=True)
+    policy = AdaptivePageSize(min_page_size=10, target_bytes=200)
+    gen = PageGenerator(
+        api.runtime, "/api/things/", _PagedResource, {"page": 2, "page_size": 40}, adaptive=policy
+    )
+    pages = [page async for page in gen]
+    assert [page.page_size for page in pages[:4]] == [40, 20, 10, 10]
+    assert [item.id for page in pages for item in page] == list(range(41, 201))
+
+    # aclose() cancels the page requested ahead
+    gen = PageGenerator(api.runtime, "/api/things/", _PagedResource, adaptive=policy)
+    await anext(gen)
+    await gen.aclose()
+    with pytest.raises(StopAsyncIteration):
+        await anext(gen)
+
+
+async def test_page_generator_adaptive_ignores_waits(httpx_mock: HTTPXMock) -> None:
+    """Only the HTTP exchange counts as page duration, not waiting for the rate limit."""
+    httpx_mock.add_callback(_ListingServer(list(range(1, 121))), is_reusable=True)
+    limits = RateLimitPolicy(listing=RateLimit(rate=20, burst=1))
+    api = PaperlessClient(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, rate_limit=limits)
+    policy = AdaptivePageSize(min_page_size=10, max_page_size=40, target_seconds=0.02)
+
+    gen = PageGenerator(
+        api.runtime, "/api/things/", _PagedResource, {"page_size": 10}, adaptive=policy
+    )
+    pages = [page async for page in gen]
+    assert [page.page_size for page in pages] == [10, 10, 20, 40, 40]
+    assert api.metrics.rate_limit_waits[RequestKind.LISTING] >= 4
+    await api.close()
+
+
+async def test_page_generator_adaptive_timeouts(
+    httpx_mock: HTTPXMock, api: PaperlessClient
+) -> None:
+    """A page that times out is requested again at half its size."""
+    server = _ListingServer(list(range(1, 61)))
+    message = "Read timed out"
+
+    async def callback(request: httpx.Request) -> httpx.Response:
+        if int(request.url.params["page_size"]) > 10:
+            raise httpx.ReadTimeout(message)
+        return await server(request)
+
+    httpx_mock.add_callback(callback, is_reusable=True)
+    policy = AdaptivePageSize(min_page_size=10)
+    gen = PageGenerator(
+        api.runtime, "/api/things/", _PagedResource, {"page_size": 40}, adaptive=policy
+    )
+    pages = [page async for page in gen]
+    assert {page.page_size for page in pages} == {10}
+    assert [item.id for page in pages for item in page] == list(range(1, 61))
+
+    gen = PageGenerator(
+        api.runtime,
+        "/api/things/",
+        _PagedResource,
+        {"page_size": 20},
+        adaptive=AdaptivePageSize(min_page_size=20),
+    )
+    with pytest.raises(PaperlessTimeoutError):
+        await anext(gen)
+    await gen.aclose()
+
+
+async def test_pages_fanout_snapshot_per_service(
+    httpx_mock: HTTPXMock, paperless: PaperlessClient
+) -> None:
+    """Only services whose endpoint filters by id__in pin a snapshot."""
+    httpx_mock.add_callback(_ListingServer(list(range(1, 6))), is_reusable=True)
+
+    tags = [
+        tag.id async for page in paperless.tags.pages(page_size=2, concurrency=2) for tag in page
+    ]
+    users = [
+        user.id async for page in paperless.users.pages(page_size=2, concurrency=2) for user in page
+    ]
+    assert tags == users == [1, 2, 3, 4, 5]
+
+    requests = httpx_mock.get_requests()
+    tag_requests = [request for request in requests if request.url.path == "/api/tags/"]
+    user_requests = [request for request in requests if request.url.path == "/api/users/"]
+    assert ["id__in" in request.url.params for request in tag_requests] == [False, True, True]
+    assert not any("id__in" in request.url.params for request in user_requests)
+
+
+async def test_pages_keyset(httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
+    """Keyset iteration orders by id and requests every further page by its ids."""
+    server = _ListingServer(list(range(1, 8)))
+    httpx_mock.add_callback(server, is_reusable=True)
+
+    pages = paperless.documents.pages(page_size=3, keyset=True)
+    first = await anext(pages)
+    server.ids.insert(0, 99)  # a new item does not shift the scan
+    ids = [doc.id for doc in first] + [doc.id async for page in pages for doc in page]
+    assert ids == list(range(1, 8))
+
+    params = [request.url.params for request in httpx_mock.get_requests()[1:]]
+    assert {param["ordering"] for param in params} == {"id"}
+    assert {param["page"] for param in params} == {"1"}
+    assert [param.get("id__in") for param in params] == [None, "4,5,6", "7"]
+
+    # pages whose ids overflow the URL budget keep their id order
+    httpx_mock.reset()
+    server.ids = list(range(1, 121))
+    httpx_mock.add_callback(server, is_reusable=True)
+    api = PaperlessClient(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, max_url_length=200)
+    pages = api.documents.pages(page_size=50, keyset=True, concurrency=2)
+    assert [doc.id async for page in pages for doc in page] == list(range(1, 121))
+    requests = httpx_mock.get_requests()
+    assert len(requests) > 3
+    assert all(len(str(request.url)) <= 200 for request in requests)
+    await api.close()
+
+    # tags cannot be ordered by id, so they keep their ordering
+    tags = paperless.tags.pages(page_size=50, keyset=True)
+    assert [tag.id async for page in tags for tag in page] == list(range(1, 121))
+    tag_requests = httpx_mock.get_requests(url=re.compile(r".*/tags/.*"))
+    assert not any("ordering" in request.url.params for request in tag_requests)
+
+    with pytest.raises(ValueError, match="keyset"):
+        paperless.users.pages(keyset=True)
+    with pytest.raises(ValueError, match="adaptive"):
+        paperless.documents.pages(keyset=True, adaptive=AdaptivePageSize())
+
+
+async def test_pages_snapshot_slices_fit_url_budget(
+    httpx_mock: HTTPXMock, paperless: PaperlessClient
+) -> None:
+    """Snapshot slices too long for one URL are requested in chunks and joined in order."""
+    ids = list(range(100_001, 102_501))
+    server = _ListingServer(list(ids))
+    httpx_mock.add_callback(server, is_reusable=True)
+
+    pages = paperless.documents.pages(page_size=1000, keyset=True)
+    scanned = [[doc.id for doc in page] async for page in pages]
+    assert [len(page) for page in scanned] == [1000, 1000, 500]
+    assert [pk for page in scanned for pk in page] == ids
+
+    requests = httpx_mock.get_requests()
+    assert all(
+        len(str(request.url)) <= paperless.runtime.transport.max_url_length for request in requests
+    )
+    assert len(requests) > 3
+
+    # without a budget, every slice is a single request
+    httpx_mock.reset()
+    httpx_mock.add_callback(server, is_reusable=True)
+    paperless.runtime.transport._max_url_length = None
+    assert len([page async for page in paperless.documents.pages(page_size=1000, keyset=True)]) == 3
+    assert len(httpx_mock.get_requests()) == 3
+
+
+async def test_checkpoint_resume(httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
+    """A checkpoint survives serialization and resumes the scan with the next page."""
+    server = _ListingServer(list(range(1, 11)))
+    httpx_mock.add_callback(server, url=re.compile(r".*/documents/.*"), is_reusable=True)
+
+    async with paperless.documents.filter(page_size=3, fields=["title"]) as docs:
+        pages = docs.pages(prefetch=0)
+    assert pages.progress == (0, None, None, None)
+    assert [doc.id for doc in await anext(pages)] == [1, 2, 3]
+    await anext(pages)
+    done, total, rate, eta = pages.progress
+    assert (done, total) == (6, 10)
+    assert rate is not None
+    assert eta is not None
+    assert eta > 0
+
+    saved = pages.checkpoint().model_dump_json()
+    await pages.aclose()
+    checkpoint = PageCheckpoint.model_validate_json(saved)
+    assert (checkpoint.offset, checkpoint.last_id, checkpoint.watermark) == (6, 6, None)
+    assert checkpoint.partial
+    assert not checkpoint.finished
+
+    resumed = paperless.documents.resume(checkpoint)
+    pages_left = [page async for page in resumed]
+    assert [page.current_page for page in pages_left] == [3, 4]
+    assert [doc.id for page in pages_left for doc in page] == [7, 8, 9, 10]
+    assert pages_left[0].items[0].fetched_fields == {"id"}
+    assert resumed.progress[:2] == (10, 10)
+    assert resumed.progress.eta == 0
+    request = httpx_mock.get_requests(url=re.compile(r".*/documents/.*"))[2]
+    assert (request.url.params["page"], request.url.params["fields"]) == ("3", "id,title")
+
+    # a finished scan resumes without a request
+    finished = resumed.checkpoint()
+    assert finished.finished
+    assert [page async for page in paperless.documents.resume(finished)] == []
+    assert len(httpx_mock.get_requests(url=re.compile(r".*/documents/.*"))) == 4
+
+    with pytest.raises(ValueError, match="belongs to"):
+        paperless.tags.resume(checkpoint)
+
+
+async def test_checkpoint_resume_snapshot(
+    httpx_mock: HTTPXMock, paperless: PaperlessClient
+) -> None:
+    """A resumed snapshot scan continues behind the last id, up to the watermark."""
+    server = _ListingServer(list(range(1, 11)))
+    httpx_mock.add_callback(server, url=re.compile(r".*/documents/.*"), is_reusable=True)
+
+    pages = paperless.documents.pages(page_size=3, keyset=True)
+    await anext(pages)
+    await anext(pages)
+    checkpoint = pages.checkpoint()
+    await pages.aclose()
+    assert (checkpoint.offset, checkpoint.last_id, checkpoint.watermark) == (6, 6, 10)
+
+    # deletions before the position and later additions cannot shift the scan
+    server.ids = [1, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
+    resumed = paperless.documents.resume(checkpoint)
+    pages_left = [page async for page in resumed]
+    assert [doc.id for page in pages_left for doc in page] == [7, 8, 9, 10]
+    assert [page.current_page for page in pages_left] == [3, 4]
+    assert (pages_left[0].count, pages_left[0].next_page, pages_left[1].next) == (10, 4, None)
+    assert resumed.checkpoint().finished
+
+    params = [
+        request.url.params for request in httpx_mock.get_requests(url=re.compile(r".*/documents/"))
+    ]
+    assert (params[-3]["page"], params[-3]["page_size"]) == ("1", "1")
+    assert [param.get("id__in") for param in params[-2:]] == ["7,8,9", "10"]
+
+    # without an id ordering, the snapshot is resumed behind the position of the last id
+    server.ids = [5, 3, 9, 1, 7, 2, 8]
+    async with paperless.documents.filter(ordering="title") as docs:
+        pages = docs.pages(page_size=2, concurrency=2)
+    await anext(pages)
+    await anext(pages)
+    checkpoint = pages.checkpoint()
+    await pages.aclose()
+    assert (checkpoint.offset, checkpoint.last_id) == (4, 1)
+    server.ids = [5, 9, 1, 7, 2, 8]
+    resumed = paperless.documents.resume(checkpoint, concurrency=2)
+    assert [doc.id async for page in resumed for doc in page] == [7, 2, 8]
+
+    # tags ignore ordering=id, so their checkpoints resume by position as well
+    tag_checkpoint = PageCheckpoint(
+        path="/api/tags/",
+        params={"page_size": 2, "ordering": "id"},
+        offset=4,
+        last_id=1,
+        watermark=9,
+        count=7,
+    )
+    httpx_mock.add_callback(server, url=re.compile(r".*/tags/.*"), is_reusable=True)
+    resumed = paperless.tags.resume(tag_checkpoint, concurrency=2)
+    assert [tag.id async for page in resumed for tag in page] == [7, 2, 8]
+
+    # ... or behind the offset, once the last item yielded is gone as well
+    server.ids = [5, 3, 9, 7, 2, 8, 10]
+    resumed = paperless.documents.resume(checkpoint, concurrency=2)
+    assert [doc.id async for page in resumed for doc in page] == [2, 8]
+
+
+async def test_checkpoint_unordered_and_fallbacks(
+    httpx_mock: HTTPXMock, api: PaperlessClient
+) -> None:
+    """Pages yielded out of order count once the pages before them were yielded."""
+    server = _ListingServer(list(range(1, 11)), delays={2: 0.05})
+    httpx_mock.add_callback(server, is_reusable=True)
+
+    gen = PageGenerator(
+        api.runtime, "/api/things/", _PagedResource, {"page_size": 3}, concurrency=3, ordered=False
+    )
+    await anext(gen)
+    third = await anext(gen)
+    assert third.current_page != 2
+    assert gen.checkpoint().offset == 3
+    rest = [page async for page in gen]
+    assert gen.checkpoint().offset == 10
+    assert sum(len(page.results) for page in rest) == 4
+
+    # an adaptive scan resumes on a page boundary of its offset
+    checkpoint = PageCheckpoint(path="/api/things/", params={"page_size": 100}, offset=50)
+    gen = PageGenerator(
+        api.runtime,
+        "/api/things/",
+        _PagedResource,
+        checkpoint.params,
+        adaptive=AdaptivePageSize(min_page_size=25),
+        resume=checkpoint,
+    )
+    await gen.aclose()
+    assert (gen.params["page"], gen.params["page_size"]) == (2, 50)
+
+    # ... and without the policy, it counts from the page boundary it restarts on
+    httpx_mock.add_callback(_ListingServer(list(range(1, 341))), is_reusable=True)
+    checkpoint = PageCheckpoint(
+        path="/api/things/", params={"page_size": 100}, offset=150, count=340
+    )
+    gen = PageGenerator(
+        api.runtime, "/api/things/", _PagedResource, checkpoint.params, resume=checkpoint
+    )
+    assert gen.checkpoint().offset == 100
+    first = await anext(gen)
+    assert (first.results[0]["id"], gen.checkpoint().offset) == (101, 200)
+    assert not gen.checkpoint().finished
+    rest = [page async for page in gen]
+    assert [page.results[-1]["id"] for page in rest] == [300, 340]
+    assert (gen.checkpoint().offset, gen.checkpoint().finished) == (340, True)
+
+    # a snapshot checkpoint of an endpoint no longer listing ids resumes by page number
+    httpx_mock.reset()
+    httpx_mock.add_response(json={"count": 10, "next": None, "results": [{"id": 10}]})
+    httpx_mock.add_response(json={"count": 10, "next": None, "results": [{"id": 10}]})
+    checkpoint = PageCheckpoint(
+        path="/api/things/", params={"page_size": 3}, offset=9, watermark=10
+    )
+    gen = PageGenerator(
+        api.runtime,
+        "/api/things/",
+        _PagedResource,
+        checkpoint.params,
+        snapshot=True,
+        resume=checkpoint,
+    )
+    assert [page.current_page async for page in gen] == [4]
+
+
+async def test_aggregates(httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
+    """count(), exists(), first() and ids() each request a single item of the listing."""
+    server = _ListingServer(list(range(1, 8)))
+    httpx_mock.add_callback(server, url=re.compile(r".*/documents/.*"), is_reusable=True)
+
+    async with paperless.documents.filter(page_size=50, fields=["title"]) as docs:
+        assert await docs.count() == 7
+        assert await docs.exists() is True
+        assert await docs.ids() == list(range(1, 8))
+        first = await docs.first()
+    assert first is not None
+    assert first.id == 1
+    assert first.fetched_fields == {"id"}
+
+    params = [
+        request.url.params for request in httpx_mock.get_requests(url=re.compile(".*/documents/.*"))
+    ]
+    assert {(param["page"], param["page_size"]) for param in params} == {("1", "1")}
+    assert [param["fields"] for param in params] == ["id", "id", "id", "id,title"]
+
+    server.ids.clear()
+    assert await paperless.documents.count() == 0
+    assert await paperless.documents.exists() is False
+    assert await paperless.documents.first() is None
+    assert await paperless.documents.ids() == []
+
+
+async def test_iter_raw(httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
+    """iter_raw() yields the result dicts of every page without building models."""
+    server = _ListingServer(list(range(1, 8)))
+    httpx_mock.add_callback(server, url=re.compile(r".*/documents/.*"), is_reusable=True)
+
+    paperless.documents.request_permissions = True
+    async with paperless.documents.filter(page_size=3, fields=["title"]) as docs:
+        results = [data async for data in docs.iter_raw()]
+    assert results == [{"id": pk} for pk in range(1, 8)]
+
+    requests = httpx_mock.get_requests(url=re.compile(r".*/documents/.*"))
+    assert [request.url.params["page"] for request in requests] == ["1", "2", "3"]
+    assert all(request.url.params["full_perms"] == "true" for request in requests)
+    assert requests[0].url.params["fields"] == "id,title"
+
+
+async def test_batched(httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
+    """batched() yields lists of n items, the last one shorter."""
+    server = _ListingServer(list(range(1, 8)))
+    httpx_mock.add_callback(server, url=re.compile(r".*/documents/.*"), is_reusable=True)
+
+    batches = [[doc.id for doc in batch] async for batch in paperless.documents.batched(3)]
+    assert batches == [[1, 2, 3], [4, 5, 6], [7]]
+    server.ids = [1, 2, 3]
+    assert len([batch async for batch in paperless.documents.batched(3)]) == 1
+    with pytest.raises(ValueError, match="positive"):
+        await anext(paperless.documents.batched(0))
+
+
+async def test_map_concurrent(httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
+    """map_concurrent() bounds the calls in flight and reports errors per item."""
+    server = _ListingServer(list(range(1, 11)))
+    httpx_mock.add_callback(server, url=re.compile(r".*/documents/.*"), is_reusable=True)
+    running = peak = 0
+
+    async def fn(doc: Any) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            # earlier items take longer, so they finish last
+            await asyncio.sleep(0.002 * (11 - doc.id))
+            if doc.id == 4:
+                msg = "no notes"
+                raise LookupError(msg)
+            return doc.id * 10
+        finally:
+            running -= 1
+
+    outcomes = [outcome async for outcome in paperless.documents.map_concurrent(fn, concurrency=3)]
+    assert peak == 3
+    assert sorted(outcome.item.id for outcome in outcomes) == list(range(1, 11))
+    assert [outcome.item.id for outcome in outcomes] != list(range(1, 11))
+    (failed,) = [outcome for outcome in outcomes if outcome.error is not None]
+    assert (failed.item.id, failed.result, str(failed.error)) == (4, None, "no notes")
+
+    ordered = paperless.documents.map_concurrent(fn, concurrency=3, ordered=True)
+    assert [outcome.result async for outcome in ordered] == [10, 20, 30, None, *range(50, 101, 10)]
+
+    with pytest.raises(ValueError, match="positive"):
+        await anext(paperless.documents.map_concurrent(fn, concurrency=0))
+
+
+async def test_map_concurrent_cancelled_call(
+    httpx_mock: HTTPXMock, paperless: PaperlessClient
+) -> None:
+    """A call that is cancelled is reported as an error of its item only."""
+    server = _ListingServer([1, 2, 3])
+    httpx_mock.add_callback(server, url=re.compile(r".*/documents/.*"), is_reusable=True)
+
+    async def fn(doc: Any) -> int:
+        if doc.id == 2:
+            task = asyncio.current_task()
+            assert task is not None
+            task.cancel()
+            await asyncio.sleep(0)
+        return doc.id
+
+    outcomes = paperless.documents.map_concurrent(fn, ordered=True)
+    results = [(outcome.result, str(outcome.error)) async for outcome in outcomes]
+    assert results == [(1, "None"), (None, "The call was cancelled."), (3, "None")]
+
+
+async def test_map_concurrent_backpressure(
+    httpx_mock: HTTPXMock, paperless: PaperlessClient
+) -> None:
+    """Items are only pulled as results are consumed; abandoning cancels the calls."""
+    server = _ListingServer(list(range(1, 101)))
+    httpx_mock.add_callback(server, url=re.compile(r".*/documents/.*"), is_reusable=True)
+    cancelled = 0
+
+    async def fn(doc: Any) -> int:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(0 if doc.id == 1 else 1)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return doc.id
+
+    async with paperless.documents.filter(page_size=5) as docs:
+        outcomes = docs.map_concurrent(fn, concurrency=2)
+        assert (await anext(outcomes)).result == 1
+        await outcomes.aclose()
+    # the slot of the consumed result was not refilled yet
+    assert cancelled == 1
+    # the first page, one read-ahead, and no more
+    assert len(httpx_mock.get_requests(url=re.compile(r".*/documents/.*"))) <= 2
+
+    class Abort(BaseException):
+        pass
+
+    async def abort(_: Any) -> int:
+        raise Abort
+
+    # only exceptions are reported per item
+    with pytest.raises(Abort):
+        await anext(paperless.documents.map_concurrent(abort))
+
+
+async def test_limit(httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
+    """limit() sizes the first page to n and requests no page beyond it."""
+    server = _ListingServer(list(range(1, 51)))
+    httpx_mock.add_callback(server, url=re.compile(r".*/documents/.*"), is_reusable=True)
+
+    async with paperless.documents.filter(ordering=["-modified", "title"]) as docs:
+        assert [doc.id async for doc in docs.limit(20)] == list(range(1, 21))
+    (request,) = httpx_mock.get_requests(url=re.compile(r".*/documents/.*"))
+    assert request.url.params["page_size"] == "20"
+    assert request.url.params["ordering"] == "-modified,title"
+
+    # a server capping the page size is followed on demand, up to the limit
+    server.max_page_size = 8
+    assert [doc.id async for doc in paperless.documents.limit(20)] == list(range(1, 21))
+    assert len(httpx_mock.get_requests(url=re.compile(r".*/documents/.*"))) == 1 + 3
+
+    server.ids = [1, 2, 3]
+    assert [doc.id async for doc in paperless.documents.limit(20)] == [1, 2, 3]
+    with pytest.raises(ValueError, match="positive"):
+        await anext(paperless.documents.limit(0))
+
+
+async def test_split_in_filter(httpx_mock: HTTPXMock) -> None:
+    """Oversized __in filters run as several queries, merged into one stream."""
+    server = _ListingServer(list(range(1, 301)), tags={pk: {pk, pk + 1} for pk in range(1, 301)})
+    httpx_mock.add_callback(server, is_reusable=True)
+    api = PaperlessClient(
+        PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, max_concurrency=2, max_url_length=400
+    )
+
+    async with api.documents.filter(id__in=list(range(1, 301))) as docs:
+        assert sorted([doc.id async for doc in docs]) == list(range(1, 301))
+        assert await docs.count() == 300
+        assert sorted(await docs.ids()) == list(range(1, 301))
+        assert len([doc async for doc in docs.limit(5)]) == 5
+        assert await docs.first() is not None
+    requests = httpx_mock.get_requests()
+    assert all(len(str(request.url)) <= 400 for request in requests)
+    assert len({request.url.params["id__in"] for request in requests}) > 1
+
+    # overlapping chunks: every document has two tags, but is yielded once
+    async with api.documents.filter(tags__id__in=",".join(map(str, range(1, 302)))) as docs:
+        assert sorted([doc.id async for doc in docs]) == list(range(1, 301))
+        assert await docs.count() == 300
+        assert len([doc async for doc in docs.limit(500)]) == 300
+        assert sorted([data["id"] async for data in docs.iter_raw()]) == list(range(1, 301))
+    assert server.peak <= 2
+
+    # a top-k query cannot be answered from chunks merged as they arrive
+    async with api.documents.filter(id__in=list(range(1, 301)), ordering="-id") as docs:
+        with pytest.raises(ValueError, match="ordering"):
+            await docs.first()
+        with pytest.raises(ValueError, match="ordering"):
+            await anext(docs.limit(20))
+        assert len([doc async for doc in docs]) == 300
+
+    server.ids.clear()
+    async with api.documents.filter(id__in=list(range(1, 301))) as docs:
+        assert await docs.first() is None
+    await api.close()
+
+    # without a budget, the filter is sent as it is
+    api = PaperlessClient(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, max_url_length=None)
+    async with api.documents.filter(id__in=list(range(1, 301))) as docs:
+        assert await docs.count() == 0
+    assert len(str(httpx_mock.get_requests()[-1].url)) > 1000
+    await api.close()
+
+
+async def test_split_all_filter(httpx_mock: HTTPXMock, caplog: pytest.LogCaptureFixture) -> None:
+    """Oversized __all filters intersect the ids of their chunks."""
+    server = _ListingServer(
+        [1, 2, 3], tags={1: set(range(1, 151)), 2: set(range(1, 101)), 3: set(range(50, 151))}
+    )
+    httpx_mock.add_callback(server, is_reusable=True)
+    api = PaperlessClient(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, max_url_length=400)
+
+    async with api.documents.filter(tags__id__all=",".join(map(str, range(1, 151)))) as docs:
+        assert [doc.id async for doc in docs] == [1]
+        assert await docs.count() == 1
+    assert httpx_mock.get_requests()[-1].url.params["id__in"] == "1"
+
+    # resolved into a single id__in query, the ordering still holds
+    all_tags = ",".join(map(str, range(1, 151)))
+    async with api.documents.filter(tags__id__all=all_tags, ordering="-id") as docs:
+        first = await docs.first()
+        assert (first.id if first else None) == 1
+
+    server.tags[1].discard(150)
+    async with api.documents.filter(tags__id__all=",".join(map(str, range(1, 151)))) as docs:
+        assert [doc.id async for doc in docs] == []
+
+    # without id__in, the chunks of an __all filter cannot be intersected
+    too_long = ",".join(map(str, range(1, 151)))
+    async with api.users._store_filters(groups__id__all=too_long) as users:
+        assert await users.ids() == [1, 2, 3]
+    assert httpx_mock.get_requests()[-1].url.params["groups__id__all"] == too_long
+    assert "cannot split" in caplog.text
+
+    # filters that cannot be split to fit are sent as they are
+    async with api.documents.filter(title__icontains="x" * 400) as docs:
+        assert await docs.count() == 3
+    assert "do not fit" in caplog.text
+    async with api.documents.filter(title__icontains="x" * 300, id__in="1,2") as docs:
+        assert await docs.count() == 2
+    assert httpx_mock.get_requests()[-1].url.params["id__in"] == "1,2"
+    assert "no room for id__in" in caplog.text
+    await api.close()
+
+
+async def test_split_filter_error(httpx_mock: HTTPXMock) -> None:
+    """A failing chunk query raises from the merged stream."""
+    httpx_mock.add_response(status_code=500, is_reusable=True)
+    api = PaperlessClient(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, max_url_length=400)
+    async with api.documents.filter(id__in=list(range(1, 301))) as docs:
+        with pytest.raises(UnexpectedStatusError):
+            [doc async for doc in docs]
+    await api.close()
+
+
+async def test_aggregates_ids_without_all(
+    httpx_mock: HTTPXMock, paperless: PaperlessClient
+) -> None:
+    """ids() scans the raw pages when the endpoint does not list all ids."""
+    httpx_mock.add_response(
+        url=re.compile(r".*/tags/.*"), json={**DATA_TAGS, "next": None}, is_reusable=True
+    )
+    assert await paperless.tags.ids() == [tag["id"] for tag in DATA_TAGS["results"]]
+    assert "fields" not in httpx_mock.get_requests()[-1].url.params
+
+
+_LISTING = {
+    "count": 3,
+    "next": None,
+    "previous": None,
+    "all": [1, 2, 3],
+    "results": [
+        {"id": 1, "title": 'a "quoted" \\ title', "tags": [], "score": -1.5e3, "ok": True},
+        {"id": 2, "title": "Umlaute äöü {[", "extra": [{"note": "x,y}"}], "owner": None},
+        {"id": 3, "title": "", "nested": {"value": [1, [2]]}},
+    ],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_listing_parser(chunk_size: int) -> None:
+    """The parser yields every result item as soon as its bytes are complete."""
+    body = json.dumps(_LISTING, ensure_ascii=False, indent=1).encode()
+    parser = ListingParser()
+    items = []
+    for start in range(0, len(body), chunk_size):
+        completed = parser.feed(body[start : start + chunk_size])
+        if completed:
+            # the envelope arrives ahead of the results
+            assert parser.fields["count"] == 3
+        items.extend(completed)
+    parser.close()
+    assert items == _LISTING["results"]
+    assert parser.fields == {key: value for key, value in _LISTING.items() if key != "results"}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"[1, 2]", b'{"count": 3, "results": [{"id": 1}', b'{"count": 3} {', b'{"count" 3}'],
+)
+def test_listing_parser_errors(body: bytes) -> None:
+    """Malformed and truncated bodies raise ValueError."""
+
+    def parse() -> None:
+        parser = ListingParser()
+        parser.feed(body)
+        parser.close()
+
+    with pytest.raises(ValueError, match="list response"):
+        parse()
+
+
+async def test_stream(httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
+    """stream() yields validated models page by page and exposes the envelope."""
+    server = _ListingServer(list(range(1, 8)))
+    httpx_mock.add_callback(server, url=re.compile(r".*/documents/.*"), is_reusable=True)
+
+    async with paperless.documents.filter(id__in=[1, 2, 3, 4, 5, 6, 7]) as docs:
+        items = docs.stream(page_size=3, fields=["title"])
+        assert items.count is None
+        first = await anext(items)
+        assert items.count == 7
+        assert items.all_ids == list(range(1, 8))
+        assert items.next is not None
+        rest = [doc async for doc in items]
+    assert [doc.id for doc in [first, *rest]] == list(range(1, 8))
+    assert first.fetched_fields == {"id"}
+    assert items.next is None
+
+    requests = httpx_mock.get_requests(url=re.compile(r".*/documents/.*"))
+    assert [request.url.params["page"] for request in requests] == ["1", "2", "3"]
+    assert requests[0].url.params["fields"] == "id,title"
+    assert paperless.metrics.bytes_decoded > 0
+
+
+async def test_stream_first_item_early(httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
+    """The first item is yielded before the rest of its page was received."""
+    body = json.dumps(_LISTING).encode()
+    cut = body.index(b'{"id": 2')
+    released = asyncio.Event()
+
+    async def chunks() -> Any:
+        yield body[:cut]
+        await released.wait()
+        yield body[cut:]
+
+    httpx_mock.add_callback(
+        lambda _: httpx.Response(
+            200, headers={"content-type": "application/json"}, content=chunks()
+        ),
+        url=re.compile(r".*/documents/.*"),
+    )
+    items = paperless.documents.stream()
+    assert (await anext(items)).id == 1
+    released.set()
+    assert [doc.id async for doc in items] == [2, 3]
+
+
+async def test_stream_errors(httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
+    """Error responses raise like get(); abandoned streams release the response."""
+    url = re.compile(r".*/documents/.*")
+    httpx_mock.add_response(url=url, status_code=404, json={"detail": "Not found."})
+    with pytest.raises(NotFoundError):
+        await anext(paperless.documents.stream())
+
+    httpx_mock.add_response(url=url, text="<html>")
+    with pytest.raises(BadJsonResponseError):
+        await anext(paperless.documents.stream())
+
+    httpx_mock.add_response(url=url, status_code=401, json={"detail": "Invalid token."})
+    with pytest.raises(InvalidTokenError):
+        await anext(paperless.documents.stream())
+
+    httpx_mock.add_response(
+        url=url,
+        headers={"content-type": "application/json"},
+        content=b'{"count": 1, "results": [{"id": 1}',
+    )
+    with pytest.raises(ValueError, match="incomplete"):
+        [doc async for doc in paperless.documents.stream()]
+
+    httpx_mock.add_response(url=url, json=_LISTING)
+    items = paperless.documents.stream()
+    assert (await anext(items)).id == 1
+    await items.aclose()
+    with pytest.raises(StopAsyncIteration):
+        await anext(items)
+
+
 def test_page_last_page_raises_without_pagination_context(api: PaperlessClient) -> None:
     """Page.last_page raises RuntimeError instead of ZeroDivisionError when page_size is 0."""
     page = Page.from_data(
@@ -120,6 +120,69 @@ class TestDocuments:
         await paperless.documents.update(to_update)
         assert to_update.title == new_title
 
+    async def test_fields_projection(
+        self, httpx_mock: HTTPXMock, paperless: PaperlessClient
+    ) -> None:
+        """A projected document only PATCHes fetched fields that changed and assigned ones."""
+        data = DATA_DOCUMENTS["results"][0]
+        projected = {"id": 1, "title": data["title"], "tags": data["tags"]}
+        httpx_mock.add_response(
+            method="GET",
+            url=(
+                f"{PAPERLESS_TEST_URL}{EndpointPath.DOCUMENTS_SINGLE.format(pk=1)}"
+                "?fields=id%2Ctitle%2Ctags&truncate_content=true"
+            ),
+            json=projected,
+        )
+        document = await paperless.documents(1, fields=["title", "tags"], truncate_content=True)
+        assert document.fetched_fields == {"id", "title", "tags"}
+        assert document.content is None
+
+        with pytest.raises(ValueError, match="Partial models"):
+            await paperless.documents.update(document, only_changed=False)
+        assert await paperless.documents.update(document) is False
+
+        # owner=None equals its default, but was assigned, so it is sent anyway
+        document.title = "Renamed"
+        document.owner = None
+        httpx_mock.add_response(
+            method="PATCH",
+            url=f"{PAPERLESS_TEST_URL}{EndpointPath.DOCUMENTS_SINGLE.format(pk=1)}",
+            json={**data, "title": "Renamed", "owner": None},
+        )
+        assert await paperless.documents.update(document) is True
+        assert json.loads(httpx_mock.get_requests(method="PATCH")[0].content) == {
+            "title": "Renamed",
+            "owner": None,
+        }
+        assert document.fetched_fields is None
+        assert document.content == data["content"]
+
+    async def test_fields_projection_pages(
+        self, httpx_mock: HTTPXMock, paperless: PaperlessClient
+    ) -> None:
+        """pages() and filter() request the projection and yield partial documents."""
+        results = [{"id": item["id"], "title": item["title"]} for item in DATA_DOCUMENTS["results"]]
+        httpx_mock.add_response(
+            method="GET",
+            url=re.compile(r".*/documents/\?.*fields=id%2Ctitle"),
+            json={**DATA_DOCUMENTS, "next": None, "results": results},
+            is_reusable=True,
+        )
+
+        page = await anext(paperless.documents.pages(fields=["title"]))
+        assert all(doc.fetched_fields == {"id", "title"} for doc in page)
+
+        async with paperless.documents.filter(fields="title", truncate_content=True) as docs:
+            assert [doc.title async for doc in docs] == [item["title"] for item in results]
+        request = httpx_mock.get_requests()[-1]
+        assert request.url.params["truncate_content"] == "true"
+
+        with pytest.raises(ValueError, match="does not support field projection"):
+            paperless.tags.pages(fields=["name"])
+        with pytest.raises(ValueError, match="does not support field projection"):
+            await paperless.tags(1, truncate_content=True)
+
     async def test_delete(self, httpx_mock: HTTPXMock, paperless: PaperlessClient) -> None:
         """Deleting a document returns True on 204 and False on any other status."""
         httpx_mock.add_response(
@@ -3,6 +3,7 @@
 import asyncio
 import json as json_mod
 import re
+from collections.abc import Sequence
 
 import httpx
 import pytest
@@ -58,7 +59,7 @@ class _SharedServiceTests:
         )
         page = await anext(aiter(getattr(paperless, mapping.resource).pages(1)))
         assert isinstance(page, Page)
-        assert isinstance(page.items, list)
+        assert isinstance(page.items, Sequence)
         for item in page.items:
             assert isinstance(item, mapping.model_cls)
 
@@ -0,0 +1,1134 @@
+"""Tests for the transport layer: connection pool, concurrency budget and resilience."""
+
+import asyncio
+import gzip
+import importlib.util
+import json
+from typing import Any
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pypaperless import (
+    BalanceStrategy,
+    CircuitBreakerPolicy,
+    CircuitState,
+    HedgePolicy,
+    HttpCachePolicy,
+    PaperlessClient,
+    PaperlessSettings,
+    ProbeMode,
+    ProbePolicy,
+    RateLimit,
+    RateLimitPolicy,
+    ReplicaPolicy,
+    RequestKind,
+    RetryPolicy,
+    generate_api_token,
+)
+from pypaperless.circuit_breaker import CircuitBreaker
+from pypaperless.exceptions import (
+    CircuitOpenError,
+    PaperlessConnectionError,
+    PaperlessTimeoutError,
+    UnexpectedStatusError,
+)
+from pypaperless.http_cache import CacheEntry, HttpCache
+from pypaperless.probe import HostInfo
+from pypaperless.rate_limit import TokenBucket
+from pypaperless.transport import PaperlessTransport
+
+from .const import PAPERLESS_TEST_TOKEN, PAPERLESS_TEST_URL
+from .data import DATA_TAGS
+
+# ---------------------------------------------------------------------------
+# Connection pool and concurrency budget
+# ---------------------------------------------------------------------------
+
+
+async def test_pool_settings_shape_internal_client() -> None:
+    """The internally created client uses the configured limits and pool timeout."""
+    transport = PaperlessTransport(
+        PAPERLESS_TEST_URL,
+        PAPERLESS_TEST_TOKEN,
+        max_connections=8,
+        max_keepalive_connections=4,
+        keepalive_expiry=30.0,
+        pool_timeout=1.5,
+    )
+    client = transport._create_client()
+    assert client.timeout.pool == 1.5
+    assert transport._limits.max_connections == 8
+    assert transport._limits.max_keepalive_connections == 4
+    assert transport._limits.keepalive_expiry == 30.0
+    await client.aclose()
+
+
+async def test_max_concurrency_bounds_in_flight_requests(httpx_mock: HTTPXMock) -> None:
+    """No more than max_concurrency requests are in flight at any time."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, max_concurrency=3)
+    assert transport.max_concurrency == 3
+    in_flight = 0
+    peak = 0
+
+    async def slow_response(_: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    httpx_mock.add_callback(slow_response, is_reusable=True)
+
+    await asyncio.gather(*(transport.get(f"/api/tags/{pk}/") for pk in range(12)))
+    assert peak == 3
+    await transport.close()
+
+
+async def test_max_concurrency_holds_slot_while_streaming(httpx_mock: HTTPXMock) -> None:
+    """A streamed response keeps its concurrency slot until its context exits."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, max_concurrency=1)
+    seen: list[str] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"id": 1})
+
+    httpx_mock.add_callback(record, is_reusable=True)
+
+    async with transport.stream("/api/documents/") as body:
+        waiting = asyncio.ensure_future(transport.get("/api/tags/1/"))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+        assert seen == ["/api/documents/"]
+        assert json.loads(b"".join([chunk async for chunk in body])) == {"id": 1}
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+
+    assert await waiting == {"id": 1}
+    assert seen == ["/api/documents/", "/api/tags/1/"]
+    await transport.close()
+
+
+async def test_max_concurrency_releases_slot_of_failed_streams(httpx_mock: HTTPXMock) -> None:
+    """Retried and failed streamed requests give their concurrency slot back."""
+    transport = PaperlessTransport(
+        PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, retry=_FAST_RETRY, max_concurrency=1
+    )
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(json={"id": 1})
+    async with transport.stream("/api/documents/") as body:
+        assert json.loads(b"".join([chunk async for chunk in body])) == {"id": 1}
+
+    httpx_mock.add_exception(httpx.ConnectError("refused"), is_reusable=True)
+    with pytest.raises(PaperlessConnectionError):
+        async with transport.stream("/api/documents/"):
+            pass
+    assert transport._semaphore is not None
+    assert not transport._semaphore.locked()
+    await transport.close()
+
+
+def test_max_concurrency_must_be_positive() -> None:
+    """A zero concurrency budget would deadlock every request and is rejected."""
+    with pytest.raises(ValueError, match="max_concurrency"):
+        PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, max_concurrency=0)
+
+
+def test_max_url_length_option() -> None:
+    """The URL budget defaults to 4000 characters and must be positive."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN)
+    assert transport.max_url_length == 4000
+    with pytest.raises(ValueError, match="max_url_length"):
+        PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, max_url_length=0)
+
+
+async def test_pool_timeout_raises_timeout_error(httpx_mock: HTTPXMock) -> None:
+    """Pool exhaustion surfaces as PaperlessTimeoutError with a dedicated message."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN)
+    httpx_mock.add_exception(httpx.PoolTimeout("pool exhausted"))
+    with pytest.raises(PaperlessTimeoutError, match="free connection"):
+        await transport.get("/api/tags/")
+    await transport.close()
+
+
+def test_pool_settings_from_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pool and concurrency settings are read from the environment and passed through."""
+    monkeypatch.setenv("PYPAPERLESS_URL", PAPERLESS_TEST_URL)
+    monkeypatch.setenv("PYPAPERLESS_MAX_CONCURRENCY", "5")
+    monkeypatch.setenv("PYPAPERLESS_MAX_CONNECTIONS", "10")
+    api = PaperlessClient.from_env()
+    transport = api.runtime.transport
+    assert transport.max_concurrency == 5
+    assert transport._limits.max_connections == 10
+
+    monkeypatch.delenv("PYPAPERLESS_MAX_CONCURRENCY")
+    cfg = PaperlessSettings(url=PAPERLESS_TEST_URL, pool_timeout=2.0)
+    api = PaperlessClient.from_config(cfg)
+    assert api.runtime.transport._timeout.pool == 2.0
+    assert api.runtime.transport.max_concurrency is None
+
+
+# ---------------------------------------------------------------------------
+# Retry policy
+# ---------------------------------------------------------------------------
+
+_FAST_RETRY = RetryPolicy(max_attempts=3, backoff_base=0.001, jitter=False)
+
+
+async def test_retry_on_transient_status(httpx_mock: HTTPXMock) -> None:
+    """GET requests are retried on 503 and succeed once the server recovers."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, retry=_FAST_RETRY)
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(status_code=502)
+    httpx_mock.add_response(json={"id": 1})
+
+    assert await transport.get("/api/tags/1/") == {"id": 1}
+    assert transport.metrics.requests == 3
+    assert transport.metrics.retries == 2
+    assert transport.metrics.retry_reasons == {"503": 1, "502": 1}
+    await transport.close()
+
+
+async def test_stream_retries_and_skips_hedging(httpx_mock: HTTPXMock) -> None:
+    """Streamed GET requests are retried, but never hedged."""
+    transport = PaperlessTransport(
+        PAPERLESS_TEST_URL,
+        PAPERLESS_TEST_TOKEN,
+        retry=_FAST_RETRY,
+        hedge=HedgePolicy(delay=0.001),
+    )
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_callback(_delayed_json({"id": 1}, delay=0.02))
+
+    async with transport.stream("/api/documents/") as body:
+        assert json.loads(b"".join([chunk async for chunk in body])) == {"id": 1}
+    assert (transport.metrics.requests, transport.metrics.retries) == (2, 1)
+    assert transport.metrics.hedges == 0
+    assert transport.metrics.bytes_decoded == len(b'{"id":1}')
+    await transport.close()
+
+
+async def test_retry_on_connection_error(httpx_mock: HTTPXMock) -> None:
+    """Transport errors are retried before surfacing as PaperlessConnectionError."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, retry=_FAST_RETRY)
+    httpx_mock.add_exception(httpx.ConnectError("refused"))
+    httpx_mock.add_response(json={"id": 1})
+    assert await transport.get("/api/tags/1/") == {"id": 1}
+    assert transport.metrics.retry_reasons == {"ConnectError": 1}
+
+    httpx_mock.add_exception(httpx.ReadTimeout("slow"), is_reusable=True)
+    with pytest.raises(PaperlessTimeoutError):
+        await transport.get("/api/tags/2/")
+    assert transport.metrics.retries_exhausted == 1
+    await transport.close()
+
+
+async def test_retry_exhausted_returns_last_response(httpx_mock: HTTPXMock) -> None:
+    """When all attempts fail, the last status error is raised as before."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, retry=_FAST_RETRY)
+    httpx_mock.add_response(status_code=503, is_reusable=True)
+    with pytest.raises(UnexpectedStatusError):
+        await transport.get("/api/tags/")
+    assert transport.metrics.requests == 3
+    assert transport.metrics.retries == 2
+    assert transport.metrics.retries_exhausted == 1
+    await transport.close()
+
+
+async def test_retry_skips_non_idempotent_post(httpx_mock: HTTPXMock) -> None:
+    """POST is only retried when opted in by both the policy and the caller."""
+    policy = _FAST_RETRY.model_copy(update={"retry_idempotent_posts": True})
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, retry=policy)
+
+    httpx_mock.add_response(method="POST", status_code=503)
+    with pytest.raises(UnexpectedStatusError):
+        await transport.post("/api/documents/bulk_edit/", json={})
+    assert transport.metrics.retries == 0
+
+    httpx_mock.add_response(method="POST", status_code=503)
+    httpx_mock.add_response(method="POST", json={"result": "OK"})
+    res = await transport.post("/api/documents/bulk_edit/", json={}, idempotent=True)
+    assert res == {"result": "OK"}
+    assert transport.metrics.retries == 1
+    await transport.close()
+
+
+async def test_bulk_edit_marks_idempotent_operations(
+    httpx_mock: HTTPXMock, paperless: PaperlessClient
+) -> None:
+    """Value-assigning bulk edits are retried, toggling operations are not."""
+    paperless.runtime.transport._retry = _FAST_RETRY.model_copy(
+        update={"retry_idempotent_posts": True}
+    )
+    httpx_mock.add_response(method="POST", status_code=502)
+    httpx_mock.add_response(method="POST", json={"result": "OK"})
+    await paperless.documents.bulk_edit.add_tag([1, 2], 3)
+
+    httpx_mock.add_response(method="POST", status_code=502)
+    with pytest.raises(UnexpectedStatusError):
+        await paperless.documents.bulk_edit.rotate([1, 2], 90)
+    assert paperless.metrics.retries == 1
+
+
+async def test_retry_honors_retry_after(httpx_mock: HTTPXMock) -> None:
+    """A Retry-After header replaces the backoff; values above backoff_max end the loop."""
+    policy = RetryPolicy(max_attempts=5, backoff_base=0.001, backoff_max=1.0)
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, retry=policy)
+    httpx_mock.add_response(status_code=429, headers={"Retry-After": "0"})
+    httpx_mock.add_response(json={})
+    await transport.get("/api/tags/")
+    assert transport.metrics.retries == 1
+
+    httpx_mock.add_response(status_code=429, headers={"Retry-After": "120"})
+    with pytest.raises(UnexpectedStatusError):
+        await transport.get("/api/tags/")
+    assert transport.metrics.retries_exhausted == 1
+    await transport.close()
+
+
+async def test_retry_max_elapsed_budget(httpx_mock: HTTPXMock) -> None:
+    """A request stops retrying once its elapsed-time budget would be exceeded."""
+    policy = RetryPolicy(max_attempts=10, backoff_base=0.05, jitter=False, max_elapsed=0.01)
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, retry=policy)
+    httpx_mock.add_response(status_code=503)
+    with pytest.raises(UnexpectedStatusError):
+        await transport.get("/api/tags/")
+    assert transport.metrics.requests == 1
+    await transport.close()
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("3", 3.0),
+        ("-1", 0.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("Wed, 21 Oct 2015 07:28:00", 0.0),
+        ("soon", None),
+    ],
+)
+def test_retry_after_parsing(header: str | None, expected: float | None) -> None:
+    """Retry-After accepts delta-seconds and HTTP dates; garbage is ignored."""
+    headers = {"Retry-After": header} if header is not None else {}
+    res = httpx.Response(429, headers=headers)
+    assert RetryPolicy().retry_after(res) == expected
+    assert RetryPolicy(respect_retry_after=False).retry_after(res) is None
+
+
+def test_retry_backoff_is_capped() -> None:
+    """The computed backoff grows exponentially up to backoff_max; jitter stays within it."""
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 4.0, 4.0]
+    jittered = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+    assert all(0 <= jittered.backoff(n) <= 4.0 for n in range(1, 10))
+
+
+def test_retry_policy_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The retry policy can be configured with nested environment variables."""
+    monkeypatch.setenv("PYPAPERLESS_URL", PAPERLESS_TEST_URL)
+    monkeypatch.setenv("PYPAPERLESS_RETRY__MAX_ATTEMPTS", "7")
+    api = PaperlessClient.from_env()
+    assert api.runtime.transport._retry == RetryPolicy(max_attempts=7)
+    api.metrics.retries = 3
+    api.metrics.reset()
+    assert api.metrics.retries == 0
+
+
+# ---------------------------------------------------------------------------
+# HTTP/2
+# ---------------------------------------------------------------------------
+
+
+def test_http2_falls_back_without_h2(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Requesting HTTP/2 without the h2 package logs a warning and keeps HTTP/1.1."""
+    monkeypatch.setattr(importlib.util, "find_spec", lambda _: None)
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, http2=True)
+    assert transport.http2 is False
+    assert "falling back to HTTP/1.1" in caplog.text
+
+
+def test_http2_enabled_with_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    """HTTP/2 is enabled when h2 is importable; settings pass the flag through."""
+    monkeypatch.setattr(importlib.util, "find_spec", lambda _: object())
+    cfg = PaperlessSettings(url=PAPERLESS_TEST_URL, http2=True)
+    assert PaperlessClient.from_config(cfg).runtime.transport.http2 is True
+    assert PaperlessClient(PAPERLESS_TEST_URL).runtime.transport.http2 is False
+
+
+async def test_http2_internal_client() -> None:
+    """The internally created client negotiates HTTP/2 when h2 is installed."""
+    pytest.importorskip("h2")
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, http2=True)
+    client = transport._create_client()
+    assert client._transport._pool._http2  # type: ignore[attr-defined]
+    await client.aclose()
+
+
+# ---------------------------------------------------------------------------
+# Request coalescing
+# ---------------------------------------------------------------------------
+
+
+def _delayed_json(payload: Any, delay: float = 0.01) -> Any:
+    """Return an async pytest-httpx callback answering with *payload* after *delay*."""
+
+    async def callback(_: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json=payload)
+
+    return callback
+
+
+async def test_coalesce_identical_gets(httpx_mock: HTTPXMock) -> None:
+    """Concurrent GETs with equal URL and params share one round trip."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, coalesce_requests=True)
+    httpx_mock.add_callback(_delayed_json({"id": 5}), is_reusable=True)
+
+    results = await asyncio.gather(
+        transport.get("/api/tags/5/", params={"a": 1, "b": 2}),
+        transport.get(f"{PAPERLESS_TEST_URL}/api/tags/5/", params={"b": "2", "a": "1"}),
+        transport.get("/api/tags/5/?b=2&a=1"),
+        transport.get("/api/tags/5/", params={"a": 2, "b": 2}),
+    )
+    assert results == [{"id": 5}] * 4
+    assert len(httpx_mock.get_requests()) == 2
+    assert transport.metrics.coalesced == 2
+    assert transport._in_flight == {}
+    await transport.close()
+
+
+async def test_coalesce_gives_every_caller_its_own_model(
+    httpx_mock: HTTPXMock, paperless: PaperlessClient
+) -> None:
+    """Coalesced service calls build separate model instances from the shared payload."""
+    paperless.runtime.transport._coalesce_requests = True
+    httpx_mock.add_callback(_delayed_json(DATA_TAGS["results"][0]))
+
+    first, second = await asyncio.gather(paperless.tags(1), paperless.tags(1))
+    assert first is not second
+    first.name = "changed"
+    assert second.name == DATA_TAGS["results"][0]["name"]
+
+
+async def test_coalesce_survives_cancelled_caller(httpx_mock: HTTPXMock) -> None:
+    """Cancelling one caller does not cancel the request shared with others."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, coalesce_requests=True)
+    httpx_mock.add_callback(_delayed_json({"id": 1}, delay=0.05))
+
+    leader = asyncio.ensure_future(transport.get("/api/tags/1/"))
+    follower = asyncio.ensure_future(transport.get("/api/tags/1/"))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    assert await follower == {"id": 1}
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    await transport.close()
+
+
+async def test_coalesce_never_joins_cancelled_request(httpx_mock: HTTPXMock) -> None:
+    """A caller arriving after the last waiter was cancelled starts a fresh request."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, coalesce_requests=True)
+    httpx_mock.add_callback(_delayed_json({"id": 1}, delay=0.05), is_reusable=True)
+
+    abandoned = asyncio.ensure_future(transport.get("/api/tags/1/"))
+    await asyncio.sleep(0.01)
+    abandoned.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await abandoned
+    assert await transport.get("/api/tags/1/") == {"id": 1}
+    assert transport.metrics.coalesced == 0
+    await transport.close()
+
+
+async def test_coalesce_shares_errors_and_skips_custom_requests(httpx_mock: HTTPXMock) -> None:
+    """Errors reach all coalesced callers; requests with extra kwargs are never shared."""
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, coalesce_requests=True)
+    httpx_mock.add_response(status_code=500)
+    results = await asyncio.gather(
+        transport.get("/api/tags/1/"), transport.get("/api/tags/1/"), return_exceptions=True
+    )
+    assert all(isinstance(res, UnexpectedStatusError) for res in results)
+
+    httpx_mock.add_response(json={}, is_reusable=True)
+    headers = {"X-Custom": "1"}
+    await asyncio.gather(
+        transport.get("/api/tags/1/", headers=headers),
+        transport.get("/api/tags/1/", headers=headers),
+    )
+    assert len(httpx_mock.get_requests()) == 3
+    await transport.close()
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET cache
+# ---------------------------------------------------------------------------
+
+
+def _etag_endpoint(payload: Any, etag: str = '"v1"') -> Any:
+    """Return a pytest-httpx callback answering 304 while the client sends *etag*."""
+
+    def callback(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=payload, headers={"ETag": etag})
+
+    return callback
+
+
+async def test_http_cache_revalidates_with_etag(httpx_mock: HTTPXMock) -> None:
+    """A 304 answer is served from the cache as a fresh payload per call."""
+    transport = PaperlessTransport(
+        PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, http_cache=HttpCachePolicy()
+    )
+    httpx_mock.add_callback(_etag_endpoint({"documents_total": 3}), is_reusable=True)
+
+    first = await transport.get("/api/statistics/")
+    second = await transport.get("/api/statistics/")
+    assert first == second == {"documents_total": 3}
+    assert first is not second
+
+    requests = httpx_mock.get_requests()
+    assert "if-none-match" not in requests[0].headers
+    assert requests[1].headers["if-none-match"] == '"v1"'
+    metrics = transport.metrics
+    assert (metrics.cache_misses, metrics.cache_revalidations, metrics.cache_hits) == (1, 1, 1)
+    assert metrics.cache_bytes_saved == len(b'{"documents_total":3}')
+    await transport.close()
+
+
+async def test_http_cache_last_modified_and_changes(httpx_mock: HTTPXMock) -> None:
+    """Last-Modified is sent back; changed or validator-less answers replace the entry."""
+    transport = PaperlessTransport(
+        PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, http_cache=HttpCachePolicy()
+    )
+    modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+    httpx_mock.add_response(json={"v": 1}, headers={"Last-Modified": modified})
+    httpx_mock.add_response(json={"v": 2}, headers={"ETag": '"v2"'})
+    httpx_mock.add_response(json={"v": 3})
+    httpx_mock.add_response(json={"v": 4})
+
+    assert [await transport.get("/api/status/") for _ in range(4)] == [
+        {"v": 1},
+        {"v": 2},
+        {"v": 3},
+        {"v": 4},
+    ]
+    requests = httpx_mock.get_requests()
+    assert requests[1].headers["if-modified-since"] == modified
+    assert requests[2].headers["if-none-match"] == '"v2"'
+    assert "if-none-match" not in requests[3].headers
+    assert transport.metrics.cache_hits == 0
+    await transport.close()
+
+
+async def test_http_cache_key_includes_params_and_token(httpx_mock: HTTPXMock) -> None:
+    """Entries are kept apart by query parameters and API token."""
+    policy = HttpCachePolicy()
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, http_cache=policy)
+    httpx_mock.add_callback(_etag_endpoint({"count": 0}), is_reusable=True)
+
+    await transport.get("/api/tags/", params={"page": 1})
+    await transport.get("/api/tags/", params={"page": 2})
+    assert transport.metrics.cache_revalidations == 0
+    await transport.get("/api/tags/?page=1")
+    assert transport.metrics.cache_hits == 1
+
+    other = PaperlessTransport(PAPERLESS_TEST_URL, "other-token", http_cache=policy)
+    other._http_cache = transport._http_cache
+    await other.get("/api/tags/", params={"page": 1})
+    assert other.metrics.cache_revalidations == 0
+    await transport.close()
+    await other.close()
+
+
+def test_http_cache_eviction() -> None:
+    """The cache is bounded by entry count and body bytes, evicting LRU entries first."""
+    cache = HttpCache(HttpCachePolicy(max_entries=2, max_bytes=10))
+
+    def entry(size: int) -> CacheEntry:
+        return CacheEntry(body=b"x" * size, etag='"e"', last_modified=None)
+
+    cache.put(("a", (), None), entry(4))
+    cache.put(("b", (), None), entry(4))
+    assert cache.get(("a", (), None)) is not None
+    cache.put(("c", (), None), entry(4))
+    assert cache.get(("b", (), None)) is None
+    assert (len(cache), cache.size) == (2, 8)
+
+    cache.put(("d", (), None), entry(7))
+    assert (len(cache), cache.size) == (1, 7)
+    cache.put(("e", (), None), entry(11))
+    assert cache.get(("e", (), None)) is None
+
+    cache.clear()
+    assert (len(cache), cache.size) == (0, 0)
+
+
+def test_http_cache_policy_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The cache policy is read from nested environment variables."""
+    monkeypatch.setenv("PYPAPERLESS_URL", PAPERLESS_TEST_URL)
+    monkeypatch.setenv("PYPAPERLESS_HTTP_CACHE__MAX_ENTRIES", "8")
+    paperless = PaperlessClient.from_env()
+    cache = paperless.runtime.transport._http_cache
+    assert cache is not None
+    assert cache._policy.max_entries == 8
+
+
+# ---------------------------------------------------------------------------
+# Compression
+# ---------------------------------------------------------------------------
+
+
+def test_compression_accepts_installed_decoders(monkeypatch: pytest.MonkeyPatch) -> None:
+    """By default every encoding with an installed decoder is accepted."""
+    installed = {"brotlicffi"}
+    monkeypatch.setattr(
+        importlib.util, "find_spec", lambda name: object() if name in installed else None
+    )
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN)
+    assert transport.accept_encoding == "br, gzip, deflate"
+
+
+def test_compression_is_configurable(caplog: pytest.LogCaptureFixture) -> None:
+    """Requested encodings keep their order; unknown ones are dropped with a warning."""
+    transport = PaperlessTransport(
+        PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, compression=["deflate", "lzma", "gzip"]
+    )
+    assert transport.accept_encoding == "deflate, gzip"
+    assert "'lzma' is unknown" in caplog.text
+
+    disabled = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, compression=[])
+    assert disabled.accept_encoding == "identity"
+
+    cfg = PaperlessSettings(url=PAPERLESS_TEST_URL, compression=["gzip"])
+    assert PaperlessClient.from_config(cfg).runtime.transport.accept_encoding == "gzip"
+
+
+async def test_compression_counts_wire_and_decoded_bytes(httpx_mock: HTTPXMock) -> None:
+    """Compressed responses are decoded; wire and decoded sizes are both recorded."""
+    body = json.dumps({"content": "lorem ipsum " * 500}).encode()
+    compressed = gzip.compress(body)
+    httpx_mock.add_callback(
+        lambda _: httpx.Response(
+            200,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            stream=httpx.ByteStream(compressed),
+        ),
+        match_headers={"Accept-Encoding": "gzip"},
+    )
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, compression=["gzip"])
+
+    assert await transport.get("/api/documents/1/") == json.loads(body)
+    assert transport.metrics.bytes_received == len(compressed)
+    assert transport.metrics.bytes_decoded == len(body)
+    await transport.close()
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+def test_request_kind_defaults() -> None:
+    """Reads default to ITEM, everything else to WRITE."""
+    assert RequestKind.for_method("get") is RequestKind.ITEM
+    assert RequestKind.for_method("HEAD") is RequestKind.ITEM
+    assert RequestKind.for_method("patch") is RequestKind.WRITE
+    assert RequestKind.for_method("post") is RequestKind.WRITE
+
+
+async def test_token_bucket_paces_requests() -> None:
+    """A bucket allows a burst, then one token per 1/rate seconds, in arrival order."""
+    bucket = TokenBucket(RateLimit(rate=100, burst=2))
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    waits = await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+    assert waits[:2] == [0.0, 0.0]
+    assert all(wait > 0 for wait in waits[2:])
+    assert waits[2] < waits[3] < waits[4]
+    assert loop.time() - started >= 0.029
+
+
+async def test_rate_limit_budgets_per_kind(httpx_mock: HTTPXMock) -> None:
+    """Listing traffic is limited while single-item fetches stay unlimited."""
+    limits = RateLimitPolicy(listing=RateLimit(rate=50), download=RateLimit(rate=50))
+    paperless = PaperlessClient(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, rate_limit=limits)
+    httpx_mock.add_response(
+        url=f"{PAPERLESS_TEST_URL}/api/tags/1/", json=DATA_TAGS["results"][0], is_reusable=True
+    )
+    httpx_mock.add_response(
+        url=f"{PAPERLESS_TEST_URL}/api/tags/?page=1&page_size=150", json=DATA_TAGS, is_reusable=True
+    )
+
+    await asyncio.gather(*(paperless.tags(1) for _ in range(3)))
+    assert not paperless.metrics.rate_limit_waits
+
+    pages = [page async for page in paperless.tags.pages()]
+    pages += [page async for page in paperless.tags.pages()]
+    assert len(pages) == 2
+    assert paperless.metrics.rate_limit_waits == {RequestKind.LISTING: 1}
+    assert paperless.metrics.rate_limit_wait_seconds[RequestKind.LISTING] > 0
+    await paperless.close()
+
+
+def test_rate_limit_policy_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Rate budgets are read from nested environment variables."""
+    monkeypatch.setenv("PYPAPERLESS_URL", PAPERLESS_TEST_URL)
+    monkeypatch.setenv("PYPAPERLESS_RATE_LIMIT__WRITE__RATE", "2.5")
+    paperless = PaperlessClient.from_env()
+    assert set(paperless.runtime.transport._buckets) == {RequestKind.WRITE}
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+
+
+async def test_circuit_breaker_opens_after_consecutive_failures(httpx_mock: HTTPXMock) -> None:
+    """Consecutive failures open the breaker; open requests fail fast without a request."""
+    policy = CircuitBreakerPolicy(failure_threshold=2, reset_timeout=60)
+    paperless = PaperlessClient(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, circuit_breaker=policy)
+    assert paperless.circuit_state is CircuitState.CLOSED
+    assert PaperlessClient(PAPERLESS_TEST_URL).circuit_state is None
+
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+    httpx_mock.add_response(status_code=503)
+    with pytest.raises(PaperlessConnectionError):
+        await paperless.runtime.transport.get("/api/tags/")
+    with pytest.raises(UnexpectedStatusError):
+        await paperless.runtime.transport.get("/api/tags/")
+    assert paperless.circuit_state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await paperless.runtime.transport.get("/api/tags/")
+    assert 0 < exc_info.value.retry_in <= 60
+    assert len(httpx_mock.get_requests()) == 2
+    assert (paperless.metrics.circuit_opened, paperless.metrics.circuit_rejected) == (1, 1)
+    await paperless.close()
+
+
+async def test_circuit_breaker_error_rate() -> None:
+    """The breaker opens once the error rate over a full window reaches the limit."""
+    breaker = CircuitBreaker(
+        CircuitBreakerPolicy(failure_threshold=None, error_rate=0.75, window=4)
+    )
+    for _ in range(3):
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+    assert breaker.record_failure() is True
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.record_failure() is False
+    breaker.record_success()
+    assert breaker.state is CircuitState.OPEN
+
+
+async def test_circuit_breaker_half_open_trials(httpx_mock: HTTPXMock) -> None:
+    """After the reset timeout, trial requests close or reopen the breaker."""
+    policy = CircuitBreakerPolicy(failure_threshold=1, reset_timeout=10, half_open_probes=1)
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, circuit_breaker=policy)
+    breaker = transport.circuit_breaker
+    assert breaker is not None
+
+    httpx_mock.add_response(status_code=502)
+    with pytest.raises(UnexpectedStatusError):
+        await transport.get("/api/status/")
+    assert breaker.state is CircuitState.OPEN
+
+    # a failed trial reopens the breaker
+    breaker._opened_at -= 10
+    assert breaker.state is CircuitState.HALF_OPEN
+    httpx_mock.add_exception(httpx.ReadTimeout("Read timed out"))
+    with pytest.raises(PaperlessTimeoutError):
+        await transport.get("/api/status/")
+    assert breaker.state is CircuitState.OPEN
+
+    # only one trial at a time; a cancelled trial gives its slot back
+    breaker._opened_at -= 10
+    httpx_mock.add_callback(_delayed_json({}, delay=0.05))
+    trial = asyncio.ensure_future(transport.get("/api/status/"))
+    await asyncio.sleep(0.01)
+    with pytest.raises(CircuitOpenError):
+        await transport.get("/api/status/")
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    httpx_mock.add_response(json={})
+    assert await transport.get("/api/status/") == {}
+    assert breaker.state is CircuitState.CLOSED
+    await transport.close()
+
+
+async def test_circuit_breaker_ignores_pool_timeouts(httpx_mock: HTTPXMock) -> None:
+    """Waiting for a local connection is no server failure and never opens the breaker."""
+    policy = CircuitBreakerPolicy(failure_threshold=1, reset_timeout=10, half_open_probes=1)
+    transport = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, circuit_breaker=policy)
+    breaker = transport.circuit_breaker
+    assert breaker is not None
+
+    httpx_mock.add_exception(httpx.PoolTimeout("pool exhausted"))
+    with pytest.raises(PaperlessTimeoutError, match="free connection"):
+        await transport.get("/api/status/")
+    assert breaker.state is CircuitState.CLOSED
+
+    # a half-open trial ending in a pool timeout gives its slot back
+    httpx_mock.add_response(status_code=502)
+    with pytest.raises(UnexpectedStatusError):
+        await transport.get("/api/status/")
+    breaker._opened_at -= 10
+    httpx_mock.add_exception(httpx.PoolTimeout("pool exhausted"))
+    with pytest.raises(PaperlessTimeoutError):
+        await transport.get("/api/status/")
+    assert breaker.state is CircuitState.HALF_OPEN
+    httpx_mock.add_response(json={})
+    assert await transport.get("/api/status/") == {}
+    assert breaker.state is CircuitState.CLOSED
+    await transport.close()
+
+
+async def test_circuit_open_error_is_not_retried(httpx_mock: HTTPXMock) -> None:
+    """An open breaker ends the retry loop at once."""
+    transport = PaperlessTransport(
+        PAPERLESS_TEST_URL,
+        PAPERLESS_TEST_TOKEN,
+        retry=_FAST_RETRY,
+        circuit_breaker=CircuitBreakerPolicy(failure_threshold=1),
+    )
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+    with pytest.raises(CircuitOpenError):
+        await transport.get("/api/status/")
+    assert len(httpx_mock.get_requests()) == 1
+    assert transport.metrics.retries == 1
+    await transport.close()
+
+
+# ---------------------------------------------------------------------------
+# Hedged requests
+# ---------------------------------------------------------------------------
+
+
+def _answers(*delays: float) -> Any:
+    """Return a pytest-httpx callback answering the n-th request after delays[n]."""
+    calls = iter(enumerate(delays))
+
+    async def callback(_: httpx.Request) -> httpx.Response:
+        number, delay = next(calls)
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json={"answer": number})
+
+    return callback
+
+
+async def test_hedge_wins_over_slow_request(httpx_mock: HTTPXMock) -> None:
+    """A slow request is hedged; the faster hedge wins and the original is cancelled."""
+    transport = PaperlessTransport(
+        PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, hedge=HedgePolicy(delay=0.02), max_concurrency=2
+    )
+    httpx_mock.add_callback(_answers(1.0, 0.0), is_reusable=True)
+
+    assert await transport.get("/api/documents/1/") == {"answer": 1}
+    assert (transport.metrics.hedges, transport.metrics.hedge_wins) == (1, 1)
+    assert transport.metrics.requests == 2
+    await transport.close()
+
+
+async def test_hedge_not_needed_for_fast_request(httpx_mock: HTTPXMock) -> None:
+    """Fast requests, writes and other kinds are never hedged."""
+    transport = PaperlessTransport(
+        PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, hedge=HedgePolicy(delay=0.01)
+    )
+    httpx_mock.add_callback(_delayed_json({}, delay=0.02), is_reusable=True)
+
+    assert await transport.get("/api/documents/1/") is not None
+    await transport.get("/api/documents/", kind=RequestKind.LISTING)
+    await transport.patch("/api/documents/1/", json={})
+    assert transport.metrics.hedges == 1
+    assert transport.metrics.requests == 4
+    await transport.close()
+
+
+async def test_hedge_ignores_failed_request_while_others_pending(httpx_mock: HTTPXMock) -> None:
+    """A failing request does not end a hedged attempt while another one is pending."""
+    transport = PaperlessTransport(
+        PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, hedge=HedgePolicy(delay=0.01, max_hedges=2)
+    )
+    calls = 0
+    message = "Connection reset"
+
+    async def callback(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        number = calls
+        if number == 1:
+            await asyncio.sleep(0.02)
+            raise httpx.ConnectError(message)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"answer": number})
+
+    httpx_mock.add_callback(callback, is_reusable=True)
+    assert await transport.get("/api/documents/1/") == {"answer": 2}
+    assert transport.metrics.hedges == 2
+    await transport.close()
+
+    failing = PaperlessTransport(
+        PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN, hedge=HedgePolicy(delay=1.0)
+    )
+    httpx_mock.add_exception(
+        httpx.ConnectError("Connection refused"), url=f"{PAPERLESS_TEST_URL}/api/tags/1/"
+    )
+    with pytest.raises(PaperlessConnectionError):
+        await failing.get("/api/tags/1/")
+    assert failing.metrics.hedges == 0
+    await failing.close()
+
+
+# ---------------------------------------------------------------------------
+# Replica load balancing
+# ---------------------------------------------------------------------------
+
+REPLICA_URLS = ["http://replica-1.local", "http://replica-2.local", "http://replica-3.local"]
+
+
+def _replica_server(host: str, *, delay: float = 0.0, status: int = 200) -> Any:
+    """Return a pytest-httpx callback standing in for the replica at *host*."""
+
+    async def callback(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay)
+        return httpx.Response(status, json={"host": host, "path": request.url.path})
+
+    return callback
+
+
+async def test_replicas_spread_least_outstanding(httpx_mock: HTTPXMock) -> None:
+    """Requests go to the replica with the fewest in flight, round-robin among equals."""
+    transport = PaperlessTransport(REPLICA_URLS, PAPERLESS_TEST_TOKEN)
+    for url in REPLICA_URLS:
+        httpx_mock.add_callback(
+            _replica_server(url, delay=0.02), url=f"{url}/api/tags/", is_reusable=True
+        )
+
+    results = await asyncio.gather(*(transport.get("/api/tags/") for _ in range(6)))
+    assert sorted(result["host"] for result in results) == sorted(REPLICA_URLS * 2)
+    assert transport.metrics.replica_requests == dict.fromkeys(REPLICA_URLS, 2)
+    assert transport.base_url == REPLICA_URLS[0]
+    assert transport.base_urls == REPLICA_URLS
+    assert all(replica.outstanding == 0 for replica in transport.replicas)
+
+    # sequential requests are balanced, too
+    for _ in range(3):
+        await transport.get("/api/tags/")
+    assert transport.metrics.replica_requests == dict.fromkeys(REPLICA_URLS, 3)
+    await transport.close()
+
+
+async def test_replicas_ewma_prefers_fast_replica(httpx_mock: HTTPXMock) -> None:
+    """With the EWMA strategy, the replica with the lowest latency average wins."""
+    urls = REPLICA_URLS[:2]
+    transport = PaperlessTransport(
+        urls, PAPERLESS_TEST_TOKEN, replicas=ReplicaPolicy(strategy=BalanceStrategy.EWMA)
+    )
+    httpx_mock.add_callback(
+        _replica_server(urls[0], delay=0.05), url=f"{urls[0]}/api/tags/", is_reusable=True
+    )
+    httpx_mock.add_callback(_replica_server(urls[1]), url=f"{urls[1]}/api/tags/", is_reusable=True)
+
+    # one sample per replica, then the fast one takes all requests
+    for _ in range(6):
+        await transport.get("/api/tags/")
+    assert transport.metrics.replica_requests == {urls[0]: 1, urls[1]: 5}
+    assert "latency=" in repr(transport.replicas[0])
+    await transport.close()
+
+
+async def test_replicas_eject_failing_replica(httpx_mock: HTTPXMock) -> None:
+    """A replica failing repeatedly is skipped until its ejection expires."""
+    urls = REPLICA_URLS[:2]
+    transport = PaperlessTransport(
+        urls, PAPERLESS_TEST_TOKEN, replicas=ReplicaPolicy(eject_after=2)
+    )
+    httpx_mock.add_callback(
+        _replica_server(urls[0], status=503), url=f"{urls[0]}/api/tags/", is_reusable=True
+    )
+    httpx_mock.add_callback(_replica_server(urls[1]), url=f"{urls[1]}/api/tags/", is_reusable=True)
+
+    for _ in range(8):
+        await transport.request_raw("get", "/api/tags/")
+    failing = transport.replicas[0]
+    assert failing.ejected
+    assert transport.metrics.replica_requests == {urls[0]: 2, urls[1]: 6}
+    assert transport.metrics.replica_ejections == {urls[0]: 1}
+
+    # after the ejection expired, a single failure ejects it again
+    failing.ejected_until -= 60
+    for _ in range(4):
+        await transport.request_raw("get", "/api/tags/")
+    assert transport.metrics.replica_requests == {urls[0]: 3, urls[1]: 9}
+    assert transport.metrics.replica_ejections == {urls[0]: 2}
+
+    # with every replica ejected, the one returning first is used anyway
+    transport.replicas[1].ejected_until = failing.ejected_until + 1
+    res = await transport.request_raw("get", "/api/tags/")
+    assert res.json()["host"] == urls[0]
+    await transport.close()
+
+
+async def test_replicas_eject_on_connection_errors(httpx_mock: HTTPXMock) -> None:
+    """Connection errors count as replica failures; a success resets the streak."""
+    urls = REPLICA_URLS[:2]
+    transport = PaperlessTransport(
+        urls, PAPERLESS_TEST_TOKEN, replicas=ReplicaPolicy(eject_after=2)
+    )
+    httpx_mock.add_exception(
+        httpx.ConnectError("Connection refused"), url=f"{urls[0]}/api/tags/", is_reusable=True
+    )
+    httpx_mock.add_callback(_replica_server(urls[1]), url=f"{urls[1]}/api/tags/", is_reusable=True)
+
+    with pytest.raises(PaperlessConnectionError):
+        await transport.get("/api/tags/")
+    assert transport.replicas[0].consecutive_failures == 1
+    await transport.get("/api/tags/")
+    assert transport.replicas[1].consecutive_failures == 0
+    with pytest.raises(PaperlessConnectionError):
+        await transport.get("/api/tags/")
+    assert transport.replicas[0].ejected
+    await transport.close()
+
+
+async def test_replicas_pin_absolute_urls(httpx_mock: HTTPXMock) -> None:
+    """Absolute URLs, e.g. pagination links, stay on the replica that issued them."""
+    transport = PaperlessTransport(REPLICA_URLS, PAPERLESS_TEST_TOKEN)
+    next_url = f"{REPLICA_URLS[2]}/api/tags/?page=2"
+    httpx_mock.add_callback(_replica_server(REPLICA_URLS[2]), url=next_url, is_reusable=True)
+    httpx_mock.add_response(url="http://elsewhere.local/api/tags/", json={})
+
+    for _ in range(3):
+        result = await transport.get(next_url)
+        assert result["host"] == REPLICA_URLS[2]
+    assert transport.metrics.replica_requests == {REPLICA_URLS[2]: 3}
+
+    # absolute URLs of unknown hosts are sent as they are
+    assert await transport.get("http://elsewhere.local/api/tags/") == {}
+    assert transport.metrics.replica_requests == {REPLICA_URLS[2]: 3}
+    await transport.close()
+
+
+async def test_replicas_paginate_on_issuing_replica(httpx_mock: HTTPXMock) -> None:
+    """Every page of a listing is requested from the replica of the first page."""
+    client = PaperlessClient(REPLICA_URLS[:2], PAPERLESS_TEST_TOKEN)
+    for url in REPLICA_URLS[:2]:
+        first = {
+            **DATA_TAGS,
+            "next": f"{url}/api/tags/?page=2",
+            "results": DATA_TAGS["results"][:1],
+        }
+        last = {**DATA_TAGS, "next": None, "results": DATA_TAGS["results"][1:2]}
+        httpx_mock.add_response(
+            url=f"{url}/api/tags/?page=1&page_size=150", json=first, is_optional=True
+        )
+        httpx_mock.add_response(url=f"{url}/api/tags/?page=2", json=last, is_optional=True)
+
+    tags = [tag async for tag in client.tags]
+    assert len(tags) == 2
+    assert len(client.metrics.replica_requests) == 1
+    assert sum(client.metrics.replica_requests.values()) == 2
+    await client.close()
+
+
+def test_replicas_from_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replica URLs and the balancing policy can be read from the environment."""
+    monkeypatch.setenv("PYPAPERLESS_URL", json.dumps(REPLICA_URLS[:2]))
+    monkeypatch.setenv("PYPAPERLESS_REPLICAS__STRATEGY", "ewma")
+    client = PaperlessClient.from_env()
+    assert client.base_url == REPLICA_URLS[0]
+    transport = client._runtime.transport
+    assert transport.base_urls == REPLICA_URLS[:2]
+    assert len(transport.replicas) == 2
+
+    single = PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN)
+    assert single.replicas == []
+    with pytest.raises(ValueError, match="base URL"):
+        PaperlessTransport([], PAPERLESS_TEST_TOKEN)
+
+
+# ---------------------------------------------------------------------------
+# Unix domain sockets
+# ---------------------------------------------------------------------------
+
+
+async def _serve_unix_socket(path: str, requests: list[bytes]) -> asyncio.Server:
+    """Start a minimal HTTP server on the Unix socket *path*, recording request heads."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        requests.append(await reader.readuntil(b"\r\n\r\n"))
+        body = json.dumps({"token": "uds-token"}).encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\nConnection: close\r\n\r\n%s" % (len(body), body)
+        )
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_unix_server(handle, path=path)
+
+
+async def test_unix_socket_base_url(tmp_path: Any) -> None:
+    """A unix:// base URL sends requests over the socket, with plain HTTP semantics."""
+    socket_path = str(tmp_path / "paperless.sock")
+    requests: list[bytes] = []
+    server = await _serve_unix_socket(socket_path, requests)
+
+    transport = PaperlessTransport(f"unix://{socket_path}", PAPERLESS_TEST_TOKEN)
+    assert (transport.base_url, transport.uds) == ("http://localhost", socket_path)
+    assert await transport.get("/api/tags/", params={"page": 1}) == {"token": "uds-token"}
+    assert requests[0].startswith(b"GET /api/tags/?page=1 HTTP/1.1")
+    assert b"host: localhost" in requests[0].lower()
+    await transport.close()
+
+    token = await generate_api_token(f"unix://{socket_path}", "user", "secret")
+    assert requests[1].startswith(b"POST /api/token/")
+    assert token == "uds-token"
+    server.close()
+    await server.wait_closed()
+
+
+async def test_unix_socket_probe_cache(tmp_path: Any) -> None:
+    """Probe results are cached per socket, although every socket serves http://localhost."""
+    socket_path = str(tmp_path / "paperless.sock")
+    requests: list[bytes] = []
+    server = await _serve_unix_socket(socket_path, requests)
+    probe = ProbePolicy(mode=ProbeMode.HEAD, cache_file=tmp_path / "probe.json")
+    probe.store("http://localhost unix:/run/other.sock", HostInfo(api_version=3, version="1.0"))
+
+    transport = PaperlessTransport(f"unix://{socket_path}", PAPERLESS_TEST_TOKEN, probe=probe)
+    assert (await transport.probe()).version is None
+    assert len(requests) == 1
+    assert (await transport.probe()).version is None
+    assert len(requests) == 1
+    await transport.close()
+
+    other = PaperlessTransport("unix:///run/other.sock", PAPERLESS_TEST_TOKEN, probe=probe)
+    assert await other.probe() == HostInfo(api_version=3, version="1.0")
+    await other.close()
+    server.close()
+    await server.wait_closed()
+
+
+def test_unix_socket_option() -> None:
+    """The uds option keeps the base URL for the Host header and path prefix."""
+    transport = PaperlessTransport("paperless/prefix", PAPERLESS_TEST_TOKEN, uds="/run/p.sock")
+    assert (transport.base_url, transport.uds) == ("http://paperless/prefix", "/run/p.sock")
+    assert PaperlessTransport(PAPERLESS_TEST_URL, PAPERLESS_TEST_TOKEN).uds is None
+
+    settings = PaperlessSettings(url="localhost", uds="/run/p.sock")
+    client = PaperlessClient.from_config(settings)
+    assert client.base_url == "http://localhost"
+
+    with pytest.raises(ValueError, match="Unix domain socket"):
+        PaperlessTransport(REPLICA_URLS, PAPERLESS_TEST_TOKEN, uds="/run/p.sock")